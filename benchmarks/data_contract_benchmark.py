@@ -0,0 +1,60 @@
+"""Measures the validation time of a data contract with a very wide schema.
+
+Run it from the repository root with `python -m benchmarks.data_contract_benchmark`.
+"""
+
+import argparse
+import timeit
+
+from src.models.constants import OPENMETADATA_SUPPORTED_DATATYPES
+from src.models.data_product_descriptor import DataContract
+
+
+def build_schema(columns: int, invalid_every: int = 0) -> list[dict]:
+    """Builds a schema cycling through the supported data types, in mixed case.
+
+    Every `invalid_every` columns, if set, a column has an invalid data type.
+    """
+    schema = []
+    for i in range(columns):
+        datatype = OPENMETADATA_SUPPORTED_DATATYPES[
+            i % len(OPENMETADATA_SUPPORTED_DATATYPES)
+        ]
+        if i % 3 == 1:
+            datatype = datatype.lower()
+        elif i % 3 == 2:
+            datatype = datatype.capitalize()
+        if invalid_every and i % invalid_every == 0:
+            datatype = "not_a_datatype"
+        schema.append({"name": f"column_{i}", "dataType": datatype})
+    return schema
+
+
+def validate_invalid(schema: list[dict]) -> None:
+    try:
+        DataContract(schema=schema)
+    except ValueError:
+        return
+    raise AssertionError("The data contract should not be valid")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--columns", type=int, default=10_000)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    valid_schema = build_schema(args.columns)
+    invalid_schema = build_schema(args.columns, invalid_every=100)
+    benchmarks = {
+        "valid contract": lambda: DataContract(schema=valid_schema),
+        "invalid contract": lambda: validate_invalid(invalid_schema),
+    }
+    print(f"Columns: {args.columns}")
+    for name, benchmark in benchmarks.items():
+        best = min(timeit.repeat(benchmark, repeat=args.repeat, number=1))
+        print(f"{name}: {best * 1000:.1f} ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,374 @@
+"""In-memory stand-in for the confluent_kafka AdminClient.
+
+It implements the part of the AdminClient API used by the adapter on top of the
+state of a simulated cluster. Like librdkafka, every operation returns futures
+that are completed by a background thread once the simulated broker round trip
+is over, and failures are reported as KafkaException on the futures.
+"""
+
+import concurrent.futures
+import heapq
+import itertools
+import threading
+import time
+from typing import Any, Callable, Iterable
+
+from confluent_kafka import (
+    KafkaError,
+    KafkaException,
+    Node,
+    TopicCollection,
+    TopicPartitionInfo,
+)
+from confluent_kafka.admin import (
+    AclBinding,
+    AclBindingFilter,
+    AclOperation,
+    AclPermissionType,
+    AlterConfigOpType,
+    ClusterMetadata,
+    ConfigEntry,
+    ConfigResource,
+    ConfigSource,
+    DescribeClusterResult,
+    NewPartitions,
+    NewTopic,
+    PartitionMetadata,
+    ResourcePatternType,
+    ResourceType,
+    TopicDescription,
+    TopicMetadata,
+)
+
+DEFAULT_TOPIC_CONFIG = {
+    "cleanup.policy": "delete",
+    "max.message.bytes": "1048588",
+    "retention.ms": "604800000",
+}
+
+
+class _RoundTripScheduler:
+    """Completes futures from a single background thread after a delay."""
+
+    def __init__(self):
+        self._queue: list[tuple[float, int, Callable[[], None]]] = []
+        self._counter = itertools.count()
+        self._condition = threading.Condition()
+        self._thread = threading.Thread(
+            target=self._run, name="fake-admin-client", daemon=True
+        )
+        self._thread.start()
+
+    def schedule(self, delay_s: float, callback: Callable[[], None]) -> None:
+        with self._condition:
+            heapq.heappush(
+                self._queue,
+                (time.monotonic() + delay_s, next(self._counter), callback),
+            )
+            self._condition.notify()
+
+    def _run(self) -> None:
+        while True:
+            with self._condition:
+                while len(self._queue) == 0:
+                    self._condition.wait()
+                due, _, callback = self._queue[0]
+                remaining = due - time.monotonic()
+                if remaining > 0:
+                    self._condition.wait(remaining)
+                    continue
+                heapq.heappop(self._queue)
+            callback()
+
+
+class _Topic:
+    def __init__(self, partitions: int, replication_factor: int, config: dict):
+        self.partitions = partitions
+        self.replication_factor = replication_factor
+        self.config = dict(config)
+
+
+def _kafka_exception(code: int, reason: str) -> KafkaException:
+    return KafkaException(KafkaError(code, reason))
+
+
+def _acl_matches(binding: AclBinding, acl_filter: AclBindingFilter) -> bool:
+    if acl_filter.restype not in (ResourceType.ANY, binding.restype):
+        return False
+    if acl_filter.name is not None and acl_filter.name != binding.name:
+        return False
+    if acl_filter.resource_pattern_type not in (
+        ResourcePatternType.ANY,
+        ResourcePatternType.MATCH,
+        binding.resource_pattern_type,
+    ):
+        return False
+    if acl_filter.principal is not None and acl_filter.principal != binding.principal:
+        return False
+    if acl_filter.host is not None and acl_filter.host != binding.host:
+        return False
+    if acl_filter.operation not in (AclOperation.ANY, binding.operation):
+        return False
+    return acl_filter.permission_type in (
+        AclPermissionType.ANY,
+        binding.permission_type,
+    )
+
+
+class FakeAdminClient:
+    """In-memory AdminClient simulating a cluster of `brokers` brokers.
+
+    Every request takes `latency_s` seconds to complete, the operations are
+    applied to the cluster state when their futures complete. The instance is
+    thread safe and can be shared by concurrent requests, like the real client.
+
+    Args:
+        latency_s (float): Simulated duration of a broker round trip.
+        brokers (int): Number of brokers, i.e. the maximum replication factor.
+    """
+
+    def __init__(self, latency_s: float = 0.0, brokers: int = 3):
+        self.latency_s = latency_s
+        self.brokers = brokers
+        self.topics: dict[str, _Topic] = {}
+        self.acls: set[AclBinding] = set()
+        self.requests: dict[str, int] = {}
+        self._lock = threading.Lock()
+        self._scheduler = _RoundTripScheduler()
+
+    def poll(self, timeout: float | None = None) -> int:
+        return 0
+
+    def list_topics(
+        self, topic: str | None = None, timeout: float = -1
+    ) -> ClusterMetadata:
+        self._count("list_topics")
+        metadata = ClusterMetadata()
+        metadata.cluster_id = "fake-cluster"
+        metadata.controller_id = 0
+        with self._lock:
+            names = list(self.topics) if topic is None else [topic]
+            for name in names:
+                topic_metadata = TopicMetadata()
+                topic_metadata.topic = name
+                metadata.topics[name] = topic_metadata
+                if name not in self.topics:
+                    topic_metadata.error = KafkaError(KafkaError.UNKNOWN_TOPIC_OR_PART)
+                    continue
+                for partition_id in range(self.topics[name].partitions):
+                    partition = PartitionMetadata()
+                    partition.id = partition_id
+                    partition.leader = partition_id % self.brokers
+                    topic_metadata.partitions[partition_id] = partition
+        return metadata
+
+    def describe_cluster(self, **kwargs: Any) -> concurrent.futures.Future:
+        nodes = [Node(i, f"broker-{i}", 9092) for i in range(self.brokers)]
+        return self._submit(
+            "describe_cluster",
+            {None: lambda: DescribeClusterResult(nodes[0], nodes, "fake-cluster")},
+        )[None]
+
+    def describe_topics(
+        self, topics: TopicCollection, **kwargs: Any
+    ) -> dict[str, concurrent.futures.Future]:
+        def describe(name: str) -> TopicDescription:
+            topic = self.topics.get(name)
+            if topic is None:
+                raise _kafka_exception(
+                    KafkaError.UNKNOWN_TOPIC_OR_PART,
+                    "Broker: Unknown topic or partition",
+                )
+            partitions = [
+                TopicPartitionInfo(i, None, [], []) for i in range(topic.partitions)
+            ]
+            return TopicDescription(name, None, False, partitions)
+
+        return self._submit(
+            "describe_topics",
+            {name: _bind(describe, name) for name in topics.topic_names},
+        )
+
+    def create_topics(
+        self, new_topics: list[NewTopic], **kwargs: Any
+    ) -> dict[str, concurrent.futures.Future]:
+        def create(new_topic: NewTopic) -> None:
+            if new_topic.topic in self.topics:
+                raise _kafka_exception(
+                    KafkaError.TOPIC_ALREADY_EXISTS,
+                    f"Topic '{new_topic.topic}' already exists.",
+                )
+            if new_topic.num_partitions < 1:
+                raise _kafka_exception(
+                    KafkaError.INVALID_PARTITIONS,
+                    "Number of partitions must be larger than 0.",
+                )
+            if new_topic.replication_factor > self.brokers:
+                raise _kafka_exception(
+                    KafkaError.INVALID_REPLICATION_FACTOR,
+                    f"Replication factor: {new_topic.replication_factor} larger than "
+                    f"available brokers: {self.brokers}.",
+                )
+            self.topics[new_topic.topic] = _Topic(
+                new_topic.num_partitions,
+                new_topic.replication_factor,
+                new_topic.config,
+            )
+
+        return self._submit(
+            "create_topics", {t.topic: _bind(create, t) for t in new_topics}
+        )
+
+    def create_partitions(
+        self, new_partitions: list[NewPartitions], **kwargs: Any
+    ) -> dict[str, concurrent.futures.Future]:
+        def create(new_partition: NewPartitions) -> None:
+            topic = self._get_topic(new_partition.topic)
+            if new_partition.new_total_count <= topic.partitions:
+                raise _kafka_exception(
+                    KafkaError.INVALID_PARTITIONS,
+                    f"Topic currently has {topic.partitions} partitions, which is "
+                    f"higher than the requested {new_partition.new_total_count}.",
+                )
+            topic.partitions = new_partition.new_total_count
+
+        return self._submit(
+            "create_partitions", {p.topic: _bind(create, p) for p in new_partitions}
+        )
+
+    def delete_topics(
+        self, topics: list[str], **kwargs: Any
+    ) -> dict[str, concurrent.futures.Future]:
+        def delete(name: str) -> None:
+            self._get_topic(name)
+            del self.topics[name]
+
+        return self._submit("delete_topics", {t: _bind(delete, t) for t in topics})
+
+    def describe_configs(
+        self, resources: list[ConfigResource], **kwargs: Any
+    ) -> dict[ConfigResource, concurrent.futures.Future]:
+        def describe(resource: ConfigResource) -> dict[str, ConfigEntry]:
+            topic = self._get_topic(resource.name)
+            config = {**DEFAULT_TOPIC_CONFIG, **topic.config}
+            return {
+                name: ConfigEntry(
+                    name,
+                    value,
+                    source=(
+                        ConfigSource.DYNAMIC_TOPIC_CONFIG
+                        if name in topic.config
+                        else ConfigSource.DEFAULT_CONFIG
+                    ),
+                    is_default=name not in topic.config,
+                )
+                for name, value in config.items()
+            }
+
+        return self._submit(
+            "describe_configs", {r: _bind(describe, r) for r in resources}
+        )
+
+    def alter_configs(
+        self, resources: list[ConfigResource], **kwargs: Any
+    ) -> dict[ConfigResource, concurrent.futures.Future]:
+        def alter(resource: ConfigResource) -> None:
+            # non incremental: the configuration is replaced as a whole
+            self._get_topic(resource.name).config = dict(resource.set_config_dict)
+
+        return self._submit("alter_configs", {r: _bind(alter, r) for r in resources})
+
+    def incremental_alter_configs(
+        self, resources: list[ConfigResource], **kwargs: Any
+    ) -> dict[ConfigResource, concurrent.futures.Future]:
+        def alter(resource: ConfigResource) -> None:
+            topic = self._get_topic(resource.name)
+            for entry in resource.incremental_configs:
+                if entry.incremental_operation == AlterConfigOpType.DELETE:
+                    topic.config.pop(entry.name, None)
+                else:
+                    topic.config[entry.name] = entry.value
+
+        return self._submit(
+            "incremental_alter_configs", {r: _bind(alter, r) for r in resources}
+        )
+
+    def create_acls(
+        self, acls: list[AclBinding], **kwargs: Any
+    ) -> dict[AclBinding, concurrent.futures.Future]:
+        def create(binding: AclBinding) -> None:
+            self.acls.add(binding)
+
+        return self._submit("create_acls", {b: _bind(create, b) for b in acls})
+
+    def describe_acls(
+        self, acl_binding_filter: AclBindingFilter, **kwargs: Any
+    ) -> concurrent.futures.Future:
+        def describe() -> list[AclBinding]:
+            return [b for b in self.acls if _acl_matches(b, acl_binding_filter)]
+
+        return self._submit("describe_acls", {None: describe})[None]
+
+    def delete_acls(
+        self, acl_binding_filters: list[AclBindingFilter], **kwargs: Any
+    ) -> dict[AclBindingFilter, concurrent.futures.Future]:
+        def delete(acl_filter: AclBindingFilter) -> list[AclBinding]:
+            deleted = [b for b in self.acls if _acl_matches(b, acl_filter)]
+            self.acls.difference_update(deleted)
+            return deleted
+
+        return self._submit(
+            "delete_acls", {f: _bind(delete, f) for f in acl_binding_filters}
+        )
+
+    def _get_topic(self, name: str) -> _Topic:
+        topic = self.topics.get(name)
+        if topic is None:
+            raise _kafka_exception(
+                KafkaError.UNKNOWN_TOPIC_OR_PART,
+                "Broker: Unknown topic or partition",
+            )
+        return topic
+
+    def _count(self, operation: str) -> None:
+        with self._lock:
+            self.requests[operation] = self.requests.get(operation, 0) + 1
+
+    def _submit(
+        self, operation: str, operations: dict[Any, Callable[[], Any]]
+    ) -> dict[Any, concurrent.futures.Future]:
+        """Returns a future for each operation, completed after one round trip."""
+        self._count(operation)
+        fs: dict[Any, concurrent.futures.Future] = {
+            key: concurrent.futures.Future() for key in operations
+        }
+        for future in fs.values():
+            future.set_running_or_notify_cancel()
+
+        def complete() -> None:
+            with self._lock:
+                outcomes = _run_all(operations.items())
+            for key, (result, error) in outcomes.items():
+                if error is not None:
+                    fs[key].set_exception(error)
+                else:
+                    fs[key].set_result(result)
+
+        self._scheduler.schedule(self.latency_s, complete)
+        return fs
+
+
+def _bind(function: Callable[[Any], Any], argument: Any) -> Callable[[], Any]:
+    return lambda: function(argument)
+
+
+def _run_all(
+    operations: Iterable[tuple[Any, Callable[[], Any]]]
+) -> dict[Any, tuple[Any, BaseException | None]]:
+    outcomes: dict[Any, tuple[Any, BaseException | None]] = {}
+    for key, operation in operations:
+        try:
+            outcomes[key] = (operation(), None)
+        except KafkaException as ke:
+            outcomes[key] = (None, ke)
+    return outcomes
@@ -0,0 +1,132 @@
+"""Local stand-in for the Confluent Schema Registry REST API.
+
+It implements the subject endpoints used by the adapter with the same status codes,
+error codes and soft/hard deletion rules as the real registry, keeping the schemas
+in memory. It is an ASGI application, so it can be mounted on an httpx transport or
+served over HTTP with `BackgroundServer`.
+"""
+
+import asyncio
+import socket
+import threading
+import time
+
+import uvicorn
+from fastapi import FastAPI, Request
+from fastapi.responses import JSONResponse
+
+SCHEMA_REGISTRY_CONTENT_TYPE = "application/vnd.schemaregistry.v1+json"
+
+
+class _Subject:
+    def __init__(self):
+        self.versions: list[int] = []
+        self.deleted = False
+
+
+class FakeSchemaRegistry:
+    """In-memory state of the registry: schema ids are global and shared by every
+    subject registering the same schema, versions are numbered per subject.
+
+    Args:
+        latency_s (float): Simulated processing time of each request.
+    """
+
+    def __init__(self, latency_s: float = 0.0):
+        self.latency_s = latency_s
+        self.schemas: dict[tuple[str, str], int] = {}
+        self.subjects: dict[str, _Subject] = {}
+        self.requests = 0
+        self.app = self._build_app()
+
+    def _build_app(self) -> FastAPI:
+        app = FastAPI(openapi_url=None)
+
+        @app.post("/subjects/{subject}/versions")
+        async def register(subject: str, request: Request) -> JSONResponse:
+            await self._round_trip()
+            body = await request.json()
+            schema = body.get("schema")
+            if not isinstance(schema, str) or len(schema) == 0:
+                return _error(422, 42201, "Either the input schema or one of its references is invalid")  # noqa: E501
+            key = (body.get("schemaType", "AVRO"), schema)
+            schema_id = self.schemas.setdefault(key, len(self.schemas) + 1)
+            state = self.subjects.get(subject)
+            if state is None or state.deleted:
+                state = _Subject()
+                self.subjects[subject] = state
+            if schema_id not in state.versions:
+                state.versions.append(schema_id)
+            return _response({"id": schema_id})
+
+        @app.delete("/subjects/{subject}")
+        async def delete(subject: str, permanent: bool = False) -> JSONResponse:
+            await self._round_trip()
+            state = self.subjects.get(subject)
+            if state is None:
+                return _error(404, 40401, f"Subject '{subject}' not found.")
+            if permanent:
+                if not state.deleted:
+                    return _error(404, 40405, f"Subject '{subject}' was not deleted first before being permanently deleted")  # noqa: E501
+                del self.subjects[subject]
+            elif state.deleted:
+                return _error(404, 40404, f"Subject '{subject}' was soft deleted.Set permanent=true to delete permanently")  # noqa: E501
+            state.deleted = True
+            return _response(list(range(1, len(state.versions) + 1)))
+
+        return app
+
+    async def _round_trip(self) -> None:
+        self.requests += 1
+        if self.latency_s > 0:
+            await asyncio.sleep(self.latency_s)
+
+
+def _response(content: object) -> JSONResponse:
+    return JSONResponse(content, media_type=SCHEMA_REGISTRY_CONTENT_TYPE)
+
+
+def _error(status_code: int, error_code: int, message: str) -> JSONResponse:
+    return JSONResponse(
+        {"error_code": error_code, "message": message},
+        status_code=status_code,
+        media_type=SCHEMA_REGISTRY_CONTENT_TYPE,
+    )
+
+
+class BackgroundServer:
+    """Serves an ASGI application on a free localhost port from a daemon thread."""
+
+    def __init__(self, app: FastAPI):
+        # asyncio only disables Nagle's algorithm on sockets created with an explicit
+        # TCP protocol, otherwise every response waits for a delayed ACK
+        self._socket = socket.socket(
+            socket.AF_INET, socket.SOCK_STREAM, socket.IPPROTO_TCP
+        )
+        self._socket.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
+        self._socket.bind(("127.0.0.1", 0))
+        host, port = self._socket.getsockname()
+        self.url = f"http://{host}:{port}"
+        self._server = uvicorn.Server(
+            uvicorn.Config(app, log_level="warning", lifespan="off")
+        )
+        self._thread = threading.Thread(
+            target=self._server.run,
+            kwargs={"sockets": [self._socket]},
+            name="fake-schema-registry",
+            daemon=True,
+        )
+
+    def __enter__(self) -> "BackgroundServer":
+        self._thread.start()
+        while not self._server.started:
+            if not self._thread.is_alive():
+                raise RuntimeError("The fake Schema Registry failed to start")
+            time.sleep(0.01)
+        return self
+
+    def __exit__(self, *args: object) -> None:
+        self._server.should_exit = True
+        self._thread.join()
+        self._socket.close()
+
@@ -0,0 +1,270 @@
+"""Measures the throughput and the latency of the provisioning endpoints.
+
+The adapter runs in process against an in-memory Kafka cluster (`FakeAdminClient`)
+and a Schema Registry stand-in served over HTTP on localhost, so no cluster is
+needed. Each scenario sends `--requests` requests, `--concurrency` at a time, each
+one for a different topic. The results are compared with the stored baselines.
+
+Run it from the repository root with `python -m benchmarks.provisioning_benchmark`.
+"""
+
+import argparse
+import asyncio
+import gc
+import json
+import os
+import statistics
+import sys
+import time
+from pathlib import Path
+from typing import Any
+
+import httpx
+
+from benchmarks.fake_admin_client import FakeAdminClient
+from benchmarks.fake_schema_registry import BackgroundServer, FakeSchemaRegistry
+from src.services.client_registry import ClientRegistry
+
+DESCRIPTOR_PATH = Path("tests/descriptors/descriptor_valid.yaml")
+DESCRIPTOR_TOPIC = "healthcare_vaccinations_0_kafka-output-port_development"
+BASELINES_PATH = Path("benchmarks/baselines/provisioning_benchmark.json")
+SCENARIOS = ["provision", "updateacl", "unprovision"]
+PERCENTILES = [50, 95, 99]
+
+
+class FakeClientRegistry(ClientRegistry):
+    """Client registry handing out the in-memory admin client.
+
+    The Schema Registry clients are the real ones, connected to the stand-in.
+    """
+
+    def __init__(self, admin_client: FakeAdminClient):
+        super().__init__()
+        self._fake_admin_client = admin_client
+
+    def get_admin_client(self, config: dict[str, Any]) -> Any:
+        return self._fake_admin_client
+
+
+class ScenarioResult:
+    def __init__(
+        self, name: str, latencies: list[float], errors: int, elapsed_s: float
+    ):
+        self.name = name
+        self.latencies = latencies
+        self.errors = errors
+        self.elapsed_s = elapsed_s
+
+    @property
+    def throughput(self) -> float:
+        return len(self.latencies) / self.elapsed_s
+
+    def percentile_ms(self, percentile: int) -> float:
+        if len(self.latencies) == 1:
+            return self.latencies[0] * 1000
+        cut_points = statistics.quantiles(self.latencies, n=100, method="inclusive")
+        return cut_points[percentile - 1] * 1000
+
+    def to_dict(self) -> dict[str, float]:
+        result = {"throughput": round(self.throughput, 1)}
+        for percentile in PERCENTILES:
+            result[f"p{percentile}_ms"] = round(self.percentile_ms(percentile), 2)
+        return result
+
+
+def build_requests(
+    scenario: str, count: int, topic_prefix: str = "benchmark_topic"
+) -> tuple[str, list[dict]]:
+    """Returns the path and the bodies of the requests of a scenario."""
+    template = DESCRIPTOR_PATH.read_text()
+    descriptors = [
+        template.replace(DESCRIPTOR_TOPIC, f"{topic_prefix}_{i}") for i in range(count)
+    ]
+    if scenario == "updateacl":
+        return "/v1/updateacl", [
+            {
+                "refs": ["user:alice", "user:bob"],
+                "provisionInfo": {"request": descriptor, "result": ""},
+            }
+            for descriptor in descriptors
+        ]
+    return f"/v1/{scenario}", [
+        {
+            "descriptorKind": "COMPONENT_DESCRIPTOR",
+            "descriptor": descriptor,
+            "removeData": True,
+        }
+        for descriptor in descriptors
+    ]
+
+
+async def run_scenario(
+    client: httpx.AsyncClient,
+    scenario: str,
+    count: int,
+    concurrency: int,
+    topic_prefix: str = "benchmark_topic",
+) -> ScenarioResult:
+    path, bodies = build_requests(scenario, count, topic_prefix)
+    queue: asyncio.Queue[dict] = asyncio.Queue()
+    for body in bodies:
+        queue.put_nowait(body)
+    latencies: list[float] = []
+    failures: list[str] = []
+
+    async def worker() -> None:
+        while not queue.empty():
+            body = queue.get_nowait()
+            start = time.perf_counter()
+            response = await client.post(path, json=body)
+            latencies.append(time.perf_counter() - start)
+            if response.status_code != 200:
+                failures.append(f"{response.status_code} {response.text}")
+
+    start = time.perf_counter()
+    await asyncio.gather(*(worker() for _ in range(concurrency)))
+    elapsed_s = time.perf_counter() - start
+    if len(failures) > 0:
+        print(f"{scenario}: {len(failures)} failed requests, e.g. {failures[0]}")
+    return ScenarioResult(scenario, latencies, len(failures), elapsed_s)
+
+
+async def run(args: argparse.Namespace, registry_url: str) -> list[ScenarioResult]:
+    os.environ["KAFKA_ADMIN_CLIENT_CONFIG"] = "{}"
+    os.environ["KAFKA_SCHEMA_REGISTRY_CLIENT_CONFIG"] = json.dumps(
+        {"url": registry_url}
+    )
+    os.environ["ASYNC_PROVISIONING_ENABLED"] = "false"
+    os.environ.setdefault("LOG_LEVEL", "WARNING")
+    # the application reads its settings on import
+    from src.main import app
+
+    admin_client = FakeAdminClient(latency_s=args.broker_latency_ms / 1000)
+    results = []
+    async with app.router.lifespan_context(app):
+        await app.state.client_registry.close()
+        app.state.client_registry = FakeClientRegistry(admin_client)
+        transport = httpx.ASGITransport(app=app)
+        async with httpx.AsyncClient(
+            transport=transport, base_url="http://adapter", timeout=None
+        ) as client:
+            for scenario in args.scenarios:
+                await run_scenario(
+                    client, scenario, args.warmup, args.concurrency, "warmup_topic"
+                )
+            for scenario in args.scenarios:
+                gc.collect()
+                results.append(
+                    await run_scenario(
+                        client, scenario, args.requests, args.concurrency
+                    )
+                )
+    return results
+
+
+def compare(
+    results: list[ScenarioResult], baselines: dict[str, Any], tolerance: float
+) -> list[str]:
+    """Prints each result next to its baseline and returns the regressions."""
+    regressions = []
+    print(f"{'scenario':<12}{'req/s':>10}{'p50 ms':>10}{'p95 ms':>10}{'p99 ms':>10}")
+    for result in results:
+        current = result.to_dict()
+        print(
+            f"{result.name:<12}"
+            + "".join(f"{value:>10.1f}" for value in current.values())
+        )
+        baseline = baselines.get(result.name)
+        if baseline is None:
+            continue
+        deltas = []
+        for metric, value in current.items():
+            change = (value - baseline[metric]) / baseline[metric]
+            deltas.append(f"{change:>+10.0%}")
+            # a lower throughput or a higher latency is a regression
+            worse = -change if metric == "throughput" else change
+            if worse > tolerance:
+                regressions.append(
+                    f"{result.name} {metric}: {value} vs {baseline[metric]}"
+                )
+        print(f"{'  baseline':<12}" + "".join(deltas))
+    return regressions
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--requests", type=int, default=500)
+    parser.add_argument("--concurrency", type=int, default=16)
+    parser.add_argument(
+        "--warmup",
+        type=int,
+        default=50,
+        help="requests of each scenario sent before measuring",
+    )
+    parser.add_argument(
+        "--broker-latency-ms",
+        type=float,
+        default=5.0,
+        help="duration of each simulated broker round trip",
+    )
+    parser.add_argument(
+        "--registry-latency-ms",
+        type=float,
+        default=5.0,
+        help="processing time of each Schema Registry request",
+    )
+    parser.add_argument("--scenarios", nargs="+", choices=SCENARIOS, default=SCENARIOS)
+    parser.add_argument("--baselines", type=Path, default=BASELINES_PATH)
+    parser.add_argument(
+        "--tolerance",
+        type=float,
+        default=0.2,
+        help="relative change against the baselines reported as a regression",
+    )
+    parser.add_argument(
+        "--check",
+        action="store_true",
+        help="exit with an error if a regression is found",
+    )
+    parser.add_argument(
+        "--save-baselines",
+        action="store_true",
+        help="store the results as the new baselines",
+    )
+    args = parser.parse_args()
+
+    parameters = {
+        "requests": args.requests,
+        "concurrency": args.concurrency,
+        "broker_latency_ms": args.broker_latency_ms,
+        "registry_latency_ms": args.registry_latency_ms,
+    }
+    registry = FakeSchemaRegistry(latency_s=args.registry_latency_ms / 1000)
+    with BackgroundServer(registry.app) as server:
+        results = asyncio.run(run(args, server.url))
+
+    stored = json.loads(args.baselines.read_text()) if args.baselines.exists() else {}
+    baselines = stored.get("results", {})
+    if len(baselines) > 0 and stored.get("parameters") != parameters:
+        print(f"Baselines measured with different parameters: {stored['parameters']}")
+        baselines = {}
+    print(", ".join(f"{k}: {v}" for k, v in parameters.items()))
+    regressions = compare(results, baselines, args.tolerance)
+
+    if args.save_baselines:
+        args.baselines.parent.mkdir(parents=True, exist_ok=True)
+        stored_results = {} if stored.get("parameters") != parameters else baselines
+        stored_results.update({r.name: r.to_dict() for r in results})
+        args.baselines.write_text(
+            json.dumps({"parameters": parameters, "results": stored_results}, indent=2)
+            + "\n"
+        )
+        print(f"Baselines saved to {args.baselines}")
+    if len(regressions) > 0:
+        print("Regressions: " + "; ".join(regressions))
+        if args.check:
+            sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
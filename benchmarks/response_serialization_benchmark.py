@@ -0,0 +1,89 @@
+"""Compares the serialization time of large API responses with each JSON backend.
+
+Run it from the repository root with
+`python -m benchmarks.response_serialization_benchmark`.
+"""
+
+import argparse
+import json
+import timeit
+from typing import Callable
+
+from fastapi.encoders import jsonable_encoder
+from pydantic import BaseModel
+
+from src.models.api_models import Info, ProvisioningStatus, Status1, ValidationError
+from src.utility.json_serialization import JsonBackend, serializer
+
+
+def build_provisioning_status(entries: int) -> ProvisioningStatus:
+    public_info = {
+        f"field_{i}": {
+            "type": "string",
+            "label": f"Field {i}",
+            "value": f"healthcare_vaccinations_0_kafka-output-port_{i}",
+            "href": f"https://example.com/topics/{i}",
+        }
+        for i in range(entries)
+    }
+    return ProvisioningStatus(
+        status=Status1.COMPLETED,
+        result="",
+        info=Info(publicInfo=public_info, privateInfo={}),
+    )
+
+
+def build_validation_error(errors: int) -> ValidationError:
+    return ValidationError(
+        errors=[
+            f'Column "column_{i}" specifies dataType of "type_{i}" but this is '
+            "not a valid OpenMetadata data type"
+            for i in range(errors)
+        ]
+    )
+
+
+def jsonable_encoder_dumps(response: BaseModel) -> bytes:
+    return json.dumps(jsonable_encoder(response)).encode("utf-8")
+
+
+def bind(
+    serialize: Callable[[BaseModel], bytes], response: BaseModel
+) -> Callable[[], bytes]:
+    """Returns a function serializing `response` with `serialize`."""
+
+    def run() -> bytes:
+        return serialize(response)
+
+    return run
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--entries", type=int, default=5000)
+    parser.add_argument("--errors", type=int, default=500)
+    parser.add_argument("--number", type=int, default=20)
+    args = parser.parse_args()
+
+    responses = {
+        f"ProvisioningStatus ({args.entries} publicInfo entries)": (
+            build_provisioning_status(args.entries)
+        ),
+        f"ValidationError ({args.errors} errors)": build_validation_error(args.errors),
+    }
+    for name, response in responses.items():
+        print(name)
+        candidates: dict[str, Callable[[], bytes]] = {
+            "json.dumps(jsonable_encoder())": bind(jsonable_encoder_dumps, response),
+            **{
+                f"{backend} backend": bind(serializer(backend), response)
+                for backend in JsonBackend
+            },
+        }
+        for candidate, serialize in candidates.items():
+            best = min(timeit.repeat(serialize, repeat=5, number=args.number))
+            print(f"  {candidate}: {best / args.number * 1000:.2f} ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,56 @@
+"""Compares the parse time of a large descriptor with the available YAML loaders.
+
+Run it from the repository root with `python -m benchmarks.yaml_loader_benchmark`.
+"""
+
+import argparse
+import timeit
+from pathlib import Path
+from typing import Any
+
+import yaml
+
+from src.utility.yaml_loader import SafeLoader
+
+DESCRIPTOR_PATH = Path("tests/descriptors/descriptor_valid.yaml")
+
+
+def build_descriptor(target_bytes: int) -> str:
+    """Replicates the components of the sample descriptor up to `target_bytes`."""
+    descriptor = yaml.safe_load(DESCRIPTOR_PATH.read_text())
+    components = descriptor["dataProduct"]["components"]
+    replicated: list[dict[str, Any]] = []
+    while len(yaml.safe_dump(replicated)) < target_bytes:
+        for component in components:
+            copy = dict(component)
+            copy["id"] = f"{component['id']}-{len(replicated)}"
+            replicated.append(copy)
+    descriptor["dataProduct"]["components"] = components + replicated
+    return yaml.safe_dump(descriptor)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--size-kb", type=int, default=300)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    document = build_descriptor(args.size_kb * 1024)
+    print(f"Descriptor size: {len(document) / 1024:.0f} KB")
+    loaders: dict[str, type[yaml.SafeLoader]] = {
+        "SafeLoader": yaml.SafeLoader,
+        "load_yaml": SafeLoader,
+    }
+    for name, loader in loaders.items():
+        best = min(
+            timeit.repeat(
+                lambda: yaml.load(document, Loader=loader),
+                repeat=args.repeat,
+                number=1,
+            )
+        )
+        print(f"{name} ({loader.__name__}): {best * 1000:.1f} ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -1,7 +1,60 @@
+import functools
+from contextlib import asynccontextmanager
+from typing import AsyncIterator
+
 from fastapi import FastAPI
 
+from src.services.client_registry import ClientRegistry
+from src.services.in_memory_operation_journal import InMemoryOperationJournal
+from src.services.operation_journal import OperationJournal
+from src.services.provisioning_worker_pool import ProvisioningWorkerPool
+from src.services.sqlite_operation_journal import SqliteOperationJournal
+from src.services.validation_service import validate_descriptor
+from src.services.validation_worker_pool import ValidationWorkerPool
+from src.settings.async_provisioning_settings import AsyncProvisioningSettings
+from src.settings.validation_settings import ValidationSettings
+
+
+@asynccontextmanager
+async def lifespan(application: FastAPI) -> AsyncIterator[None]:
+    application.state.client_registry = ClientRegistry()
+    async_provisioning_settings = AsyncProvisioningSettings()
+    journal: OperationJournal | None = None
+    application.state.provisioning_worker_pool = None
+    if async_provisioning_settings.enabled:
+        journal = (
+            SqliteOperationJournal(
+                async_provisioning_settings.journal_path,
+                async_provisioning_settings.status_ttl_s,
+                async_provisioning_settings.journal_lease_s,
+            )
+            if async_provisioning_settings.journal_path is not None
+            else InMemoryOperationJournal(async_provisioning_settings.status_ttl_s)
+        )
+        application.state.provisioning_worker_pool = ProvisioningWorkerPool(
+            max_workers=async_provisioning_settings.max_workers,
+            max_pending=async_provisioning_settings.max_pending,
+            journal=journal,
+        )
+    validation_settings = ValidationSettings()
+    application.state.validation_worker_pool = ValidationWorkerPool(
+        functools.partial(validate_descriptor, strict=validation_settings.strict),
+        max_workers=validation_settings.max_workers,
+        max_results=validation_settings.max_results,
+        max_pending=validation_settings.max_pending,
+    )
+    yield
+    application.state.validation_worker_pool.shutdown()
+    if application.state.provisioning_worker_pool is not None:
+        await application.state.provisioning_worker_pool.stop()
+    if journal is not None:
+        journal.close()
+    await application.state.client_registry.close()
+
+
 app = FastAPI(
     title="Confluent Kafka Tech Adapter",
     description="Tech Adapter for Confluent Kafka",  # noqa: E501
     version="2.2.0",
+    lifespan=lifespan,
 )
@@ -1,19 +1,104 @@
+import contextvars
+import functools
 import inspect
-import json
-from typing import Any
+from typing import Any, Callable, TypeVar
 
 from fastapi import FastAPI
-from fastapi.encoders import jsonable_encoder
 from fastapi.routing import APIRoute
 from pydantic import BaseModel
 from starlette.responses import Response
 
 from src.app_config import app
 from src.models.api_models import SystemErr
+from src.settings.response_settings import ResponseSettings
+from src.utility.json_serialization import serializer
 from src.utility.logger import get_logger
 
 logger = get_logger()
 
+F = TypeVar("F", bound=Callable[..., Any])
+
+# name of the endpoint being executed, set by `checked_endpoint`
+_current_endpoint: contextvars.ContextVar[str | None] = contextvars.ContextVar(
+    "current_endpoint", default=None
+)
+
+
+@functools.lru_cache
+def get_response_serializer() -> Callable[[BaseModel | list[BaseModel]], bytes]:
+    return serializer(ResponseSettings().json_backend)
+
+
+class RouteResponseIndex:
+    """
+    Index of the response status codes of the routes of an application, by route name
+    and by route path, each mapping the type of a response model to its status code.
+    """
+
+    def __init__(self, application: FastAPI):
+        self.by_name: dict[str, dict[type, int]] = {}
+        self.by_path: dict[str, dict[type, int]] = {}
+        self.routes_count = len(application.routes)
+        for route in application.routes:
+            if isinstance(route, APIRoute):
+                codes = _response_codes_by_type(route.responses)
+                self.by_name.setdefault(route.name, codes)
+                self.by_path.setdefault(route.path, codes)
+
+
+def get_route_response_index(application: FastAPI) -> RouteResponseIndex:
+    """
+    Returns the route response index of the application, building it on first use and
+    rebuilding it if routes were registered in the meantime.
+    """
+    index = getattr(application.state, "route_response_index", None)
+    if index is None or index.routes_count != len(application.routes):
+        index = RouteResponseIndex(application)
+        application.state.route_response_index = index
+    return index
+
+
+def checked_endpoint(endpoint: F) -> F:
+    """
+    Decorator letting `check_response` find the responses of the decorated endpoint
+    by name, without inspecting the call stack.
+
+    Example:
+        >>> @app.post("/v1/validate", responses={"200": {"model": ValidationResult}})
+        ... @checked_endpoint
+        ... def validate(...) -> Response:
+        ...     return check_response(out_response=ValidationResult(valid=True))
+    """  # noqa: E501
+    if inspect.iscoroutinefunction(endpoint):
+
+        @functools.wraps(endpoint)
+        async def async_wrapper(*args, **kwargs):
+            token = _current_endpoint.set(endpoint.__name__)
+            try:
+                return await endpoint(*args, **kwargs)
+            finally:
+                _current_endpoint.reset(token)
+
+        # annotations are resolved in the module of the endpoint, as FastAPI would
+        # otherwise resolve them in this module
+        async_wrapper.__signature__ = inspect.signature(  # type: ignore[attr-defined]
+            endpoint, eval_str=True
+        )
+        return async_wrapper  # type: ignore[return-value]
+
+    @functools.wraps(endpoint)
+    def wrapper(*args, **kwargs):
+        token = _current_endpoint.set(endpoint.__name__)
+        try:
+            return endpoint(*args, **kwargs)
+        finally:
+            _current_endpoint.reset(token)
+
+    wrapper.__signature__ = inspect.signature(  # type: ignore[attr-defined]
+        endpoint, eval_str=True
+    )
+    return wrapper  # type: ignore[return-value]
+
 
 def check_response(
     out_response: Any,
@@ -47,45 +132,26 @@ def check_response(
     if responses is not None:
         return _check_response_type(responses, out_response)
 
+    index = get_route_response_index(application)
     if route_path is not None:
-        endpoint = _find_caller_endpoint_by_path(
-            application=application, caller_path=route_path
-        )
+        codes = index.by_path.get(route_path)
 
     else:
-        caller_function = _find_caller_function()
+        caller_function = _current_endpoint.get() or _find_caller_function()
 
         if caller_function is None:
             logger.error("Check_responses: caller function not found")
-            return Response(
-                status_code=500,
-                content=SystemErr(
-                    error="An unexpected error occurred while processing the request. "
-                    "If the issue still persists, contact the platform team for assistance!"  # noqa: E501
-                ).model_dump_json(),
-                media_type="application/json",
-            )
-
-        endpoint = _find_caller_endpoint_by_name(
-            application=application, caller_name=caller_function
-        )
+            return _unexpected_error_response()
 
-    responses = endpoint.responses if endpoint is not None else None
+        codes = index.by_name.get(caller_function)
 
-    if responses is None:
+    if codes is None:
         logger.error(
             "Check_responses: endpoint not found in app.routes or responses parameter has no value "  # noqa: E501
         )
-        return Response(
-            status_code=500,
-            content=SystemErr(
-                error="An unexpected error occurred while processing the request. "
-                "If the issue still persists, contact the platform team for assistance!"  # noqa: E501
-            ).model_dump_json(),
-            media_type="application/json",
-        )
+        return _unexpected_error_response()
 
-    return _check_response_type(responses, out_response)
+    return _build_response(codes, out_response)
 
 
 def _check_response_type(responses: dict, out_response: Any) -> Response:
@@ -105,43 +171,50 @@ def _check_response_type(responses: dict, out_response: Any) -> Response:
         it returns a Response containing a SystemErr.
     """  # noqa: E501
 
-    # set default response_code = 500, if correct response type is found it will be changed  # noqa: E501
-    response_code = 500
-    correct_output_type = False
-    for k in responses.keys():
-        endpoint_response = responses.get(k)
-        if isinstance(endpoint_response, dict) and endpoint_response is not None:
-            if endpoint_response.get("model") == type(out_response):
-                correct_output_type = True
-                response_code = k
-                break
-
-    if not correct_output_type:
-        logger.error("Check response type: response type indicated not allowed")
-        return Response(
-            status_code=500,
-            content=SystemErr(
-                error="An unexpected error occurred while processing the request. "
-                "If the issue still persists, contact the platform team for assistance!"  # noqa: E501
-            ).model_dump_json(),
-            media_type="application/json",
-        )
+    return _build_response(_response_codes_by_type(responses), out_response)
 
-    if isinstance(out_response, BaseModel):
-        content = json.dumps(jsonable_encoder(out_response))
-        media_type = "application/json"
-    elif isinstance(out_response, list) and all(
-        isinstance(item, BaseModel) for item in out_response
-    ):  # noqa: E501
-        out_response_dicts = [item.dict() for item in out_response]
-        content = json.dumps(out_response_dicts)
+
+def _response_codes_by_type(responses: dict) -> dict[type, int]:
+    """
+    Maps the model of each response in 'responses' to its status code; when several
+    responses share a model, the first one wins.
+    """
+    codes: dict[type, int] = {}
+    for k, endpoint_response in responses.items():
+        if isinstance(endpoint_response, dict) and "model" in endpoint_response:
+            codes.setdefault(endpoint_response["model"], int(k))
+    return codes
+
+
+def _build_response(codes: dict[type, int], out_response: Any) -> Response:
+    response_code = codes.get(type(out_response))
+
+    if response_code is None:
+        logger.error("Check response type: response type indicated not allowed")
+        return _unexpected_error_response()
+
+    content: bytes | str
+    if isinstance(out_response, BaseModel) or (
+        isinstance(out_response, list)
+        and all(isinstance(item, BaseModel) for item in out_response)
+    ):
+        content = get_response_serializer()(out_response)
         media_type = "application/json"
     else:
         content = str(out_response)
         media_type = "text/plain"
 
+    return Response(status_code=response_code, content=content, media_type=media_type)
+
+
+def _unexpected_error_response() -> Response:
     return Response(
-        status_code=int(response_code), content=content, media_type=media_type
+        status_code=500,
+        content=SystemErr(
+            error="An unexpected error occurred while processing the request. "
+            "If the issue still persists, contact the platform team for assistance!"  # noqa: E501
+        ).model_dump_json(),
+        media_type="application/json",
     )
 
 
@@ -173,57 +246,3 @@ def _find_caller_function(n_back: int = 2) -> str | None:
 
     caller_function = frame.f_code.co_name if frame is not None else None
     return caller_function
-
-
-def _find_caller_endpoint_by_path(
-    application: FastAPI, caller_path: str
-) -> APIRoute | None:
-    """
-    Find and return the FastAPI endpoint (APIRoute) based on the provided caller_path.
-
-    This function iterates through all registered routes in the FastAPI application and searches for an APIRoute
-    that matches the caller_path argument.
-    If a match is found, the corresponding APIRoute object is returned. If no match is found, the function returns None.
-
-    Args:
-        application (FastAPI): The FastAPI application instance to search for the endpoint.
-        caller_path (str): The path of the route to search for.
-
-    Returns:
-        APIRoute or None: If a matching route is found, it returns the corresponding APIRoute object.
-        If no matching route is found, it returns None.
-
-    """  # noqa: E501
-
-    for route in application.routes:
-        if isinstance(route, APIRoute) and route.path == caller_path:
-            return route
-
-    return None
-
-
-def _find_caller_endpoint_by_name(
-    application: FastAPI, caller_name: str
-) -> APIRoute | None:
-    """
-    Find and return the FastAPI endpoint (APIRoute) based on the provided caller_name.
-
-    This function iterates through all registered routes in the FastAPI application and searches for an APIRoute
-    that matches the caller_name argument.
-    If a match is found, the corresponding APIRoute object is returned. If no match is found, the function returns None.
-
-    Args:
-        application (FastAPI): The FastAPI application instance to search for the endpoint.
-        caller_name (str): The name of the route to search for.
-
-    Returns:
-        APIRoute or None: If a matching route is found, it returns the corresponding APIRoute object.
-        If no matching route is found, it returns None.
-
-    """  # noqa: E501
-
-    for route in application.routes:
-        if isinstance(route, APIRoute) and route.name == caller_name:
-            return route
-
-    return None
@@ -1,8 +1,7 @@
 from functools import lru_cache
 from typing import Annotated, Tuple
 
-import yaml
-from fastapi import Depends
+from fastapi import Depends, Request
 
 from src.models.api_models import (
     DescriptorKind,
@@ -10,23 +9,47 @@ from src.models.api_models import (
     UpdateAclRequest,
     ValidationError,
 )
-from src.models.data_product_descriptor import DataProduct
+from src.models.data_product_descriptor import LAZY_COMPONENTS, DataProduct
 from src.services.acl_service import AclService
+from src.services.client_registry import ClientRegistry
 from src.services.kafka_client_service import KafkaClientService
 from src.services.principal_mapping_service import PrincipalMappingService
 from src.services.provision_service import ProvisionService
+from src.services.provisioning_worker_pool import ProvisioningWorkerPool
 from src.services.sasl_plain_principal_mapping_service import (
     SaslPlainPrincipalMappingService,
 )
 from src.services.schema_registry_service import SchemaRegistryService
+from src.services.topic_metadata_cache import TopicMetadataCache
 from src.services.update_acl_service import UpdateAclService
+from src.services.validation_worker_pool import ValidationWorkerPool
 from src.settings.kafka_settings import KafkaSettings
+from src.settings.validation_settings import ValidationSettings
+from src.utility.descriptor_cache import DescriptorCache
 from src.utility.logger import get_logger
 from src.utility.parsing_pydantic_models import parse_yaml_with_model
+from src.utility.yaml_loader import load_yaml
 
 logger = get_logger()
 
 
+@lru_cache
+def get_validation_settings() -> ValidationSettings:
+    return ValidationSettings()
+
+
+ValidationSettingsDep = Annotated[ValidationSettings, Depends(get_validation_settings)]
+
+
+@lru_cache
+def get_descriptor_cache() -> DescriptorCache:
+    validation_settings = get_validation_settings()
+    return DescriptorCache(
+        validation_settings.descriptor_cache_max_bytes,
+        validation_settings.descriptor_cache_retained_size_factor,
+    )
+
+
 async def unpack_provisioning_request(
     provisioning_request: ProvisioningRequest,
 ) -> Tuple[DataProduct, str] | ValidationError:
@@ -59,10 +82,29 @@ async def unpack_provisioning_request(
             f"platform team."
         )
         return ValidationError(errors=[error])
+    return parse_component_descriptor(provisioning_request.descriptor)
+
+
+def parse_component_descriptor(
+    descriptor: str,
+) -> Tuple[DataProduct, str] | ValidationError:
+    """
+    Parses a component descriptor into the data product and the component ID to provision.
+
+    Args:
+        descriptor (str): The YAML component descriptor.
+
+    Returns:
+        Union[Tuple[DataProduct, str], ValidationError]:
+            - If successful, returns a tuple containing the `DataProduct` and the component ID to provision.
+            - If unsuccessful, returns a `ValidationError` object with error details.
+    """  # noqa: E501
     try:
-        descriptor_dict = yaml.safe_load(provisioning_request.descriptor)
+        descriptor_dict = load_yaml(descriptor)
         data_product = parse_yaml_with_model(
-            descriptor_dict.get("dataProduct"), DataProduct
+            descriptor_dict.get("dataProduct"),
+            DataProduct,
+            context={LAZY_COMPONENTS: True},
         )
         component_to_provision = descriptor_dict.get("componentIdToProvision")
 
@@ -162,11 +204,18 @@ async def unpack_update_acl_request(
 
     """  # noqa: E501
 
+    descriptor = update_acl_request.provisionInfo.request
+    cached = get_descriptor_cache().get(descriptor)
+    if cached is not None:
+        return cached.data_product, cached.component_id, update_acl_request.refs
     try:
-        request = yaml.safe_load(update_acl_request.provisionInfo.request)
-        data_product = parse_yaml_with_model(request.get("dataProduct"), DataProduct)
+        request = load_yaml(descriptor)
+        data_product = parse_yaml_with_model(
+            request.get("dataProduct"), DataProduct, context={LAZY_COMPONENTS: True}
+        )
         component_to_provision = request.get("componentIdToProvision")
         if isinstance(data_product, DataProduct):
+            get_descriptor_cache().put(descriptor, data_product, component_to_provision)
             return (
                 data_product,
                 component_to_provision,
@@ -195,10 +244,46 @@ def get_kafka_settings() -> KafkaSettings:
     return KafkaSettings()
 
 
+@lru_cache
+def get_topic_metadata_cache() -> TopicMetadataCache:
+    return TopicMetadataCache(get_kafka_settings().topic_metadata_cache_ttl_s)
+
+
+def get_client_registry(request: Request) -> ClientRegistry:
+    return request.app.state.client_registry
+
+
+def get_provisioning_worker_pool(request: Request) -> ProvisioningWorkerPool | None:
+    # the pool only exists when asynchronous provisioning is enabled
+    return getattr(request.app.state, "provisioning_worker_pool", None)
+
+
+ProvisioningWorkerPoolDep = Annotated[
+    ProvisioningWorkerPool | None, Depends(get_provisioning_worker_pool)
+]
+
+
+def get_validation_worker_pool(request: Request) -> ValidationWorkerPool:
+    return request.app.state.validation_worker_pool
+
+
+ValidationWorkerPoolDep = Annotated[
+    ValidationWorkerPool, Depends(get_validation_worker_pool)
+]
+
+
 def get_kafka_client_service(
-    kafka_settings: Annotated[KafkaSettings, Depends(get_kafka_settings)]
+    kafka_settings: Annotated[KafkaSettings, Depends(get_kafka_settings)],
+    client_registry: Annotated[ClientRegistry, Depends(get_client_registry)],
+    topic_metadata_cache: Annotated[
+        TopicMetadataCache, Depends(get_topic_metadata_cache)
+    ],
 ) -> KafkaClientService:
-    return KafkaClientService(kafka_settings)
+    return KafkaClientService(
+        kafka_settings,
+        client_registry.get_admin_client(kafka_settings.admin_client_config),
+        topic_metadata_cache,
+    )
 
 
 def get_principal_mapping_service() -> PrincipalMappingService:
@@ -206,15 +291,28 @@ def get_principal_mapping_service() -> PrincipalMappingService:
 
 
 def get_schema_registry_service(
-    kafka_settings: Annotated[KafkaSettings, Depends(get_kafka_settings)]
+    kafka_settings: Annotated[KafkaSettings, Depends(get_kafka_settings)],
+    client_registry: Annotated[ClientRegistry, Depends(get_client_registry)],
 ) -> SchemaRegistryService:
-    return SchemaRegistryService(kafka_settings)
+    return SchemaRegistryService(
+        kafka_settings,
+        client_registry.get_schema_registry_client(
+            kafka_settings.schema_registry_client_config,
+            kafka_settings.schema_registry_pool_maxsize,
+            kafka_settings.schema_registry_keepalive_expiry_s,
+            kafka_settings.schema_registry_timeout_s,
+        ),
+    )
 
 
 def get_acl_service(
-    kafka_settings: Annotated[KafkaSettings, Depends(get_kafka_settings)]
+    kafka_settings: Annotated[KafkaSettings, Depends(get_kafka_settings)],
+    client_registry: Annotated[ClientRegistry, Depends(get_client_registry)],
 ) -> AclService:
-    return AclService(kafka_settings)
+    return AclService(
+        kafka_settings,
+        client_registry.get_admin_client(kafka_settings.admin_client_config),
+    )
 
 
 def get_provision_service(
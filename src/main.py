@@ -1,17 +1,17 @@
 from __future__ import annotations
 
-import uuid
-
-from fastapi import Request
-from starlette.background import BackgroundTask
+from prometheus_client import CONTENT_TYPE_LATEST, generate_latest
 from starlette.responses import Response
 
 from src.app_config import app
-from src.check_return_type import check_response
+from src.check_return_type import check_response, checked_endpoint
 from src.dependencies import (
+    ProvisioningWorkerPoolDep,
     ProvisionServiceDep,
     UnpackedUpdateAclRequestDep,
     UpdateAclServiceDep,
+    ValidationSettingsDep,
+    ValidationWorkerPoolDep,
 )
 from src.models.api_models import (
     ProvisioningRequest,
@@ -22,34 +22,60 @@ from src.models.api_models import (
     ValidationResult,
     ValidationStatus,
 )
-from src.services.validation_service import ValidateKafkaOutputPortDep
+from src.services.provisioning_worker_pool import (
+    Operation,
+    OperationResult,
+    ProvisioningWorkerPool,
+    ProvisioningWorkerPoolFullError,
+)
+from src.services.validation_service import (
+    ValidateKafkaOutputPortDep,
+    validate_components,
+)
+from src.services.validation_worker_pool import ValidationWorkerPoolFullError
+from src.settings.request_logging_settings import RequestLoggingSettings
+from src.utility.correlation_id_middleware import CorrelationIdMiddleware
 from src.utility.logger import get_logger
+from src.utility.metrics_middleware import MetricsMiddleware
+from src.utility.request_logging_middleware import RequestLoggingMiddleware
 
 logger = get_logger()
 
 
-def log_info(req_body, res_code, res_body):
-    id = str(uuid.uuid4())
-    logger.info("[%s] REQUEST: %s", id, req_body.decode("utf-8"))
-    logger.info("[%s] RESPONSE(%s): %s", id, res_code, res_body.decode("utf-8"))
-
-
-@app.middleware("http")
-async def log_request_response_middleware(request: Request, call_next):
-    req_body = await request.body()
-    response = await call_next(request)
-    chunks = []
-    async for chunk in response.body_iterator:
-        chunks.append(chunk)
-    res_body = b"".join(chunks)
-    task = BackgroundTask(log_info, req_body, response.status_code, res_body)
-    return Response(
-        content=res_body,
-        status_code=response.status_code,
-        headers=dict(response.headers),
-        media_type=response.media_type,
-        background=task,
-    )
+request_logging_settings = RequestLoggingSettings()
+app.add_middleware(
+    RequestLoggingMiddleware,
+    enabled=request_logging_settings.enabled,
+    max_body_bytes=request_logging_settings.max_body_bytes,
+    sample_rate=request_logging_settings.sample_rate,
+    # Prometheus scrapes are frequent and their bodies are large, they are not logged
+    # unless a sample rate is configured for them
+    route_sample_rates={"/metrics": 0.0, **request_logging_settings.route_sample_rates},
+    content_types=request_logging_settings.content_types,
+)
+app.add_middleware(MetricsMiddleware)
+# added last to be the outermost, so the request logs carry the correlation ID
+app.add_middleware(CorrelationIdMiddleware)
+
+
+async def run_operation(
+    worker_pool: ProvisioningWorkerPool | None,
+    component_id: str,
+    operation: Operation,
+) -> OperationResult | str:
+    """
+    Runs an operation right away, or in the background when asynchronous provisioning is enabled.
+
+    Returns:
+        The result of the operation, or the token to poll its status if it runs in the background.
+    """  # noqa: E501
+    if worker_pool is None:
+        return await operation()
+    try:
+        return await worker_pool.submit(component_id, operation)
+    except ProvisioningWorkerPoolFullError as e:
+        logger.warning(str(e))
+        return SystemErr(error=str(e))
 
 
 @app.post(
@@ -63,8 +89,11 @@ async def log_request_response_middleware(request: Request, call_next):
     },
     tags=["SpecificProvisioner"],
 )
-def provision(
-    request: ValidateKafkaOutputPortDep, provision_service: ProvisionServiceDep
+@checked_endpoint
+async def provision(
+    request: ValidateKafkaOutputPortDep,
+    provision_service: ProvisionServiceDep,
+    worker_pool: ProvisioningWorkerPoolDep,
 ) -> Response:
     """
     Deploy a data product or a single component starting from a provisioning descriptor
@@ -75,7 +104,9 @@ def provision(
 
     data_product, op = request
 
-    resp = provision_service.provision(data_product, op)
+    resp = await run_operation(
+        worker_pool, op.id, lambda: provision_service.provision(data_product, op)
+    )
 
     return check_response(out_response=resp)
 
@@ -90,13 +121,22 @@ def provision(
     },
     tags=["SpecificProvisioner"],
 )
-def get_status(token: str) -> Response:
+@checked_endpoint
+async def get_status(token: str, worker_pool: ProvisioningWorkerPoolDep) -> Response:
     """
     Get the status for a provisioning request
     """
 
-    # todo: define correct response
-    resp = SystemErr(error="Response not yet implemented")
+    resp: ProvisioningStatus | ValidationError | SystemErr
+    if worker_pool is None:
+        resp = SystemErr(error="Asynchronous provisioning is not enabled")
+    else:
+        status = await worker_pool.get_status(token)
+        resp = (
+            status
+            if status is not None
+            else ValidationError(errors=[f"Unknown provisioning token {token}"])
+        )
 
     return check_response(out_response=resp)
 
@@ -112,10 +152,12 @@ def get_status(token: str) -> Response:
     },
     tags=["SpecificProvisioner"],
 )
-def unprovision(
+@checked_endpoint
+async def unprovision(
     request: ValidateKafkaOutputPortDep,
     provision_service: ProvisionServiceDep,
     provisioning_request: ProvisioningRequest,
+    worker_pool: ProvisioningWorkerPoolDep,
 ) -> Response:
     """
     Undeploy a data product or a single component
@@ -127,8 +169,11 @@ def unprovision(
 
     data_product, op = request
 
-    resp = provision_service.unprovision(
-        data_product, op, provisioning_request.removeData or False
+    remove_data = provisioning_request.removeData or False
+    resp = await run_operation(
+        worker_pool,
+        op.id,
+        lambda: provision_service.unprovision(data_product, op, remove_data),
     )
 
     return check_response(out_response=resp)
@@ -145,8 +190,11 @@ def unprovision(
     },
     tags=["SpecificProvisioner"],
 )
-def updateacl(
-    request: UnpackedUpdateAclRequestDep, update_acl_service: UpdateAclServiceDep
+@checked_endpoint
+async def updateacl(
+    request: UnpackedUpdateAclRequestDep,
+    update_acl_service: UpdateAclServiceDep,
+    worker_pool: ProvisioningWorkerPoolDep,
 ) -> Response:
     """
     Request the access to a specific provisioner component
@@ -157,7 +205,13 @@ def updateacl(
 
     data_product, component_id, witboost_users = request
 
-    resp = update_acl_service.update_acls(data_product, component_id, witboost_users)
+    resp = await run_operation(
+        worker_pool,
+        component_id,
+        lambda: update_acl_service.update_acls(
+            data_product, component_id, witboost_users
+        ),
+    )
 
     return check_response(out_response=resp)
 
@@ -168,7 +222,10 @@ def updateacl(
     responses={"200": {"model": ValidationResult}, "500": {"model": SystemErr}},
     tags=["SpecificProvisioner"],
 )
-def validate(request: ValidateKafkaOutputPortDep) -> Response:
+@checked_endpoint
+def validate(
+    request: ValidateKafkaOutputPortDep, validation_settings: ValidationSettingsDep
+) -> Response:
     """
     Validate a provisioning request
     """
@@ -176,6 +233,11 @@ def validate(request: ValidateKafkaOutputPortDep) -> Response:
     if isinstance(request, ValidationError):
         return check_response(ValidationResult(valid=False, error=request))
 
+    if validation_settings.strict:
+        error = validate_components(request[0])
+        if error is not None:
+            return check_response(ValidationResult(valid=False, error=error))
+
     return check_response(out_response=ValidationResult(valid=True))
 
 
@@ -189,19 +251,20 @@ def validate(request: ValidateKafkaOutputPortDep) -> Response:
     },
     tags=["SpecificProvisioner"],
 )
+@checked_endpoint
 def async_validate(
-    body: ValidationRequest,
+    body: ValidationRequest, validation_worker_pool: ValidationWorkerPoolDep
 ) -> Response:
     """
     Validate a deployment request
     """
 
-    # todo: define correct response. You can define your pydantic component type with the expected specific schema
-    #  and use `.get_type_component_by_id` to extract it from the data product
-
-    # componentToProvision = data_product.get_typed_component_by_id(component_id, MyTypedComponent)
-
-    resp = SystemErr(error="Response not yet implemented")
+    resp: str | SystemErr
+    try:
+        resp = validation_worker_pool.submit(body.descriptor)
+    except ValidationWorkerPoolFullError as e:
+        logger.warning(str(e))
+        resp = SystemErr(error=str(e))
 
     return check_response(out_response=resp)
 
@@ -216,14 +279,28 @@ def async_validate(
     },
     tags=["SpecificProvisioner"],
 )
+@checked_endpoint
 def get_validation_status(
-    token: str,
+    token: str, validation_worker_pool: ValidationWorkerPoolDep
 ) -> Response:
     """
     Get the status for a provisioning request
     """
 
-    # todo: define correct response
-    resp = SystemErr(error="Response not yet implemented")
+    status = validation_worker_pool.get_status(token)
+    resp = (
+        status
+        if status is not None
+        else ValidationError(errors=[f"Unknown validation token {token}"])
+    )
 
     return check_response(out_response=resp)
+
+
+@app.get("/metrics", include_in_schema=False)
+def metrics() -> Response:
+    """
+    Expose the metrics in the Prometheus text format
+    """
+
+    return Response(content=generate_latest(), media_type=CONTENT_TYPE_LATEST)
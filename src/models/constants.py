@@ -43,3 +43,9 @@ OPENMETADATA_SUPPORTED_DATATYPES = [
     "POLYGON",
     "BYTEA",
 ]
+
+# constant-time, case-insensitive lookup of the supported data types
+OPENMETADATA_SUPPORTED_DATATYPES_SET = frozenset(
+    OPENMETADATA_SUPPORTED_DATATYPES
+    + [datatype.lower() for datatype in OPENMETADATA_SUPPORTED_DATATYPES]
+)
@@ -1,6 +1,6 @@
 from datetime import datetime
 from enum import StrEnum
-from typing import Annotated, Any, List, Literal, Optional, Type
+from typing import Annotated, Any, List, Literal, Optional, Type, TypeVar
 
 from pydantic import (
     AnyUrl,
@@ -8,15 +8,23 @@ from pydantic import (
     BeforeValidator,
     ConfigDict,
     Field,
+    PrivateAttr,
+    ValidationInfo,
+    ValidatorFunctionWrapHandler,
     field_validator,
     model_validator,
 )
 
-from src.models.constants import OPENMETADATA_SUPPORTED_DATATYPES
+from src.models.constants import OPENMETADATA_SUPPORTED_DATATYPES_SET
 from src.utility.logger import get_logger
 
 logger = get_logger(__name__)
 
+# Validation context key enabling the lazy validation of the data product components
+LAZY_COMPONENTS = "lazy_components"
+
+T = TypeVar("T", bound=BaseModel)
+
 
 class ComponentKind(StrEnum):
     OUTPUTPORT = "outputport"
@@ -66,6 +74,13 @@ class ConnectionTypeWorkload(StrEnum):
     DATAPIPELINE = "DATAPIPELINE"
 
 
+def is_supported_datatype(datatype: str) -> bool:
+    return (
+        datatype in OPENMETADATA_SUPPORTED_DATATYPES_SET
+        or datatype.upper() in OPENMETADATA_SUPPORTED_DATATYPES_SET
+    )
+
+
 class OpenMetadataColumn(BaseModel):
     name: str
     dataType: str
@@ -76,13 +91,11 @@ class OpenMetadataColumn(BaseModel):
     @field_validator("dataType")
     @classmethod
     def check_dataType(cls, value, values):
-        if value.upper() not in OPENMETADATA_SUPPORTED_DATATYPES:
+        if not is_supported_datatype(value):
+            data = values if isinstance(values, dict) else values.data
             raise ValueError(
-                'Column "'
-                + values["name"]
-                + '" specifies dataType of "'
-                + value
-                + '" but this is not a valid OpenMetadata data type'
+                f'Column "{data.get("name")}" specifies dataType of "{value}" '
+                "but this is not a valid OpenMetadata data type"
             )
         return value
 
@@ -90,6 +103,27 @@ class OpenMetadataColumn(BaseModel):
 class DataContract(BaseModel):
     schema_: Optional[List[OpenMetadataColumn]] = Field(None, alias="schema")
 
+    @field_validator("schema_", mode="before")
+    @classmethod
+    def check_columns_dataType(cls, value):
+        """Checks the data types of all the columns in one pass, reporting every
+        column with a data type that is not valid at once."""
+        if not isinstance(value, list):
+            return value
+        invalid_columns = [
+            f'"{column.get("name")}" ("{column["dataType"]}")'
+            for column in value
+            if isinstance(column, dict)
+            and isinstance(column.get("dataType"), str)
+            and not is_supported_datatype(column["dataType"])
+        ]
+        if invalid_columns:
+            raise ValueError(
+                f"{len(invalid_columns)} columns specify a dataType that is not a "
+                f"valid OpenMetadata data type: {', '.join(invalid_columns)}"
+            )
+        return value
+
 
 class DataSharingAgreement(BaseModel):
     purpose: Optional[str] = None
@@ -288,7 +322,31 @@ def parse_component(data: dict | Component) -> Component:
         return component
 
 
+def validate_component(data: dict | Component, info: ValidationInfo) -> Component:
+    if (
+        isinstance(data, dict)
+        and info.context is not None
+        and info.context.get(LAZY_COMPONENTS)
+    ):
+        if data.get("kind") not in component_map:
+            raise ValueError(f"Unknown component kind: {data.get('kind')}")
+        # only the common fields are checked, the specific ones are kept raw as extra
+        # fields until the component is accessed
+        return Component(**data)
+    return parse_component(data)
+
+
 class DataProduct(BaseModel):
+    """
+    A data product and its components.
+
+    When validated with the `LAZY_COMPONENTS` context flag, e.g.
+    `DataProduct.model_validate(data, context={LAZY_COMPONENTS: True})`, only the
+    common fields of the components are checked: each component is fully validated
+    against its kind the first time it is accessed through the methods of this class,
+    or all at once by `validate_components`.
+    """
+
     id: str
     name: str
     fullyQualifiedName: Optional[str] = None
@@ -308,7 +366,32 @@ class DataProduct(BaseModel):
     billing: Optional[dict] = None
     tags: List[OpenMetadataTagLabel]
     specific: dict
-    components: List[Annotated[Component, BeforeValidator(parse_component)]]
+    components: List[Annotated[Component, BeforeValidator(validate_component)]]
+
+    # raw components the data product was validated from, keyed by ID
+    _component_sources: dict[str, dict] = PrivateAttr(default_factory=dict)
+    _typed_components: dict[tuple[str, type], BaseModel] = PrivateAttr(
+        default_factory=dict
+    )
+    # positions of the components by ID and by kind, built on first use
+    _indexes: tuple[dict[str, int], dict[str, list[int]]] | None = PrivateAttr(
+        default=None
+    )
+    _indexed_components: tuple[int, int] | None = PrivateAttr(default=None)
+
+    @model_validator(mode="wrap")
+    @classmethod
+    def keep_component_sources(
+        cls, data: Any, handler: ValidatorFunctionWrapHandler
+    ) -> "DataProduct":
+        data_product = handler(data)
+        if isinstance(data, dict):
+            for component in data.get("components") or []:
+                if isinstance(component, dict) and isinstance(component.get("id"), str):
+                    data_product._component_sources.setdefault(
+                        component["id"], component
+                    )
+        return data_product
 
     def get_components_by_kind(self, kind: str) -> List[Component]:
         """
@@ -328,7 +411,8 @@ class DataProduct(BaseModel):
         """  # noqa: E501
 
         new_components_list = [
-            component for component in self.components if component.kind == kind
+            self._materialize_component(index)
+            for index in self._component_indexes()[1].get(kind, [])
         ]
 
         return new_components_list
@@ -355,19 +439,83 @@ class DataProduct(BaseModel):
            ... else:
            ...     print("Component not found.")
         """  # noqa: E501
-        for component in self.components:
-            if component.id == component_id:
-                return component
-        return None
+        index = self._find_component(component_id)
+        if index is None:
+            return None
+        return self._materialize_component(index)
+
+    def validate_components(self) -> None:
+        """
+        Fully validates the components not validated yet against their kind.
+
+        Raises:
+            ValueError: If a component is not valid.
+        """
+        for index in range(len(self.components)):
+            self._materialize_component(index)
+
+    def _find_component(self, component_id: str) -> int | None:
+        return self._component_indexes()[0].get(component_id)
+
+    def _component_indexes(self) -> tuple[dict[str, int], dict[str, list[int]]]:
+        # components are replaced in place once validated, so the indexes only need
+        # to be rebuilt if the list itself is replaced or resized
+        indexed_components = (id(self.components), len(self.components))
+        if self._indexes is None or self._indexed_components != indexed_components:
+            id_index: dict[str, int] = {}
+            kind_index: dict[str, list[int]] = {}
+            for index, component in enumerate(self.components):
+                id_index.setdefault(component.id, index)
+                kind_index.setdefault(component.kind, []).append(index)
+            self._indexes = (id_index, kind_index)
+            self._indexed_components = indexed_components
+        return self._indexes
+
+    def _component_source(self, component: Component) -> dict:
+        source = self._component_sources.get(component.id)
+        return source if source is not None else component.model_dump(by_alias=True)
+
+    def _materialize_component(self, index: int) -> Component:
+        component = self.components[index]
+        if type(component) is Component:
+            component = parse_component(self._component_source(component))
+            self.components[index] = component
+        return component
 
     def get_typed_component_by_id(
-        self, component_id: str, component_type: Type[BaseModel]
-    ):
-        component = self.get_component_by_id(component_id)
-        if component is not None:
-            return component_type.parse_obj(component.dict(by_alias=True))
-        else:
+        self, component_id: str, component_type: Type[T]
+    ) -> T | None:
+        """
+        Retrieve a component within the data product by its unique identifier, validated
+        as the specified type.
+
+        The component is validated from the raw data the data product was created from,
+        and the result is kept, so retrieving the same component as the same type again
+        returns the same object.
+
+        Args:
+            component_id (str): The unique identifier of the component to retrieve.
+            component_type (Type[T]): The model to validate the component with.
+
+        Returns:
+            T | None: The component with the specified ID validated as `component_type`,
+            or None if no matching component is found.
+
+        Raises:
+            pydantic.ValidationError: If the component is not a valid `component_type`.
+        """  # noqa: E501
+        key = (component_id, component_type)
+        typed = self._typed_components.get(key)
+        if isinstance(typed, component_type):
+            return typed
+        index = self._find_component(component_id)
+        if index is None:
             return None
+        typed_component = component_type(
+            **self._component_source(self.components[index])
+        )
+        self._typed_components[key] = typed_component
+        return typed_component
 
     def get_output_ports(self) -> List[OutputPort]:
         """
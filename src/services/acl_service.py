@@ -1,3 +1,5 @@
+import math
+
 from confluent_kafka import KafkaException
 from confluent_kafka.admin import (
     AclBinding,
@@ -8,6 +10,7 @@ from confluent_kafka.admin import (
     ResourcePatternType,
     ResourceType,
 )
+from opentelemetry import trace
 
 from src.models.kafka_models import KafkaPermission
 from src.models.service_error import ServiceError
@@ -15,7 +18,11 @@ from src.services.principal_mapping_service import (
     KafkaPrincipal,
 )
 from src.settings.kafka_settings import KafkaSettings
+from src.utility.futures import wait_for_futures
 from src.utility.logger import get_logger
+from src.utility.metrics import timed_stage
+
+tracer = trace.get_tracer(__name__)
 
 
 class AclServiceError(ServiceError):
@@ -26,12 +33,18 @@ class AclService:
     def __init__(
         self,
         kafka_settings: KafkaSettings,
+        admin_client: AdminClient | None = None,
     ):
         self._kafka_settings = kafka_settings
-        self._admin_client = AdminClient(conf=self._kafka_settings.admin_client_config)
+        self._admin_client = (
+            admin_client
+            if admin_client is not None
+            else AdminClient(conf=self._kafka_settings.admin_client_config)
+        )
         self._logger = get_logger(__name__)
 
-    def apply_acls_to_principals(
+    @timed_stage("apply_acls_to_principals")
+    async def apply_acls_to_principals(
         self, acls: list[KafkaPermission], principals: list[KafkaPrincipal]
     ) -> None:
         """Applies a set of ACLs to the specified Kafka principals.
@@ -47,7 +60,130 @@ class AclService:
             AclServiceError: If there is a failure in applying ACLs.
         """
         try:
-            bindings = [
+            await self._create_acls(self.build_acl_bindings(acls, principals))
+            return None
+        except ServiceError:
+            raise
+        except KafkaException as ke:
+            details = str(ke) if len(getattr(ke, "args", ())) == 0 else ke.args[0].str()
+            error_message = f"Failed to apply acls. Details: {details}"
+            self._logger.exception(error_message)
+            raise AclServiceError(error_message)
+        except Exception as e:
+            error_message = f"Failed to apply acls. Details: {str(e)}"
+            self._logger.exception(error_message)
+            raise AclServiceError(error_message)
+
+    @timed_stage("sync_acls_for_topic")
+    async def sync_acls_for_topic(
+        self, topic_name: str, bindings: list[AclBinding]
+    ) -> None:
+        """Reconciles the ACLs of a Kafka topic with the desired set of bindings.
+
+        The current literal ACLs of the topic are read with a single describe request
+        and only the delta is applied: missing bindings are created with one request,
+        then the topic bindings that are no longer desired are deleted with another one.
+        Creating before deleting means that principals keeping their access are never
+        denied in between.
+
+        Bindings on other resources (e.g. consumer groups) are not described, so they
+        are always sent in the create request, which is idempotent on the broker.
+
+        Args:
+            topic_name (str): Name of the Kafka topic to reconcile.
+            bindings (list[AclBinding]): The desired ACL bindings.
+
+        Raises:
+            AclServiceError: If there is a failure in reading or applying ACLs.
+        """
+        try:
+            with tracer.start_as_current_span(
+                "kafka.describe_acls", attributes={"kafka.topic": topic_name}
+            ) as span:
+                future = self._admin_client.describe_acls(
+                    self._topic_binding_filter(topic_name),
+                    request_timeout=self._kafka_settings.admin_request_timeout_s,
+                )
+                await self._wait(
+                    {topic_name: future}, f"describe acls for topic {topic_name}"
+                )
+                current_bindings = set(future.result())
+                span.set_attribute("kafka.acl_bindings", len(current_bindings))
+            desired_bindings = set(bindings)
+            to_create = list(
+                dict.fromkeys(b for b in bindings if b not in current_bindings)
+            )
+            to_delete = [b for b in current_bindings if b not in desired_bindings]
+            self._logger.info(
+                "Reconciling acls for topic %s: %s to create, %s to delete",
+                topic_name,
+                len(to_create),
+                len(to_delete),
+            )
+            if len(to_create) > 0:
+                await self._create_acls(to_create)
+            if len(to_delete) > 0:
+                with tracer.start_as_current_span(
+                    "kafka.delete_acls",
+                    attributes={
+                        "kafka.topic": topic_name,
+                        "kafka.acl_bindings": len(to_delete),
+                    },
+                ):
+                    fs = self._admin_client.delete_acls(
+                        [
+                            AclBindingFilter(
+                                restype=b.restype,
+                                name=b.name,
+                                resource_pattern_type=b.resource_pattern_type,
+                                principal=b.principal,
+                                host=b.host,
+                                operation=b.operation,
+                                permission_type=b.permission_type,
+                            )
+                            for b in to_delete
+                        ],
+                        request_timeout=self._kafka_settings.admin_request_timeout_s,
+                    )
+                    await self._wait(fs, f"delete acls for topic {topic_name}")
+                    for res, future in fs.items():
+                        future.result()
+                        self._logger.info(f"Deleted acl {res}")
+            return None
+        except ServiceError:
+            raise
+        except KafkaException as ke:
+            details = str(ke) if len(getattr(ke, "args", ())) == 0 else ke.args[0].str()
+            error_message = (
+                f"Failed to update acls for topic {topic_name}. Details: {details}"
+            )
+            self._logger.exception(error_message)
+            raise AclServiceError(error_message)
+        except Exception as e:
+            error_message = (
+                f"Failed to update acls for topic {topic_name}. Details: {str(e)}"
+            )
+            self._logger.exception(error_message)
+            raise AclServiceError(error_message)
+
+    @staticmethod
+    def build_acl_bindings(
+        acls: list[KafkaPermission], principals: list[KafkaPrincipal]
+    ) -> list[AclBinding]:
+        """Builds the ACL bindings for each combination of ACL and principal.
+
+        Args:
+            acls (list[KafkaPermission]): List of Kafka ACL permissions.
+            principals (list[KafkaPrincipal]): List of Kafka principals.
+
+        Returns:
+            list[AclBinding]: The ACL bindings, allowing access from any host.
+
+        Raises:
+            AclServiceError: If an ACL contains an unknown enum value.
+        """
+        try:
+            return [
                 AclBinding(
                     restype=ResourceType[acl.resourceType],
                     name=acl.resourceName,
@@ -60,22 +196,11 @@ class AclService:
                 for acl in acls
                 for principal in principals
             ]
-            fs = self._admin_client.create_acls(bindings)
-            for res, future in fs.items():
-                future.result()
-                self._logger.info(f"Created acl {res}")
-            return None
-        except KafkaException as ke:
-            details = str(ke) if len(getattr(ke, "args", ())) == 0 else ke.args[0].str()
-            error_message = f"Failed to apply acls. Details: {details}"
-            self._logger.exception(error_message)
-            raise AclServiceError(error_message)
-        except Exception as e:
-            error_message = f"Failed to apply acls. Details: {str(e)}"
-            self._logger.exception(error_message)
-            raise AclServiceError(error_message)
+        except KeyError as ke:
+            raise AclServiceError(f"Invalid acl, unknown value {ke}")
 
-    def remove_all_acls_for_topic(self, topic_name: str) -> None:
+    @timed_stage("remove_all_acls_for_topic")
+    async def remove_all_acls_for_topic(self, topic_name: str) -> None:
         """Removes all ACLs associated with a specific Kafka topic.
 
         This method deletes all ACLs for the given topic using an ACL binding filter.
@@ -87,20 +212,21 @@ class AclService:
             AclServiceError: If there is a failure in removing ACLs.
         """
         try:
-            binding_filter = AclBindingFilter(
-                restype=ResourceType.TOPIC,
-                name=topic_name,
-                resource_pattern_type=ResourcePatternType.LITERAL,
-                principal=None,
-                host=None,
-                operation=AclOperation.ANY,
-                permission_type=AclPermissionType.ANY,
-            )
-            fs = self._admin_client.delete_acls([binding_filter])
-            for res, future in fs.items():
-                future.result()
-                self._logger.info("Deleted acls for topic %s", topic_name)
+            binding_filter = self._topic_binding_filter(topic_name)
+            with tracer.start_as_current_span(
+                "kafka.delete_acls", attributes={"kafka.topic": topic_name}
+            ):
+                fs = self._admin_client.delete_acls(
+                    [binding_filter],
+                    request_timeout=self._kafka_settings.admin_request_timeout_s,
+                )
+                await self._wait(fs, f"remove acls for topic {topic_name}")
+                for res, future in fs.items():
+                    future.result()
+                    self._logger.info("Deleted acls for topic %s", topic_name)
             return None
+        except ServiceError:
+            raise
         except KafkaException as ke:
             details = str(ke) if len(getattr(ke, "args", ())) == 0 else ke.args[0].str()
             error_message = (
@@ -114,3 +240,74 @@ class AclService:
             )
             self._logger.exception(error_message)
             raise AclServiceError(error_message)
+
+    async def _create_acls(self, bindings: list[AclBinding]) -> None:
+        """Creates ACL bindings with as few CreateAcls requests as possible.
+
+        Bindings are sent in chunks of at most `acl_max_bindings_per_request`, all
+        chunks are submitted before waiting on any of them, and the failures of
+        every binding are collected and reported together.
+
+        Raises:
+            AclServiceError: If at least one binding could not be created.
+        """
+        chunk_size = max(1, self._kafka_settings.acl_max_bindings_per_request)
+        request_count = math.ceil(len(bindings) / chunk_size)
+        with tracer.start_as_current_span(
+            "kafka.create_acls",
+            attributes={
+                "kafka.acl_bindings": len(bindings),
+                "kafka.requests": request_count,
+            },
+        ) as span:
+            fs = {}
+            for i in range(0, len(bindings), chunk_size):
+                fs.update(
+                    self._admin_client.create_acls(
+                        bindings[i : i + chunk_size],
+                        request_timeout=self._kafka_settings.admin_request_timeout_s,
+                    )
+                )
+            await self._wait(fs, "create acls")
+            failures = []
+            for res, future in fs.items():
+                try:
+                    future.result()
+                    self._logger.debug(f"Created acl {res}")
+                except KafkaException as ke:
+                    details = (
+                        str(ke)
+                        if len(getattr(ke, "args", ())) == 0
+                        else ke.args[0].str()
+                    )
+                    failures.append(f"{res}: {details}")
+                except Exception as e:
+                    failures.append(f"{res}: {str(e)}")
+            if len(failures) > 0:
+                error_message = (
+                    f"Failed to create {len(failures)} of {len(fs)} acls. "
+                    f"Details: {'; '.join(failures)}"
+                )
+                self._logger.error(error_message)
+                span.set_attribute("kafka.acl_failures", len(failures))
+                raise AclServiceError(error_message)
+            self._logger.info(
+                "Created %s acls in %s requests",
+                len(fs),
+                request_count,
+            )
+
+    async def _wait(self, fs: dict, stage: str) -> None:
+        await wait_for_futures(fs, self._kafka_settings.admin_deadline_s, stage)
+
+    @staticmethod
+    def _topic_binding_filter(topic_name: str) -> AclBindingFilter:
+        return AclBindingFilter(
+            restype=ResourceType.TOPIC,
+            name=topic_name,
+            resource_pattern_type=ResourcePatternType.LITERAL,
+            principal=None,
+            host=None,
+            operation=AclOperation.ANY,
+            permission_type=AclPermissionType.ANY,
+        )
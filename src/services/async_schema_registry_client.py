@@ -0,0 +1,174 @@
+from collections import OrderedDict
+from typing import Any
+from urllib.parse import quote
+
+import httpx
+from confluent_kafka.schema_registry import SchemaRegistryError
+
+DEFAULT_POOL_MAXSIZE = 10
+DEFAULT_KEEPALIVE_EXPIRY_S = 30.0
+DEFAULT_TIMEOUT_S = 30.0
+DEFAULT_CACHE_CAPACITY = 1000
+
+_SCHEMA_REGISTRY_CONTENT_TYPE = "application/vnd.schemaregistry.v1+json"
+
+
+class AsyncSchemaRegistryClient:
+    """Asynchronous Schema Registry client over a pooled httpx.AsyncClient.
+
+    It accepts the same configuration as the Confluent SchemaRegistryClient
+    (`url`, `basic.auth.user.info`, `ssl.ca.location`, `ssl.certificate.location`,
+    `ssl.key.location`) and raises the same SchemaRegistryError, but never blocks
+    the event loop. Like the Confluent client, it caches the ids of the schemas
+    it has registered, so that registering an unchanged schema does not hit the
+    registry again.
+    """
+
+    def __init__(
+        self,
+        conf: dict[str, Any],
+        pool_maxsize: int = DEFAULT_POOL_MAXSIZE,
+        keepalive_expiry_s: float = DEFAULT_KEEPALIVE_EXPIRY_S,
+        timeout_s: float = DEFAULT_TIMEOUT_S,
+        cache_capacity: int = DEFAULT_CACHE_CAPACITY,
+        transport: httpx.AsyncBaseTransport | None = None,
+    ):
+        conf_copy = dict(conf)
+        base_url = conf_copy.pop("url", None)
+        if not isinstance(base_url, str) or len(base_url) == 0:
+            raise ValueError("Missing required configuration property url")
+        if "," in base_url:
+            raise ValueError("Multiple Schema Registry urls are not supported")
+
+        auth = None
+        user_info = conf_copy.pop("basic.auth.user.info", None)
+        if user_info is not None:
+            if ":" not in user_info:
+                raise ValueError(
+                    "basic.auth.user.info must be in the form of {username}:{password}"
+                )
+            username, password = user_info.split(":", 1)
+            auth = httpx.BasicAuth(username, password)
+
+        verify: bool | str = conf_copy.pop("ssl.ca.location", True)
+        cert_location = conf_copy.pop("ssl.certificate.location", None)
+        key_location = conf_copy.pop("ssl.key.location", None)
+        if key_location is not None and cert_location is None:
+            raise ValueError(
+                "ssl.certificate.location required when configuring ssl.key.location"
+            )
+        cert = (
+            (cert_location, key_location) if key_location is not None else cert_location
+        )
+
+        if len(conf_copy) > 0:
+            raise ValueError(
+                f"Unrecognized properties: {', '.join(sorted(conf_copy.keys()))}"
+            )
+
+        self._http_client = httpx.AsyncClient(
+            base_url=base_url.rstrip("/"),
+            auth=auth,
+            verify=verify,
+            cert=cert,
+            timeout=httpx.Timeout(timeout_s),
+            limits=httpx.Limits(
+                max_connections=pool_maxsize,
+                max_keepalive_connections=pool_maxsize,
+                keepalive_expiry=keepalive_expiry_s,
+            ),
+            headers={"Accept": _SCHEMA_REGISTRY_CONTENT_TYPE},
+            transport=transport,
+        )
+        self._cache_capacity = cache_capacity
+        self._schema_ids: OrderedDict[tuple[str, str, str], int] = OrderedDict()
+
+    async def register_schema(
+        self, subject_name: str, schema_type: str, schema_str: str
+    ) -> int:
+        """Registers a schema under the given subject.
+
+        Args:
+            subject_name (str): The name of the schema subject.
+            schema_type (str): The type of the schema (e.g., "AVRO", "JSON", "PROTOBUF").
+            schema_str (str): The schema definition as a string.
+
+        Returns:
+            int: The schema ID assigned by the Schema Registry.
+
+        Raises:
+            SchemaRegistryError: If the Schema Registry rejects the request.
+            httpx.TimeoutException: If the request does not complete in time.
+        """  # noqa: E501
+        key = (subject_name, schema_type, schema_str)
+        schema_id = self._schema_ids.get(key)
+        if schema_id is not None:
+            self._schema_ids.move_to_end(key)
+            return schema_id
+
+        body: dict[str, Any] = {"schema": schema_str}
+        if schema_type != "AVRO":
+            body["schemaType"] = schema_type
+        response = await self._request(
+            "POST", f"/subjects/{quote(subject_name, safe='')}/versions", body
+        )
+        schema_id = response["id"]
+        self._schema_ids[key] = schema_id
+        if len(self._schema_ids) > self._cache_capacity:
+            self._schema_ids.popitem(last=False)
+        return schema_id
+
+    async def delete_subject(
+        self, subject_name: str, permanent: bool = False
+    ) -> list[int]:
+        """Deletes a subject and its associated compatibility level.
+
+        Args:
+            subject_name (str): The name of the schema subject to delete.
+            permanent (bool): Whether to hard delete an already soft deleted subject.
+
+        Returns:
+            list[int]: The versions deleted under this subject.
+
+        Raises:
+            SchemaRegistryError: If the Schema Registry rejects the request.
+            httpx.TimeoutException: If the request does not complete in time.
+        """
+        for key in [k for k in self._schema_ids if k[0] == subject_name]:
+            del self._schema_ids[key]
+        return await self._request(
+            "DELETE",
+            f"/subjects/{quote(subject_name, safe='')}",
+            params={"permanent": "true"} if permanent else None,
+        )
+
+    async def aclose(self) -> None:
+        """Closes every pooled HTTP connection."""
+        await self._http_client.aclose()
+
+    async def _request(
+        self,
+        method: str,
+        path: str,
+        body: dict[str, Any] | None = None,
+        params: dict[str, str] | None = None,
+    ) -> Any:
+        headers = None
+        if body is not None:
+            headers = {"Content-Type": _SCHEMA_REGISTRY_CONTENT_TYPE}
+        response = await self._http_client.request(
+            method, path, json=body, params=params, headers=headers
+        )
+        if response.is_success:
+            return response.json()
+        try:
+            error = response.json()
+            error_code = error["error_code"]
+            message = error["message"]
+        except (ValueError, KeyError, TypeError):
+            raise SchemaRegistryError(
+                response.status_code,
+                -1,
+                f"Unknown Schema Registry Error: {response.text}",
+            )
+        raise SchemaRegistryError(response.status_code, error_code, message)
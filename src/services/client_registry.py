@@ -0,0 +1,196 @@
+import json
+import threading
+import time
+from typing import Any
+
+from confluent_kafka import KafkaError, KafkaException
+from confluent_kafka.admin import AdminClient
+
+from src.services.async_schema_registry_client import AsyncSchemaRegistryClient
+from src.utility.logger import get_logger
+
+DEFAULT_HEALTH_CHECK_INTERVAL_S = 30.0
+DEFAULT_HEALTH_CHECK_TIMEOUT_S = 5.0
+DEFAULT_SCHEMA_REGISTRY_POOL_MAXSIZE = 10
+DEFAULT_SCHEMA_REGISTRY_KEEPALIVE_EXPIRY_S = 30.0
+DEFAULT_SCHEMA_REGISTRY_TIMEOUT_S = 30.0
+
+
+class _ManagedAdminClient:
+    def __init__(self, client: AdminClient):
+        self.client = client
+        self.last_health_check = time.monotonic()
+        self.stale = False
+
+
+class ClientRegistry:
+    """Process-wide registry of long-lived Kafka clients.
+
+    A single client is created for each distinct configuration and shared by
+    every request, so the librdkafka threads and broker connections
+    (including TLS and SASL handshakes) are set up once per process instead of
+    once per request.
+
+    Admin clients are periodically probed when handed out and are recreated when
+    the probe fails or when librdkafka reports a fatal error. Schema Registry
+    clients keep their schema caches and a bounded pool of keep-alive HTTP
+    connections for the whole life of the process.
+    """
+
+    def __init__(
+        self,
+        health_check_interval_s: float = DEFAULT_HEALTH_CHECK_INTERVAL_S,
+        health_check_timeout_s: float = DEFAULT_HEALTH_CHECK_TIMEOUT_S,
+    ):
+        self._health_check_interval_s = health_check_interval_s
+        self._health_check_timeout_s = health_check_timeout_s
+        self._admin_clients: dict[str, _ManagedAdminClient] = {}
+        self._admin_client_locks: dict[str, threading.Lock] = {}
+        self._schema_registry_clients: dict[str, AsyncSchemaRegistryClient] = {}
+        self._lock = threading.Lock()
+        self._closed = False
+        self._logger = get_logger(__name__)
+
+    def get_admin_client(self, config: dict[str, Any]) -> AdminClient:
+        """Returns the shared AdminClient for the given configuration.
+
+        The client is created on first use. If it was flagged as stale by a
+        fatal error, or if it fails the periodic health probe, it is replaced
+        with a new one. Concurrent callers share a single probe and a single
+        replacement.
+
+        Args:
+            config (dict[str, Any]): The librdkafka configuration of the client.
+
+        Returns:
+            AdminClient: The shared admin client.
+
+        Raises:
+            RuntimeError: If the registry has already been closed.
+        """
+        key = self._config_key(config)
+        with self._lock:
+            if self._closed:
+                raise RuntimeError("The client registry has been closed")
+            key_lock = self._admin_client_locks.setdefault(key, threading.Lock())
+
+        # the probe and the replacement of a client run once per configuration,
+        # concurrent callers wait for them and get the resulting client
+        with key_lock:
+            with self._lock:
+                if self._closed:
+                    raise RuntimeError("The client registry has been closed")
+                managed = self._admin_clients.get(key)
+                if managed is not None:
+                    # serve pending callbacks, so that fatal errors are noticed
+                    managed.client.poll(0)
+                if managed is None or managed.stale:
+                    managed = self._create_admin_client(key, config)
+                    self._admin_clients[key] = managed
+
+            elapsed = time.monotonic() - managed.last_health_check
+            if elapsed >= self._health_check_interval_s and not self._probe(managed):
+                with self._lock:
+                    if self._admin_clients.get(key) is managed:
+                        managed = self._create_admin_client(key, config)
+                        self._admin_clients[key] = managed
+            return managed.client
+
+    def get_schema_registry_client(
+        self,
+        config: dict[str, Any],
+        pool_maxsize: int = DEFAULT_SCHEMA_REGISTRY_POOL_MAXSIZE,
+        keepalive_expiry_s: float = DEFAULT_SCHEMA_REGISTRY_KEEPALIVE_EXPIRY_S,
+        timeout_s: float = DEFAULT_SCHEMA_REGISTRY_TIMEOUT_S,
+    ) -> AsyncSchemaRegistryClient:
+        """Returns the shared AsyncSchemaRegistryClient for the given configuration.
+
+        The client is created on first use with a bounded pool of keep-alive
+        connections: when every connection is in use, further requests wait for
+        one to be released instead of opening new ones. Every HTTP request is
+        bounded by the given timeout.
+
+        Args:
+            config (dict[str, Any]): The Schema Registry client configuration.
+            pool_maxsize (int): Maximum number of connections kept in the pool.
+            keepalive_expiry_s (float): Seconds an idle connection is kept open.
+            timeout_s (float): Timeout of each HTTP request.
+
+        Returns:
+            AsyncSchemaRegistryClient: The shared Schema Registry client.
+
+        Raises:
+            RuntimeError: If the registry has already been closed.
+        """
+        key = self._config_key(config)
+        with self._lock:
+            if self._closed:
+                raise RuntimeError("The client registry has been closed")
+            client = self._schema_registry_clients.get(key)
+            if client is None:
+                self._logger.info("Creating a new schema registry client")
+                client = AsyncSchemaRegistryClient(
+                    conf=config,
+                    pool_maxsize=pool_maxsize,
+                    keepalive_expiry_s=keepalive_expiry_s,
+                    timeout_s=timeout_s,
+                )
+                self._schema_registry_clients[key] = client
+            return client
+
+    async def close(self) -> None:
+        """Releases every client held by the registry.
+
+        Pending callbacks are served before the admin clients are dropped and the
+        HTTP connections of the Schema Registry clients are closed. Once closed,
+        the registry does not hand out clients anymore.
+        """
+        with self._lock:
+            for managed in self._admin_clients.values():
+                managed.client.poll(0)
+            self._admin_clients.clear()
+            self._admin_client_locks.clear()
+            schema_registry_clients = list(self._schema_registry_clients.values())
+            self._schema_registry_clients.clear()
+            self._closed = True
+        for client in schema_registry_clients:
+            await client.aclose()
+        self._logger.info("Client registry closed")
+
+    def _probe(self, managed: _ManagedAdminClient) -> bool:
+        try:
+            future = managed.client.describe_cluster(
+                request_timeout=self._health_check_timeout_s
+            )
+            future.result(timeout=self._health_check_timeout_s)
+            managed.last_health_check = time.monotonic()
+            return True
+        except KafkaException as ke:
+            self._logger.warning("Admin client health check failed: %s", ke)
+            return False
+        except Exception as e:
+            self._logger.warning("Admin client health check failed: %s", e)
+            return False
+
+    def _create_admin_client(
+        self, key: str, config: dict[str, Any]
+    ) -> _ManagedAdminClient:
+        user_error_cb = config.get("error_cb")
+        managed: _ManagedAdminClient
+
+        def error_cb(err: KafkaError) -> None:
+            if err.fatal():
+                self._logger.error(
+                    "Fatal error on admin client, it will be recreated: %s", err
+                )
+                managed.stale = True
+            if user_error_cb is not None:
+                user_error_cb(err)
+
+        self._logger.info("Creating a new admin client")
+        managed = _ManagedAdminClient(AdminClient({**config, "error_cb": error_cb}))
+        return managed
+
+    @staticmethod
+    def _config_key(config: dict[str, Any]) -> str:
+        return json.dumps(config, sort_keys=True, default=repr)
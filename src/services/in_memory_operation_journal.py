@@ -0,0 +1,59 @@
+import threading
+import time
+
+from src.models.api_models import ProvisioningStatus, Status1
+from src.services.operation_journal import DEFAULT_OPERATION_TTL_S
+
+
+class InMemoryOperationJournal:
+    """Operation journal kept in the memory of the process.
+
+    Operations are lost when the process stops, so it should only be used when a
+    single replica is running and losing the status of running operations on
+    restart is acceptable.
+    """
+
+    def __init__(self, ttl_s: float = DEFAULT_OPERATION_TTL_S):
+        self._ttl_s = ttl_s
+        # token -> (last update, status)
+        self._operations: dict[str, tuple[float, ProvisioningStatus]] = {}
+        self._lock = threading.Lock()
+
+    def start(self, token: str) -> None:
+        with self._lock:
+            self._operations[token] = (
+                time.monotonic(),
+                ProvisioningStatus(status=Status1.RUNNING, result=""),
+            )
+
+    def complete(self, token: str, status: ProvisioningStatus) -> None:
+        with self._lock:
+            entry = self._operations.get(token)
+            if entry is not None:
+                self._operations[token] = (time.monotonic(), status)
+
+    def get(self, token: str) -> ProvisioningStatus | None:
+        with self._lock:
+            entry = self._operations.get(token)
+            if entry is None or self._is_expired(entry, time.monotonic()):
+                return None
+            return entry[1]
+
+    def purge_expired(self) -> int:
+        with self._lock:
+            now = time.monotonic()
+            expired = [
+                token
+                for token, entry in self._operations.items()
+                if self._is_expired(entry, now)
+            ]
+            for token in expired:
+                del self._operations[token]
+            return len(expired)
+
+    def close(self) -> None:
+        pass
+
+    def _is_expired(self, entry: tuple[float, ProvisioningStatus], now: float) -> bool:
+        updated_at, status = entry
+        return status.status != Status1.RUNNING and updated_at + self._ttl_s <= now
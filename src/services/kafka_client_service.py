@@ -1,17 +1,25 @@
 from typing import Any
 
-from confluent_kafka import KafkaException
+from confluent_kafka import KafkaError, KafkaException, TopicCollection
 from confluent_kafka.admin import (
     AdminClient,
+    AlterConfigOpType,
+    ConfigEntry,
     ConfigResource,
     NewPartitions,
     NewTopic,
     ResourceType,
 )
+from opentelemetry import trace
 
 from src.models.service_error import ServiceError
+from src.services.topic_metadata_cache import TopicMetadataCache
 from src.settings.kafka_settings import KafkaSettings
+from src.utility.futures import wait_for_futures
 from src.utility.logger import get_logger
+from src.utility.metrics import timed_stage
+
+tracer = trace.get_tracer(__name__)
 
 
 class KafkaClientServiceError(ServiceError):
@@ -22,23 +30,36 @@ class KafkaClientService:
     def __init__(
         self,
         kafka_settings: KafkaSettings,
+        admin_client: AdminClient | None = None,
+        topic_metadata_cache: TopicMetadataCache | None = None,
     ):
         self.kafka_settings = kafka_settings
-        self.admin_client = AdminClient(conf=kafka_settings.admin_client_config)
+        self.admin_client = (
+            admin_client
+            if admin_client is not None
+            else AdminClient(conf=kafka_settings.admin_client_config)
+        )
+        self.topic_metadata_cache = (
+            topic_metadata_cache
+            if topic_metadata_cache is not None
+            else TopicMetadataCache(kafka_settings.topic_metadata_cache_ttl_s)
+        )
         self.logger = get_logger(__name__)
 
-    def create_or_update_topic(
+    @timed_stage("create_or_update_topic")
+    async def create_or_update_topic(
         self,
         topic_name: str,
         num_partitions: int,
         replication_factor: int,
         extra_config: dict[str, Any],
-    ) -> None:
+    ) -> list[str]:
         """Creates or updates a Kafka topic with the specified settings.
 
-        If the topic does not exist, it is created with the given number of partitions
-        and replication factor. If the topic exists, its partition count and configuration
-        settings are updated accordingly.
+        If the topic does not exist, it is created with the given number of partitions,
+        replication factor and configuration. If the topic exists, its partition count
+        is updated and only the configuration keys whose value differs from the current
+        one are altered.
 
         Args:
             topic_name (str): Name of the Kafka topic.
@@ -46,28 +67,48 @@ class KafkaClientService:
             replication_factor (int): Replication factor for the topic.
             extra_config (dict[str, Any]): Additional configuration settings for the topic.
 
+        Returns:
+            list[str]: The sorted configuration keys that have been set or changed.
+
         Raises:
             KafkaClientServiceError: If the topic creation or update fails.
         """
         try:
-            topic_already_exists = any(
-                t.topic == topic_name
-                for t in self.admin_client.list_topics().topics.values()
-            )
-            if not topic_already_exists:
+            current_partition_count = await self._get_partition_count(topic_name)
+            if current_partition_count is None:
                 new_topic = NewTopic(
                     topic_name,
                     num_partitions=num_partitions,
                     replication_factor=replication_factor,
+                    config={
+                        k: self._to_config_value(v) for k, v in extra_config.items()
+                    },
                 )
-                fs = self.admin_client.create_topics([new_topic])
-                for topic, future in fs.items():
-                    future.result()
-                    self.logger.info("Topic %s created", topic)
-            self._manage_partitions(topic_name, num_partitions)
-            self._manage_extra_config(topic_name, extra_config)
-            return None
-        except KafkaClientServiceError:
+                with tracer.start_as_current_span(
+                    "kafka.create_topics",
+                    attributes={
+                        "kafka.topic": topic_name,
+                        "kafka.partitions": num_partitions,
+                        "kafka.replication_factor": replication_factor,
+                        "kafka.config_keys": len(extra_config),
+                    },
+                ):
+                    fs = self.admin_client.create_topics(
+                        [new_topic],
+                        operation_timeout=self.kafka_settings.admin_operation_timeout_s,
+                        request_timeout=self.kafka_settings.admin_request_timeout_s,
+                    )
+                    self.topic_metadata_cache.invalidate(topic_name)
+                    await self._wait(fs, f"create topic {topic_name}")
+                    for topic, future in fs.items():
+                        future.result()
+                        self.logger.info("Topic %s created", topic)
+                return sorted(extra_config.keys())
+            await self._manage_partitions(
+                topic_name, num_partitions, current_partition_count
+            )
+            return await self._manage_extra_config(topic_name, extra_config)
+        except ServiceError:
             raise
         except KafkaException as ke:
             details = str(ke) if len(getattr(ke, "args", ())) == 0 else ke.args[0].str()
@@ -79,7 +120,7 @@ class KafkaClientService:
             self.logger.exception(error_message)
             raise KafkaClientServiceError(error_message)
 
-    def delete_topic(
+    async def delete_topic(
         self,
         topic_name: str,
     ) -> None:
@@ -92,16 +133,24 @@ class KafkaClientService:
             KafkaClientServiceError: If the topic deletion fails.
         """
         try:
-            topic_exists = any(
-                t.topic == topic_name
-                for t in self.admin_client.list_topics().topics.values()
-            )
+            topic_exists = await self._get_partition_count(topic_name) is not None
             if topic_exists:
-                fs = self.admin_client.delete_topics([topic_name])
-                for topic, f in fs.items():
-                    f.result()
-                    self.logger.info("Topic %s deleted", topic_name)
+                with tracer.start_as_current_span(
+                    "kafka.delete_topics", attributes={"kafka.topic": topic_name}
+                ):
+                    fs = self.admin_client.delete_topics(
+                        [topic_name],
+                        operation_timeout=self.kafka_settings.admin_operation_timeout_s,
+                        request_timeout=self.kafka_settings.admin_request_timeout_s,
+                    )
+                    self.topic_metadata_cache.invalidate(topic_name)
+                    await self._wait(fs, f"delete topic {topic_name}")
+                    for topic, f in fs.items():
+                        f.result()
+                        self.logger.info("Topic %s deleted", topic_name)
             return None
+        except ServiceError:
+            raise
         except KafkaException as ke:
             details = str(ke) if len(getattr(ke, "args", ())) == 0 else ke.args[0].str()
             error_message = f"Failed to delete topic {topic_name}. Details: {details}"
@@ -112,45 +161,137 @@ class KafkaClientService:
             self.logger.exception(error_message)
             raise KafkaClientServiceError(error_message)
 
-    def _manage_partitions(self, topic_name: str, num_partitions: int) -> None:
-        t = next(
-            (
-                t
-                for t in self.admin_client.list_topics().topics.values()
-                if t.topic == topic_name
-            ),
-            None,
-        )
-        if t is None:
-            error_message = f"Topic {topic_name} not found"
-            self.logger.error(error_message)
-            raise KafkaClientServiceError(error_message)
-        current_partition_count = len(t.partitions)
+    async def _get_partition_count(self, topic_name: str) -> int | None:
+        """Returns the partition count of a topic, or None if it does not exist.
+
+        Only the metadata of the requested topic is fetched, and the result is
+        served from the topic metadata cache while it is fresh.
+        """
+        partition_count = self.topic_metadata_cache.get(topic_name)
+        if partition_count is not None:
+            return partition_count
+        with tracer.start_as_current_span(
+            "kafka.describe_topics", attributes={"kafka.topic": topic_name}
+        ) as span:
+            fs = self.admin_client.describe_topics(
+                TopicCollection([topic_name]),
+                request_timeout=self.kafka_settings.admin_request_timeout_s,
+            )
+            await self._wait(fs, f"describe topic {topic_name}")
+            try:
+                topic_description = fs[topic_name].result()
+            except KafkaException as ke:
+                if (
+                    len(ke.args) > 0
+                    and ke.args[0].code() == KafkaError.UNKNOWN_TOPIC_OR_PART
+                ):
+                    span.set_attribute("kafka.topic_exists", False)
+                    return None
+                raise
+            partition_count = len(topic_description.partitions)
+            span.set_attribute("kafka.topic_exists", True)
+            span.set_attribute("kafka.current_partitions", partition_count)
+        self.topic_metadata_cache.set(topic_name, partition_count)
+        return partition_count
+
+    @timed_stage("manage_partitions")
+    async def _manage_partitions(
+        self, topic_name: str, num_partitions: int, current_partition_count: int
+    ) -> None:
         if num_partitions > current_partition_count:
             new_parts = [NewPartitions(topic_name, num_partitions)]
-            fs = self.admin_client.create_partitions(new_parts)
-            for topic, future in fs.items():
-                future.result()
-                self.logger.info(
-                    "Additional partitions created for topic %s, new total: %s",
-                    topic,
-                    num_partitions,
+            with tracer.start_as_current_span(
+                "kafka.create_partitions",
+                attributes={
+                    "kafka.topic": topic_name,
+                    "kafka.partitions": num_partitions,
+                    "kafka.current_partitions": current_partition_count,
+                },
+            ):
+                fs = self.admin_client.create_partitions(
+                    new_parts,
+                    operation_timeout=self.kafka_settings.admin_operation_timeout_s,
+                    request_timeout=self.kafka_settings.admin_request_timeout_s,
                 )
+                self.topic_metadata_cache.invalidate(topic_name)
+                await self._wait(fs, f"create partitions for topic {topic_name}")
+                for topic, future in fs.items():
+                    future.result()
+                    self.logger.info(
+                        "Additional partitions created for topic %s, new total: %s",
+                        topic,
+                        num_partitions,
+                    )
         elif num_partitions < current_partition_count:
             error_message = f"Cannot decrease partitions for topic {topic_name}. Current partition count: {current_partition_count}, requested: {num_partitions}"  # noqa: E501
             self.logger.error(error_message)
             raise KafkaClientServiceError(error_message)
         return None
 
-    def _manage_extra_config(self, topic_name: str, extra_config: dict[str, Any]):
+    @timed_stage("manage_extra_config")
+    async def _manage_extra_config(
+        self, topic_name: str, extra_config: dict[str, Any]
+    ) -> list[str]:
+        if len(extra_config) == 0:
+            return []
         resource = ConfigResource(ResourceType.TOPIC, topic_name)
-        for k, v in extra_config.items():
-            resource.set_config(k, v)
-        fs = self.admin_client.alter_configs([resource])
-        for config_resource, future in fs.items():
-            future.result()
-            self.logger.info(
-                "%s configuration successfully altered for topic %s",
-                config_resource,
-                topic_name,
+        with tracer.start_as_current_span(
+            "kafka.describe_configs", attributes={"kafka.topic": topic_name}
+        ):
+            fs = self.admin_client.describe_configs(
+                [resource], request_timeout=self.kafka_settings.admin_request_timeout_s
             )
+            await self._wait(fs, f"describe configuration of topic {topic_name}")
+            current_config = {
+                name: entry.value
+                for future in fs.values()
+                for name, entry in future.result().items()
+            }
+        changed_config = {
+            k: self._to_config_value(v)
+            for k, v in extra_config.items()
+            if current_config.get(k) != self._to_config_value(v)
+        }
+        if len(changed_config) == 0:
+            self.logger.info("Configuration of topic %s is up to date", topic_name)
+            return []
+        resource = ConfigResource(
+            ResourceType.TOPIC,
+            topic_name,
+            incremental_configs=[
+                ConfigEntry(k, v, incremental_operation=AlterConfigOpType.SET)
+                for k, v in changed_config.items()
+            ],
+        )
+        with tracer.start_as_current_span(
+            "kafka.incremental_alter_configs",
+            attributes={
+                "kafka.topic": topic_name,
+                "kafka.config_keys": len(changed_config),
+            },
+        ):
+            fs = self.admin_client.incremental_alter_configs(
+                [resource], request_timeout=self.kafka_settings.admin_request_timeout_s
+            )
+            await self._wait(fs, f"alter configuration of topic {topic_name}")
+            for config_resource, future in fs.items():
+                future.result()
+                self.logger.info(
+                    "%s configuration successfully altered for topic %s, changed keys: %s",  # noqa: E501
+                    config_resource,
+                    topic_name,
+                    ", ".join(sorted(changed_config.keys())),
+                )
+        return sorted(changed_config.keys())
+
+    async def _wait(self, fs: dict, stage: str) -> None:
+        await wait_for_futures(fs, self.kafka_settings.admin_deadline_s, stage)
+
+    @staticmethod
+    def _to_config_value(value: Any) -> str:
+        # Kafka reports every config value as a string, booleans in lower case
+        if isinstance(value, bool):
+            return str(value).lower()
+        if isinstance(value, list):
+            return ",".join(map(str, value))
+        return str(value)
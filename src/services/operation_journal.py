@@ -0,0 +1,51 @@
+from typing import Protocol
+
+from src.models.api_models import ProvisioningStatus
+
+DEFAULT_OPERATION_TTL_S = 3600.0
+INTERRUPTED_OPERATION_ERROR = (
+    "The operation was interrupted by a restart of the tech adapter, please retry"
+)
+
+
+class OperationJournal(Protocol):
+    def start(self, token: str) -> None:
+        """Records a new running operation.
+
+        Args:
+            token (str): The token identifying the operation.
+        """
+        pass
+
+    def complete(self, token: str, status: ProvisioningStatus) -> None:
+        """Records the final status of an operation.
+
+        Args:
+            token (str): The token identifying the operation.
+            status (ProvisioningStatus): The final status of the operation.
+        """
+        pass
+
+    def get(self, token: str) -> ProvisioningStatus | None:
+        """Returns the status of an operation.
+
+        Args:
+            token (str): The token identifying the operation.
+
+        Returns:
+            ProvisioningStatus | None: The status of the operation, or None if the
+            token is unknown or the operation expired.
+        """
+        pass
+
+    def purge_expired(self) -> int:
+        """Deletes the completed operations older than the TTL of the journal.
+
+        Returns:
+            int: The number of deleted operations.
+        """
+        pass
+
+    def close(self) -> None:
+        """Releases the resources held by the journal."""
+        pass
@@ -7,12 +7,15 @@ from src.services.kafka_client_service import (
     KafkaClientService,
 )
 from src.services.principal_mapping_service import (
+    KafkaPrincipal,
     PrincipalMappingService,
 )
 from src.services.schema_registry_service import (
     SchemaRegistryService,
 )
 from src.utility.logger import get_logger
+from src.utility.metrics import record_service_error
+from src.utility.stage_executor import Stage, StageResults, run_stages
 
 
 class ProvisionService:
@@ -29,75 +32,114 @@ class ProvisionService:
         self.acl_service = acl_service
         self.logger = get_logger(__name__)
 
-    def provision(
+    async def provision(
         self, data_product: DataProduct, op: KafkaOutputPort
     ) -> ProvisioningStatus | SystemErr:
-        try:
-            self.logger.info("Starting provisioning for component %s", op.id)
+        """Provisions the topic, owner ACLs and value schema of a Kafka output port.
+
+        The owner ACLs are applied once both the topic and the owner identity are
+        ready, while the schema registration runs concurrently with them.
+        """
+        topic = op.specific.topic
 
-            self.logger.info("Managing topic %s", op.specific.topic.name)
-            self.kafka_client_service.create_or_update_topic(
-                op.specific.topic.name,
-                op.specific.topic.numPartitions,
-                op.specific.topic.replicationFactor,
-                op.specific.topic.config,
+        async def manage_topic(_: StageResults) -> list[str]:
+            self.logger.info("Managing topic %s", topic.name)
+            return await self.kafka_client_service.create_or_update_topic(
+                topic.name, topic.numPartitions, topic.replicationFactor, topic.config
             )
 
+        async def map_owner(_: StageResults) -> KafkaPrincipal:
             self.logger.info("Mapping identity for %s", data_product.dataProductOwner)
-            mapped_identity = self.principal_mapping_service.map_identity(
+            return self.principal_mapping_service.map_identity(
                 data_product.dataProductOwner
             )
 
+        async def apply_owner_acls(results: StageResults) -> None:
+            mapped_identity = results["owner"]
             self.logger.info("Applying acls to %s", mapped_identity.principal)
-            self.acl_service.apply_acls_to_principals(
+            await self.acl_service.apply_acls_to_principals(
                 op.specific.ownerPermissions, [mapped_identity]
             )
 
-            schema_res = None
-            if op.specific.topic.valueSchema is not None:
-                subject_name = f"{op.specific.topic.name}-value"
+        stages = [
+            Stage("topic", manage_topic),
+            Stage("owner", map_owner),
+            Stage("acls", apply_owner_acls, depends_on=["topic", "owner"]),
+        ]
+        value_schema = topic.valueSchema
+        if value_schema is not None:
+            subject_name = f"{topic.name}-value"
+
+            async def register_schema(_: StageResults) -> int:
                 self.logger.info("Registering schema for subject %s", subject_name)
-                schema_res = self.schema_registry_service.register_schema(
-                    subject_name,
-                    op.specific.topic.valueSchema.type,
-                    op.specific.topic.valueSchema.definition,
+                return await self.schema_registry_service.register_schema(
+                    subject_name, value_schema.type, value_schema.definition
                 )
 
+            stages.append(Stage("schema", register_schema))
+
+        try:
+            self.logger.info("Starting provisioning for component %s", op.id)
+            results = await run_stages(stages)
             self.logger.info("Successfully provisioned component %s", op.id)
             return ProvisioningStatus(
                 status=Status1.COMPLETED,
                 result="",
                 info=Info(
-                    publicInfo=self._get_public_info(op, schema_res),
+                    publicInfo=self._get_public_info(
+                        op, results.get("schema"), results["topic"]
+                    ),
                     privateInfo=dict(),
                 ),
             )
         except ServiceError as se:
+            record_service_error(se)
             return SystemErr(error=se.error_msg)
 
-    def unprovision(
+    async def unprovision(
         self, data_product: DataProduct, op: KafkaOutputPort, remove_data: bool
     ) -> ProvisioningStatus | SystemErr:
-        try:
-            self.logger.info("Starting unprovisioning for component %s", op.id)
+        """Removes the ACLs of a Kafka output port and, if requested, its data.
 
-            self.logger.info("Removing acls for topic %s", op.specific.topic.name)
-            self.acl_service.remove_all_acls_for_topic(op.specific.topic.name)
+        The ACL removal, the topic deletion and the subject deletion are independent
+        and run concurrently.
+        """
+        topic_name = op.specific.topic.name
 
-            if remove_data:
-                self.logger.info("Deleting topic %s", op.specific.topic.name)
-                self.kafka_client_service.delete_topic(op.specific.topic.name)
+        async def remove_acls(_: StageResults) -> None:
+            self.logger.info("Removing acls for topic %s", topic_name)
+            await self.acl_service.remove_all_acls_for_topic(topic_name)
 
-                subject_name = f"{op.specific.topic.name}-value"
+        stages = [Stage("acls", remove_acls)]
+        if remove_data:
+            subject_name = f"{topic_name}-value"
+
+            async def delete_topic(_: StageResults) -> None:
+                self.logger.info("Deleting topic %s", topic_name)
+                await self.kafka_client_service.delete_topic(topic_name)
+
+            async def delete_subject(_: StageResults) -> None:
                 self.logger.info("Deleting schema for subject %s", subject_name)
-                self.schema_registry_service.delete_subject(subject_name)
+                await self.schema_registry_service.delete_subject(subject_name)
 
+            stages.append(Stage("topic", delete_topic))
+            stages.append(Stage("schema", delete_subject))
+
+        try:
+            self.logger.info("Starting unprovisioning for component %s", op.id)
+            await run_stages(stages)
             self.logger.info("Successfully unprovisioned component %s", op.id)
             return ProvisioningStatus(status=Status1.COMPLETED, result="")
         except ServiceError as se:
+            record_service_error(se)
             return SystemErr(error=se.error_msg)
 
-    def _get_public_info(self, op: KafkaOutputPort, schema_res: int | None) -> dict:
+    def _get_public_info(
+        self,
+        op: KafkaOutputPort,
+        schema_res: int | None,
+        changed_config: list[str],
+    ) -> dict:
         public_info = dict()
         if isinstance(schema_res, int):
             public_info["schema_id"] = {
@@ -120,4 +162,10 @@ class ProvisionService:
             "label": "Replication factor",
             "value": str(op.specific.topic.replicationFactor),
         }
+        if changed_config:
+            public_info["changed_config"] = {
+                "type": "string",
+                "label": "Changed configuration",
+                "value": ", ".join(changed_config),
+            }
         return public_info
@@ -0,0 +1,136 @@
+import asyncio
+import time
+import uuid
+from typing import Callable, Coroutine
+
+from src.models.api_models import (
+    ProvisioningStatus,
+    Status1,
+    SystemErr,
+    ValidationError,
+)
+from src.services.in_memory_operation_journal import InMemoryOperationJournal
+from src.services.operation_journal import (
+    INTERRUPTED_OPERATION_ERROR,
+    OperationJournal,
+)
+from src.utility.logger import get_logger
+
+OperationResult = ProvisioningStatus | ValidationError | SystemErr
+Operation = Callable[[], Coroutine[None, None, OperationResult]]
+
+DEFAULT_MAX_WORKERS = 8
+DEFAULT_MAX_PENDING = 1000
+DEFAULT_PURGE_INTERVAL_S = 60.0
+
+
+class ProvisioningWorkerPoolFullError(Exception):
+    pass
+
+
+class ProvisioningWorkerPool:
+    """Runs provisioning operations in the background and tracks their status.
+
+    Each submitted operation gets a token that can be used to poll its status. At
+    most `max_workers` operations run at the same time, the others wait for a free
+    worker; at most `max_pending` operations can be accepted before they complete.
+    The status of every operation is recorded in the operation journal, which
+    periodically purges the expired ones. The journal may block on disk I/O, so it
+    is always accessed from a worker thread, never from the event loop.
+    """
+
+    def __init__(
+        self,
+        max_workers: int = DEFAULT_MAX_WORKERS,
+        max_pending: int = DEFAULT_MAX_PENDING,
+        journal: OperationJournal | None = None,
+        purge_interval_s: float = DEFAULT_PURGE_INTERVAL_S,
+    ):
+        self._max_pending = max_pending
+        self._journal = journal if journal is not None else InMemoryOperationJournal()
+        self._purge_interval_s = purge_interval_s
+        self._last_purge = time.monotonic()
+        self._workers = asyncio.Semaphore(max_workers)
+        self._tasks: set[asyncio.Task] = set()
+        # operations accepted but not yet recorded in the journal
+        self._starting = 0
+        self._logger = get_logger(__name__)
+
+    async def submit(self, component_id: str, operation: Operation) -> str:
+        """Schedules an operation and returns the token to poll its status.
+
+        Args:
+            component_id (str): The ID of the component the operation acts on.
+            operation (Operation): Coroutine function running the operation.
+
+        Returns:
+            str: The token of the operation.
+
+        Raises:
+            ProvisioningWorkerPoolFullError: If too many operations are pending.
+        """
+        await self._maybe_purge()
+        pending = len(self._tasks) + self._starting
+        if pending >= self._max_pending:
+            raise ProvisioningWorkerPoolFullError(
+                f"Too many pending operations ({pending}), retry later"
+            )
+        token = str(uuid.uuid4())
+        self._starting += 1
+        try:
+            await asyncio.to_thread(self._journal.start, token)
+        finally:
+            self._starting -= 1
+        self._logger.info("Operation %s started on component %s", token, component_id)
+        task = asyncio.create_task(self._run(token, operation))
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
+        return token
+
+    async def get_status(self, token: str) -> ProvisioningStatus | None:
+        """Returns the status of an operation, or None if the token is unknown."""
+        return await asyncio.to_thread(self._journal.get, token)
+
+    async def stop(self) -> None:
+        """Cancels every pending operation and waits for them to terminate."""
+        for task in self._tasks:
+            task.cancel()
+        await asyncio.gather(*self._tasks, return_exceptions=True)
+
+    async def _run(self, token: str, operation: Operation) -> None:
+        async with self._workers:
+            try:
+                result = await operation()
+            except asyncio.CancelledError:
+                await asyncio.to_thread(
+                    self._journal.complete,
+                    token,
+                    ProvisioningStatus(
+                        status=Status1.FAILED, result=INTERRUPTED_OPERATION_ERROR
+                    ),
+                )
+                raise
+            except Exception as e:
+                self._logger.exception("Operation %s failed", token)
+                result = SystemErr(error=str(e))
+        await asyncio.to_thread(
+            self._journal.complete, token, self._to_status(result)
+        )
+        self._logger.info("Operation %s terminated", token)
+
+    async def _maybe_purge(self) -> None:
+        now = time.monotonic()
+        if now - self._last_purge >= self._purge_interval_s:
+            self._last_purge = now
+            purged = await asyncio.to_thread(self._journal.purge_expired)
+            self._logger.debug("Purged %s expired operations", purged)
+
+    @staticmethod
+    def _to_status(result: OperationResult) -> ProvisioningStatus:
+        if isinstance(result, ProvisioningStatus):
+            return result
+        if isinstance(result, ValidationError):
+            return ProvisioningStatus(
+                status=Status1.FAILED, result="; ".join(result.errors)
+            )
+        return ProvisioningStatus(status=Status1.FAILED, result=result.error)
@@ -1,12 +1,14 @@
+import httpx
 from confluent_kafka.schema_registry import SchemaRegistryError
-from confluent_kafka.schema_registry.schema_registry_client import (
-    Schema,
-    SchemaRegistryClient,
-)
+from opentelemetry import trace
 
-from src.models.service_error import ServiceError
+from src.models.service_error import ServiceError, ServiceTimeoutError
+from src.services.async_schema_registry_client import AsyncSchemaRegistryClient
 from src.settings.kafka_settings import KafkaSettings
 from src.utility.logger import get_logger
+from src.utility.metrics import timed_stage
+
+tracer = trace.get_tracer(__name__)
 
 
 class SchemaRegistryServiceError(ServiceError):
@@ -17,14 +19,23 @@ class SchemaRegistryService:
     def __init__(
         self,
         kafka_settings: KafkaSettings,
+        schema_registry_client: AsyncSchemaRegistryClient | None = None,
     ):
         self.kafka_settings = kafka_settings
-        self.schema_registry_client = SchemaRegistryClient(
-            conf=kafka_settings.schema_registry_client_config
+        self.schema_registry_client = (
+            schema_registry_client
+            if schema_registry_client is not None
+            else AsyncSchemaRegistryClient(
+                conf=kafka_settings.schema_registry_client_config,
+                pool_maxsize=kafka_settings.schema_registry_pool_maxsize,
+                keepalive_expiry_s=kafka_settings.schema_registry_keepalive_expiry_s,
+                timeout_s=kafka_settings.schema_registry_timeout_s,
+            )
         )
         self.logger = get_logger(__name__)
 
-    def register_schema(
+    @timed_stage("register_schema")
+    async def register_schema(
         self,
         subject_name: str,
         schema_type: str,
@@ -44,8 +55,22 @@ class SchemaRegistryService:
             SchemaRegistryServiceError: If schema registration fails.
         """
         try:
-            schema = Schema(schema_str=schema_str, schema_type=schema_type)
-            return self.schema_registry_client.register_schema(subject_name, schema)
+            with tracer.start_as_current_span(
+                "schema_registry.register_schema",
+                attributes={
+                    "schema_registry.subject": subject_name,
+                    "schema_registry.schema_type": schema_type,
+                },
+            ) as span:
+                schema_id = await self.schema_registry_client.register_schema(
+                    subject_name, schema_type, schema_str
+                )
+                span.set_attribute("schema_registry.schema_id", schema_id)
+                return schema_id
+        except httpx.TimeoutException as te:
+            error_message = f"Timed out waiting to register schema for subject {subject_name}. Details: {str(te)}"  # noqa: E501
+            self.logger.exception(error_message)
+            raise ServiceTimeoutError(error_message)
         except SchemaRegistryError as sre:
             error_message = f"Failed to register schema for subject {subject_name}. Details: {sre.error_message}. Code: {sre.error_code}"  # noqa: E501
             self.logger.exception(error_message)
@@ -55,7 +80,8 @@ class SchemaRegistryService:
             self.logger.exception(error_message)
             raise SchemaRegistryServiceError(error_message)
 
-    def delete_subject(
+    @timed_stage("delete_subject")
+    async def delete_subject(
         self,
         subject_name: str,
     ) -> None:
@@ -70,9 +96,13 @@ class SchemaRegistryService:
             SchemaRegistryServiceError: If the subject deletion fails.
         """
         try:
-            self._soft_delete(subject_name)
-            self._hard_delete(subject_name)
+            await self._soft_delete(subject_name)
+            await self._hard_delete(subject_name)
             return None
+        except httpx.TimeoutException as te:
+            error_message = f"Timed out waiting to delete subject {subject_name}. Details: {str(te)}"  # noqa: E501
+            self.logger.exception(error_message)
+            raise ServiceTimeoutError(error_message)
         except SchemaRegistryError as sre:
             error_message = f"Failed to delete subject {subject_name}. Details: {sre.error_message}. Code: {sre.error_code}"  # noqa: E501
             self.logger.exception(error_message)
@@ -84,25 +114,41 @@ class SchemaRegistryService:
             self.logger.exception(error_message)
             raise SchemaRegistryServiceError(error_message)
 
-    def _soft_delete(self, subject_name: str):
-        try:
-            self.schema_registry_client.delete_subject(subject_name)
-            return None
-        except SchemaRegistryError as sre:
-            # 40404 means soft deleted
-            # 40401 means not found
-            if sre.error_code == 40404 or sre.error_code == 40401:
+    async def _soft_delete(self, subject_name: str):
+        with self._delete_span(subject_name, permanent=False) as span:
+            try:
+                await self.schema_registry_client.delete_subject(subject_name)
                 return None
-            else:
-                raise
+            except SchemaRegistryError as sre:
+                # 40404 means soft deleted
+                # 40401 means not found
+                if sre.error_code == 40404 or sre.error_code == 40401:
+                    span.set_attribute("schema_registry.error_code", sre.error_code)
+                    return None
+                else:
+                    raise
 
-    def _hard_delete(self, subject_name: str):
-        try:
-            self.schema_registry_client.delete_subject(subject_name, permanent=True)
-            return None
-        except SchemaRegistryError as sre:
-            # 40401 means not found
-            if sre.error_code == 40401:
+    async def _hard_delete(self, subject_name: str):
+        with self._delete_span(subject_name, permanent=True) as span:
+            try:
+                await self.schema_registry_client.delete_subject(
+                    subject_name, permanent=True
+                )
                 return None
-            else:
-                raise
+            except SchemaRegistryError as sre:
+                # 40401 means not found
+                if sre.error_code == 40401:
+                    span.set_attribute("schema_registry.error_code", sre.error_code)
+                    return None
+                else:
+                    raise
+
+    @staticmethod
+    def _delete_span(subject_name: str, permanent: bool):
+        return tracer.start_as_current_span(
+            "schema_registry.delete_subject",
+            attributes={
+                "schema_registry.subject": subject_name,
+                "schema_registry.permanent": permanent,
+            },
+        )
@@ -0,0 +1,166 @@
+import sqlite3
+import threading
+import time
+import uuid
+import zlib
+
+from src.models.api_models import ProvisioningStatus, Status1
+from src.services.operation_journal import (
+    DEFAULT_OPERATION_TTL_S,
+    INTERRUPTED_OPERATION_ERROR,
+)
+from src.utility.logger import get_logger
+
+DEFAULT_LEASE_S = 30.0
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS operations (
+    token TEXT PRIMARY KEY,
+    status TEXT NOT NULL,
+    updated_at REAL NOT NULL,
+    payload BLOB,
+    owner TEXT NOT NULL
+) WITHOUT ROWID;
+CREATE INDEX IF NOT EXISTS operations_by_update ON operations (status, updated_at);
+CREATE TABLE IF NOT EXISTS owners (
+    owner TEXT PRIMARY KEY,
+    heartbeat_at REAL NOT NULL
+) WITHOUT ROWID;
+"""
+
+
+class SqliteOperationJournal:
+    """Durable operation journal stored in an embedded SQLite database.
+
+    The database runs in WAL mode, so that status lookups are never blocked by the
+    workers recording results, and waits up to `busy_timeout_s` for locks held by
+    other connections instead of failing. Lookups by token use the primary key.
+
+    Only the final status of an operation is stored in the payload, as compressed
+    JSON. The database can be shared by several replicas: each journal instance
+    owns the operations it starts and renews a lease on them every `lease_s / 3`
+    seconds from a background thread. Running operations whose owner closed its
+    journal or did not renew its lease for `lease_s` seconds can no longer complete:
+    every journal marks them as failed when it is opened and when it renews its own
+    lease, so pollers get an answer even if no new operation is submitted.
+    """
+
+    def __init__(
+        self,
+        path: str,
+        ttl_s: float = DEFAULT_OPERATION_TTL_S,
+        lease_s: float = DEFAULT_LEASE_S,
+        busy_timeout_s: float = 5.0,
+    ):
+        self._ttl_s = ttl_s
+        self._lease_s = lease_s
+        self._owner = str(uuid.uuid4())
+        self._lock = threading.Lock()
+        self._logger = get_logger(__name__)
+        self._connection = sqlite3.connect(
+            path,
+            timeout=busy_timeout_s,
+            isolation_level=None,
+            check_same_thread=False,
+        )
+        self._connection.execute("PRAGMA journal_mode=WAL")
+        self._connection.execute("PRAGMA synchronous=NORMAL")
+        self._connection.executescript(_SCHEMA)
+        self._renew_lease()
+        self._closed = threading.Event()
+        self._lease_thread = threading.Thread(
+            target=self._keep_lease, name="operation-journal-lease", daemon=True
+        )
+        self._lease_thread.start()
+
+    def start(self, token: str) -> None:
+        with self._lock:
+            self._connection.execute(
+                "INSERT OR REPLACE INTO operations VALUES (?, ?, ?, NULL, ?)",
+                (token, Status1.RUNNING.value, time.time(), self._owner),
+            )
+
+    def complete(self, token: str, status: ProvisioningStatus) -> None:
+        with self._lock:
+            self._connection.execute(
+                "UPDATE operations SET status = ?, updated_at = ?, payload = ? "
+                "WHERE token = ?",
+                (status.status.value, time.time(), self._encode(status), token),
+            )
+
+    def get(self, token: str) -> ProvisioningStatus | None:
+        with self._lock:
+            row = self._connection.execute(
+                "SELECT status, payload FROM operations "
+                "WHERE token = ? AND (status = ? OR updated_at > ?)",
+                (token, Status1.RUNNING.value, time.time() - self._ttl_s),
+            ).fetchone()
+        if row is None:
+            return None
+        status, payload = row
+        if payload is None:
+            return ProvisioningStatus(status=Status1(status), result="")
+        return self._decode(payload)
+
+    def purge_expired(self) -> int:
+        with self._lock:
+            cursor = self._connection.execute(
+                "DELETE FROM operations WHERE status != ? AND updated_at <= ?",
+                (Status1.RUNNING.value, time.time() - self._ttl_s),
+            )
+        return cursor.rowcount
+
+    def close(self) -> None:
+        self._closed.set()
+        self._lease_thread.join()
+        with self._lock:
+            self._connection.execute(
+                "DELETE FROM owners WHERE owner = ?", (self._owner,)
+            )
+            self._connection.close()
+
+    def _keep_lease(self) -> None:
+        while not self._closed.wait(self._lease_s / 3):
+            try:
+                self._renew_lease()
+            except sqlite3.Error:
+                self._logger.exception("Failed to renew the operation journal lease")
+
+    def _renew_lease(self) -> None:
+        """Renews the lease of this journal and fails the operations of the others
+        whose lease expired."""
+        status = ProvisioningStatus(
+            status=Status1.FAILED, result=INTERRUPTED_OPERATION_ERROR
+        )
+        now = time.time()
+        with self._lock:
+            self._connection.execute(
+                "INSERT OR REPLACE INTO owners VALUES (?, ?)", (self._owner, now)
+            )
+            cursor = self._connection.execute(
+                "UPDATE operations SET status = ?, updated_at = ?, payload = ? "
+                "WHERE status = ? AND owner NOT IN "
+                "(SELECT owner FROM owners WHERE heartbeat_at > ?)",
+                (
+                    status.status.value,
+                    now,
+                    self._encode(status),
+                    Status1.RUNNING.value,
+                    now - self._lease_s,
+                ),
+            )
+            self._connection.execute(
+                "DELETE FROM owners WHERE heartbeat_at <= ?", (now - self._lease_s,)
+            )
+        if cursor.rowcount > 0:
+            self._logger.warning(
+                "Marked %s interrupted operations as failed", cursor.rowcount
+            )
+
+    @staticmethod
+    def _encode(status: ProvisioningStatus) -> bytes:
+        return zlib.compress(status.model_dump_json().encode())
+
+    @staticmethod
+    def _decode(payload: bytes) -> ProvisioningStatus:
+        return ProvisioningStatus.model_validate_json(zlib.decompress(payload))
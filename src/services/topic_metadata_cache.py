@@ -0,0 +1,48 @@
+import threading
+import time
+
+DEFAULT_TOPIC_METADATA_CACHE_TTL_S = 5.0
+
+
+class TopicMetadataCache:
+    """Short-lived, thread-safe cache of topic partition counts keyed by topic name.
+
+    Entries expire after `ttl_s` seconds and must be invalidated by whoever
+    creates, deletes or repartitions the topic.
+    """
+
+    def __init__(self, ttl_s: float = DEFAULT_TOPIC_METADATA_CACHE_TTL_S):
+        self._ttl_s = ttl_s
+        self._entries: dict[str, tuple[float, int]] = {}
+        self._lock = threading.Lock()
+
+    def get(self, topic_name: str) -> int | None:
+        """Returns the cached partition count of a topic.
+
+        Args:
+            topic_name (str): Name of the Kafka topic.
+
+        Returns:
+            int | None: The partition count, or None if the topic is not cached
+            or its entry is expired.
+        """
+        with self._lock:
+            entry = self._entries.get(topic_name)
+            if entry is None:
+                return None
+            expires_at, partition_count = entry
+            if time.monotonic() >= expires_at:
+                del self._entries[topic_name]
+                return None
+            return partition_count
+
+    def set(self, topic_name: str, partition_count: int) -> None:
+        with self._lock:
+            self._entries[topic_name] = (
+                time.monotonic() + self._ttl_s,
+                partition_count,
+            )
+
+    def invalidate(self, topic_name: str) -> None:
+        with self._lock:
+            self._entries.pop(topic_name, None)
@@ -14,6 +14,7 @@ from src.services.principal_mapping_service import (
     PrincipalMappingService,
 )
 from src.utility.logger import get_logger
+from src.utility.metrics import record_service_error
 
 
 class UpdateAclService:
@@ -26,7 +27,7 @@ class UpdateAclService:
         self.acl_service = acl_service
         self._logger = get_logger(__name__)
 
-    def update_acls(
+    async def update_acls(
         self,
         data_product: DataProduct,
         component_id: str,
@@ -41,16 +42,13 @@ class UpdateAclService:
                 self._logger.error(error_msg)
                 return ValidationError(errors=[error_msg])
 
-            self.acl_service.remove_all_acls_for_topic(
-                component_to_provision.specific.topic.name
-            )
+            topic_name = component_to_provision.specific.topic.name
 
             self._logger.info("Mapping identity for %s", data_product.dataProductOwner)
             mapped_identity = self.principal_mapping_service.map_identity(
                 data_product.dataProductOwner
             )
-            self._logger.info("Applying acls to %s", mapped_identity.principal)
-            self.acl_service.apply_acls_to_principals(
+            bindings = AclService.build_acl_bindings(
                 component_to_provision.specific.ownerPermissions, [mapped_identity]
             )
 
@@ -59,14 +57,15 @@ class UpdateAclService:
                 mapped_identity = self.principal_mapping_service.map_identity(
                     witboost_identity
                 )
-                self._logger.info("Applying acls to %s", mapped_identity.principal)
-                self.acl_service.apply_acls_to_principals(
-                    self._generate_acls_for(
-                        component_to_provision.specific.topic.name,
-                        mapped_identity.principal,
-                    ),
-                    [mapped_identity],
+                bindings.extend(
+                    AclService.build_acl_bindings(
+                        self._generate_acls_for(topic_name, mapped_identity.principal),
+                        [mapped_identity],
+                    )
                 )
+
+            self._logger.info("Updating acls for topic %s", topic_name)
+            await self.acl_service.sync_acls_for_topic(topic_name, bindings)
             return ProvisioningStatus(status=Status1.COMPLETED, result="")
         except pydantic.ValidationError as ve:
             error_msg = (
@@ -84,6 +83,7 @@ class UpdateAclService:
             )
             return ValidationError(errors=combined)
         except ServiceError as se:
+            record_service_error(se)
             return SystemErr(error=se.error_msg)
 
     def _generate_acls_for(self, topic: str, principal: str) -> list[KafkaPermission]:
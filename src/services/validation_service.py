@@ -3,8 +3,18 @@ from typing import Annotated, Tuple
 import pydantic
 from fastapi import Depends
 
-from src.dependencies import UnpackedProvisioningRequestDep
-from src.models.api_models import ValidationError
+from src.dependencies import (
+    UnpackedProvisioningRequestDep,
+    get_descriptor_cache,
+    parse_component_descriptor,
+    unpack_provisioning_request,
+)
+from src.models.api_models import (
+    DescriptorKind,
+    ProvisioningRequest,
+    ValidationError,
+    ValidationResult,
+)
 from src.models.data_product_descriptor import DataProduct
 from src.models.kafka_models import KafkaOutputPort
 from src.utility.logger import get_logger
@@ -48,7 +58,97 @@ def validate_kafka_output_port(
     return data_product, component_to_provision
 
 
+def parse_and_validate_kafka_output_port(
+    descriptor: str,
+) -> Tuple[DataProduct, KafkaOutputPort] | ValidationError:
+    """Parses a component descriptor and validates its component as a Kafka output port.
+
+    Successfully validated descriptors are kept in the descriptor cache, so parsing and
+    validating the same descriptor again only costs a hash and a lookup.
+
+    Args:
+        descriptor (str): The YAML component descriptor.
+
+    Returns:
+        Tuple[DataProduct, KafkaOutputPort] | ValidationError: The data product and the
+        component to provision, or the validation errors.
+    """  # noqa: E501
+    descriptor_cache = get_descriptor_cache()
+    cached = descriptor_cache.get(descriptor)
+    if cached is not None:
+        return validate_kafka_output_port((cached.data_product, cached.component_id))
+    result = validate_kafka_output_port(parse_component_descriptor(descriptor))
+    if not isinstance(result, ValidationError):
+        data_product, component = result
+        descriptor_cache.put(descriptor, data_product, component.id)
+    return result
+
+
+async def unpack_and_validate_kafka_output_port(
+    provisioning_request: ProvisioningRequest,
+) -> Tuple[DataProduct, KafkaOutputPort] | ValidationError:
+    if provisioning_request.descriptorKind != DescriptorKind.COMPONENT_DESCRIPTOR:
+        return validate_kafka_output_port(
+            await unpack_provisioning_request(provisioning_request)
+        )
+    return parse_and_validate_kafka_output_port(provisioning_request.descriptor)
+
+
 ValidateKafkaOutputPortDep = Annotated[
     Tuple[DataProduct, KafkaOutputPort] | ValidationError,
-    Depends(validate_kafka_output_port),
+    Depends(unpack_and_validate_kafka_output_port),
 ]
+
+
+def validate_components(data_product: DataProduct) -> ValidationError | None:
+    """Fully validates every component of a data product against its kind.
+
+    Data products are parsed validating only the component to provision, this check
+    reports errors in the other components too.
+
+    Args:
+        data_product (DataProduct): The data product to validate.
+
+    Returns:
+        ValidationError | None: The validation errors, or None if every component is valid.
+    """  # noqa: E501
+    try:
+        data_product.validate_components()
+    except pydantic.ValidationError as ve:
+        error_msg = f"Failed to validate the components of {data_product.id}:"
+        logger.exception(error_msg)
+        combined = [error_msg]
+        combined.extend(
+            map(
+                str,
+                ve.errors(
+                    include_url=False, include_context=False, include_input=False
+                ),
+            )
+        )
+        return ValidationError(errors=combined)
+    except ValueError as e:
+        error_msg = f"Failed to validate the components of {data_product.id}:"
+        logger.exception(error_msg)
+        return ValidationError(errors=[error_msg, str(e)])
+    return None
+
+
+def validate_descriptor(descriptor: str, strict: bool = False) -> ValidationResult:
+    """Validates a component descriptor whose component must be a Kafka output port.
+
+    Args:
+        descriptor (str): The YAML component descriptor.
+        strict (bool): Whether every other component must be valid too.
+
+    Returns:
+        ValidationResult: The outcome of the validation.
+    """
+    request = parse_and_validate_kafka_output_port(descriptor)
+    if isinstance(request, ValidationError):
+        return ValidationResult(valid=False, error=request)
+    if strict:
+        error = validate_components(request[0])
+        if error is not None:
+            return ValidationResult(valid=False, error=error)
+    return ValidationResult(valid=True)
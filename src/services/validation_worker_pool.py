@@ -0,0 +1,134 @@
+import contextvars
+import hashlib
+import threading
+from collections import OrderedDict
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Callable
+
+from src.models.api_models import (
+    Status,
+    ValidationError,
+    ValidationResult,
+    ValidationStatus,
+)
+from src.utility.logger import get_logger
+
+DEFAULT_MAX_WORKERS = 4
+DEFAULT_MAX_RESULTS = 1000
+DEFAULT_MAX_PENDING = 1000
+
+
+class ValidationWorkerPoolFullError(Exception):
+    pass
+
+
+class ValidationWorkerPool:
+    """Validates descriptors on a pool of worker threads and keeps their results.
+
+    The token of a validation is the hash of the descriptor content, so submitting
+    a descriptor that was already validated, or is being validated, reuses that
+    validation instead of parsing the descriptor again. At most `max_pending`
+    validations can be accepted before they complete. At most `max_results`
+    completed validations are kept, the least recently used are evicted first.
+    """
+
+    def __init__(
+        self,
+        validate: Callable[[str], ValidationResult],
+        max_workers: int = DEFAULT_MAX_WORKERS,
+        max_results: int = DEFAULT_MAX_RESULTS,
+        max_pending: int = DEFAULT_MAX_PENDING,
+    ):
+        self._validate = validate
+        self._max_results = max_results
+        self._max_pending = max_pending
+        self._pending = 0
+        self._pending_lock = threading.Lock()
+        self._executor = ThreadPoolExecutor(
+            max_workers=max_workers, thread_name_prefix="validation"
+        )
+        self._validations: OrderedDict[str, Future] = OrderedDict()
+        self._lock = threading.Lock()
+        self._logger = get_logger(__name__)
+
+    def submit(self, descriptor: str) -> str:
+        """Schedules the validation of a descriptor, unless its result is reusable.
+
+        Args:
+            descriptor (str): The descriptor to validate.
+
+        Returns:
+            str: The token to poll the status of the validation.
+
+        Raises:
+            ValidationWorkerPoolFullError: If too many validations are pending.
+        """
+        token = self._hash(descriptor)
+        with self._lock:
+            future = self._validations.get(token)
+            if future is not None and not self._failed(future):
+                self._logger.debug("Reusing validation %s", token)
+                self._validations.move_to_end(token)
+                return token
+            with self._pending_lock:
+                if self._pending >= self._max_pending:
+                    raise ValidationWorkerPoolFullError(
+                        f"Too many pending validations ({self._pending}), retry later"
+                    )
+                self._pending += 1
+            # the worker logs with the context, e.g. the correlation ID, of the request
+            self._validations[token] = self._executor.submit(
+                contextvars.copy_context().run, self._run, descriptor
+            )
+            self._evict()
+        return token
+
+    def get_status(self, token: str) -> ValidationStatus | None:
+        """Returns the status of a validation, or None if the token is unknown."""
+        with self._lock:
+            future = self._validations.get(token)
+            if future is None:
+                return None
+            self._validations.move_to_end(token)
+        if not future.done():
+            return ValidationStatus(status=Status.RUNNING)
+        if self._failed(future):
+            details = (
+                "The validation was cancelled"
+                if future.cancelled()
+                else str(future.exception())
+            )
+            error = ValidationError(
+                errors=["Unable to validate the descriptor.", details]
+            )
+            return ValidationStatus(
+                status=Status.FAILED, result=ValidationResult(valid=False, error=error)
+            )
+        return ValidationStatus(status=Status.COMPLETED, result=future.result())
+
+    def shutdown(self) -> None:
+        """Stops the workers, cancelling the validations not started yet."""
+        self._executor.shutdown(wait=False, cancel_futures=True)
+
+    def _run(self, descriptor: str) -> ValidationResult:
+        try:
+            return self._validate(descriptor)
+        finally:
+            with self._pending_lock:
+                self._pending -= 1
+
+    def _evict(self) -> None:
+        # running validations are never evicted, or their token would be lost
+        for token in list(self._validations.keys()):
+            if len(self._validations) <= self._max_results:
+                return
+            if self._validations[token].done():
+                del self._validations[token]
+
+    @staticmethod
+    def _failed(future: Future) -> bool:
+        return future.done() and (future.cancelled() or future.exception() is not None)
+
+    @staticmethod
+    def _hash(descriptor: str) -> str:
+        return hashlib.blake2b(descriptor.encode(), digest_size=16).hexdigest()
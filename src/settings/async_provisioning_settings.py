@@ -0,0 +1,14 @@
+from pydantic_settings import BaseSettings, SettingsConfigDict
+
+
+class AsyncProvisioningSettings(BaseSettings):
+    enabled: bool = False
+    max_workers: int = 8
+    max_pending: int = 1000
+    status_ttl_s: float = 3600.0
+    journal_path: str | None = None
+    journal_lease_s: float = 30.0
+
+    model_config = SettingsConfigDict(
+        env_file=".env", env_prefix="async_provisioning_", extra="ignore"
+    )
@@ -6,6 +6,14 @@ from pydantic_settings import BaseSettings, SettingsConfigDict
 class KafkaSettings(BaseSettings):
     admin_client_config: dict[str, Any]
     schema_registry_client_config: dict[str, Any]
+    schema_registry_pool_maxsize: int = 10
+    schema_registry_keepalive_expiry_s: float = 30.0
+    topic_metadata_cache_ttl_s: float = 5.0
+    acl_max_bindings_per_request: int = 500
+    admin_request_timeout_s: float = 30.0
+    admin_operation_timeout_s: float = 30.0
+    admin_deadline_s: float = 60.0
+    schema_registry_timeout_s: float = 30.0
 
     model_config = SettingsConfigDict(
         env_file=".env", env_prefix="kafka_", extra="ignore"
@@ -0,0 +1,10 @@
+from pydantic_settings import BaseSettings, SettingsConfigDict
+
+
+class LoggingSettings(BaseSettings):
+    level: str = "INFO"
+    json_format: bool = False
+
+    model_config = SettingsConfigDict(
+        env_file=".env", env_prefix="log_", extra="ignore"
+    )
@@ -0,0 +1,13 @@
+from pydantic_settings import BaseSettings, SettingsConfigDict
+
+
+class RequestLoggingSettings(BaseSettings):
+    enabled: bool = True
+    max_body_bytes: int = 16384
+    sample_rate: float = 1.0
+    route_sample_rates: dict[str, float] = {}
+    content_types: list[str] = ["application/json", "text/", "application/x-yaml"]
+
+    model_config = SettingsConfigDict(
+        env_file=".env", env_prefix="request_logging_", extra="ignore"
+    )
@@ -0,0 +1,11 @@
+from pydantic_settings import BaseSettings, SettingsConfigDict
+
+from src.utility.json_serialization import JsonBackend
+
+
+class ResponseSettings(BaseSettings):
+    json_backend: JsonBackend = JsonBackend.JSON
+
+    model_config = SettingsConfigDict(
+        env_file=".env", env_prefix="response_", extra="ignore"
+    )
@@ -0,0 +1,14 @@
+from pydantic_settings import BaseSettings, SettingsConfigDict
+
+
+class ValidationSettings(BaseSettings):
+    max_workers: int = 4
+    max_results: int = 1000
+    max_pending: int = 1000
+    descriptor_cache_max_bytes: int = 64 * 1024 * 1024
+    descriptor_cache_retained_size_factor: float = 7.0
+    strict: bool = False
+
+    model_config = SettingsConfigDict(
+        env_file=".env", env_prefix="validation_", extra="ignore"
+    )
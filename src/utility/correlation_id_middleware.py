@@ -0,0 +1,57 @@
+import re
+import uuid
+
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from src.utility.logger import correlation_id
+
+CORRELATION_ID_HEADER = "x-correlation-id"
+
+_VALID_CORRELATION_ID = re.compile(r"[A-Za-z0-9._:\-]{1,128}")
+
+
+class CorrelationIdMiddleware:
+    """Pure ASGI middleware assigning a correlation ID to every request.
+
+    The ID is taken from the `X-Correlation-ID` request header when it is valid, and
+    generated otherwise. It is set in the `correlation_id` context variable for the
+    whole request, so it is added to every record logged while serving it, including
+    by the operations it schedules, and returned in the `X-Correlation-ID` response
+    header.
+    """
+
+    def __init__(self, app: ASGIApp):
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        request_id = self._request_id(scope)
+        token = correlation_id.set(request_id)
+
+        async def send_wrapper(message: Message) -> None:
+            if message["type"] == "http.response.start":
+                headers = [
+                    (name, value)
+                    for name, value in message.get("headers", [])
+                    if name.lower() != CORRELATION_ID_HEADER.encode()
+                ]
+                headers.append((CORRELATION_ID_HEADER.encode(), request_id.encode()))
+                message = {**message, "headers": headers}
+            await send(message)
+
+        try:
+            await self.app(scope, receive, send_wrapper)
+        finally:
+            correlation_id.reset(token)
+
+    @staticmethod
+    def _request_id(scope: Scope) -> str:
+        for name, value in scope.get("headers", []):
+            if name.lower() == CORRELATION_ID_HEADER.encode():
+                candidate = value.decode("latin-1")
+                if _VALID_CORRELATION_ID.fullmatch(candidate):
+                    return candidate
+        return uuid.uuid4().hex
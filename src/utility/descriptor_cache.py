@@ -0,0 +1,130 @@
+import hashlib
+import sys
+import threading
+from collections import OrderedDict
+
+from src.models.data_product_descriptor import DataProduct
+from src.utility.metrics import (
+    DESCRIPTOR_CACHE_EVICTIONS,
+    DESCRIPTOR_CACHE_LOOKUPS,
+    DESCRIPTOR_CACHE_SIZE,
+)
+
+DEFAULT_DESCRIPTOR_CACHE_MAX_BYTES = 64 * 1024 * 1024
+# memory retained by a parsed descriptor (the pydantic models and the raw component
+# dicts kept for lazy validation) per byte of descriptor string, measured on the
+# sample descriptors, which retain about 6.3 times their size
+DEFAULT_RETAINED_SIZE_FACTOR = 7.0
+
+
+class CachedDescriptor:
+    """A parsed descriptor: the data product and the ID of the component to provision.
+
+    Components validated against their specific type are memoized by the data
+    product itself, so they are cached along with it."""
+
+    def __init__(self, data_product: DataProduct, component_id: str, size: int):
+        self.data_product = data_product
+        self.component_id = component_id
+        self.size = size
+
+
+class DescriptorCacheStats:
+    def __init__(
+        self, hits: int, misses: int, evictions: int, entries: int, size_bytes: int
+    ):
+        self.hits = hits
+        self.misses = misses
+        self.evictions = evictions
+        self.entries = entries
+        self.size_bytes = size_bytes
+
+
+class DescriptorCache:
+    """Bounded, thread-safe LRU cache of parsed descriptors.
+
+    Entries are keyed by a hash of the raw descriptor string, so the same descriptor
+    sent to different endpoints is parsed only once. The memory retained by each
+    entry is estimated as the size of its descriptor string multiplied by
+    `retained_size_factor`, as the parsed models are proportional to it: when the
+    estimated total exceeds `max_bytes` the least recently used entries are evicted.
+    Hits, misses, evictions and the estimated size are exported as Prometheus
+    metrics.
+    """
+
+    def __init__(
+        self,
+        max_bytes: int = DEFAULT_DESCRIPTOR_CACHE_MAX_BYTES,
+        retained_size_factor: float = DEFAULT_RETAINED_SIZE_FACTOR,
+    ):
+        self._max_bytes = max_bytes
+        self._retained_size_factor = retained_size_factor
+        self._entries: OrderedDict[bytes, CachedDescriptor] = OrderedDict()
+        self._size_bytes = 0
+        self._hits = 0
+        self._misses = 0
+        self._evictions = 0
+        self._lock = threading.Lock()
+
+    def get(self, descriptor: str) -> CachedDescriptor | None:
+        """Returns the parsed descriptor, or None if it is not cached."""
+        key = self._key(descriptor)
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                self._misses += 1
+                DESCRIPTOR_CACHE_LOOKUPS.labels(result="miss").inc()
+                return None
+            self._hits += 1
+            DESCRIPTOR_CACHE_LOOKUPS.labels(result="hit").inc()
+            self._entries.move_to_end(key)
+            return entry
+
+    def put(
+        self, descriptor: str, data_product: DataProduct, component_id: str
+    ) -> CachedDescriptor:
+        """Caches a parsed descriptor and returns its entry.
+
+        Descriptors larger than the whole cache are not cached.
+
+        Args:
+            descriptor (str): The raw descriptor.
+            data_product (DataProduct): The data product parsed from the descriptor.
+            component_id (str): The ID of the component to provision.
+
+        Returns:
+            CachedDescriptor: The cache entry of the descriptor.
+        """
+        key = self._key(descriptor)
+        size = int(sys.getsizeof(descriptor) * self._retained_size_factor)
+        entry = CachedDescriptor(data_product, component_id, size)
+        if entry.size > self._max_bytes:
+            return entry
+        with self._lock:
+            size_before = self._size_bytes
+            previous = self._entries.pop(key, None)
+            if previous is not None:
+                self._size_bytes -= previous.size
+            self._entries[key] = entry
+            self._size_bytes += entry.size
+            while self._size_bytes > self._max_bytes:
+                _, evicted = self._entries.popitem(last=False)
+                self._size_bytes -= evicted.size
+                self._evictions += 1
+                DESCRIPTOR_CACHE_EVICTIONS.inc()
+            DESCRIPTOR_CACHE_SIZE.inc(self._size_bytes - size_before)
+        return entry
+
+    def stats(self) -> DescriptorCacheStats:
+        with self._lock:
+            return DescriptorCacheStats(
+                hits=self._hits,
+                misses=self._misses,
+                evictions=self._evictions,
+                entries=len(self._entries),
+                size_bytes=self._size_bytes,
+            )
+
+    @staticmethod
+    def _key(descriptor: str) -> bytes:
+        return hashlib.blake2b(descriptor.encode(), digest_size=16).digest()
@@ -0,0 +1,77 @@
+import asyncio
+import concurrent.futures
+import functools
+from typing import Any, Mapping
+
+from opentelemetry import trace
+
+from src.models.service_error import ServiceTimeoutError
+
+
+async def wait_for_futures(
+    fs: Mapping[Any, concurrent.futures.Future], timeout: float, stage: str
+) -> None:
+    """
+    Wait concurrently for all the futures of a batch under a single deadline, without blocking the event loop.
+
+    The futures returned by the AdminClient are completed by librdkafka threads, so they
+    are bridged into asyncio instead of being waited on from a worker thread. Once this
+    function returns every future is done, so calling `result()` on them does not block
+    anymore.
+
+    If a span is being recorded, a `future.done` event is added to it as soon as each
+    future completes, so that the round trip of every request shows up in the trace.
+
+    Args:
+        fs (Mapping[Any, Future]): The futures to wait for, e.g. the dictionary
+            returned by an AdminClient operation.
+        timeout (float): The deadline in seconds for the whole batch.
+        stage (str): A description of the operation, used in the error message.
+
+    Raises:
+        ServiceTimeoutError: If some futures are not done before the deadline.
+    """  # noqa: E501
+    if len(fs) == 0:
+        return None
+    span = trace.get_current_span()
+    waiters = []
+    for key, future in fs.items():
+        waiter = asyncio.wrap_future(future)
+        if span.is_recording():
+            waiter.add_done_callback(functools.partial(_add_done_event, span, key))
+        waiters.append(waiter)
+    done, pending = await asyncio.wait(waiters, timeout=timeout)
+    # the results are read from the original futures: mark the failures of the
+    # asyncio wrappers as retrieved, so that they are not logged as unhandled
+    for waiter in done:
+        if not waiter.cancelled():
+            waiter.exception()
+    not_done = [future for future in fs.values() if not future.done()]
+    if len(not_done) > 0:
+        span.add_event(
+            "future.timeout",
+            attributes={"future.pending": len(not_done), "future.total": len(fs)},
+        )
+        for waiter in pending:
+            waiter.cancel()
+        for future in not_done:
+            future.cancel()
+        raise ServiceTimeoutError(
+            f"Timed out after {timeout} seconds waiting to {stage}. "
+            f"{len(not_done)} of {len(fs)} operations did not complete."
+        )
+
+
+def _add_done_event(span: trace.Span, key: Any, waiter: asyncio.Future) -> None:
+    # cancelled futures may complete after the span has ended
+    if not span.is_recording():
+        return None
+    if waiter.cancelled():
+        outcome = "cancelled"
+    elif waiter.exception() is not None:
+        outcome = "error"
+    else:
+        outcome = "success"
+    span.add_event(
+        "future.done", attributes={"future.key": str(key), "future.outcome": outcome}
+    )
@@ -0,0 +1,72 @@
+import json
+from enum import StrEnum
+from typing import Any, Callable
+
+import pydantic_core
+from pydantic import BaseModel
+
+from src.utility.logger import get_logger
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - orjson is an optional dependency
+    orjson = None  # type: ignore[assignment]
+
+logger = get_logger(__name__)
+
+
+class JsonBackend(StrEnum):
+    # byte-identical to json.dumps(jsonable_encoder(model)), the historical output
+    JSON = "json"
+    # compact JSON written by pydantic-core, without the Python round trip
+    PYDANTIC = "pydantic"
+    # compact JSON written by orjson, if installed
+    ORJSON = "orjson"
+
+
+def _dumps_json(content: Any) -> bytes:
+    return json.dumps(content).encode("utf-8")
+
+
+def _dumps_orjson(content: Any) -> bytes:
+    return orjson.dumps(content)
+
+
+def serializer(backend: JsonBackend) -> Callable[[BaseModel | list[BaseModel]], bytes]:
+    """
+    Returns the function serializing response models with the given backend.
+
+    Every backend produces the same JSON document, only the whitespace and the
+    escaping of non-ASCII characters differ. The default `json` backend produces
+    exactly the bytes of `json.dumps(jsonable_encoder(model))`: pydantic-core converts
+    the model to JSON-compatible values, then `json.dumps` writes them. Only the
+    opt-in `pydantic` backend writes the JSON in a single pydantic-core pass.
+
+    Args:
+        backend (JsonBackend): The serialization backend.
+
+    Returns:
+        Callable[[BaseModel | list[BaseModel]], bytes]: The serialization function.
+    """
+    if backend == JsonBackend.ORJSON and orjson is None:
+        logger.warning("orjson is not installed, falling back to the json backend")
+        backend = JsonBackend.JSON
+
+    if backend == JsonBackend.PYDANTIC:
+
+        def serialize_pydantic(out_response: BaseModel | list[BaseModel]) -> bytes:
+            if isinstance(out_response, BaseModel):
+                return out_response.model_dump_json(by_alias=True).encode("utf-8")
+            return pydantic_core.to_json(out_response)
+
+        return serialize_pydantic
+
+    dumps = _dumps_orjson if backend == JsonBackend.ORJSON else _dumps_json
+
+    def serialize(out_response: BaseModel | list[BaseModel]) -> bytes:
+        if isinstance(out_response, BaseModel):
+            # jsonable_encoder dumps models by alias
+            return dumps(out_response.model_dump(mode="json", by_alias=True))
+        return dumps([item.model_dump(mode="json") for item in out_response])
+
+    return serialize
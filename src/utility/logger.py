@@ -1,13 +1,118 @@
+import atexit
+import contextvars
+import json
 import logging
+import logging.handlers
+import queue
+import threading
+from datetime import datetime, timezone
+
+from src.settings.logging_settings import LoggingSettings
+
+TEXT_FORMAT = "%(asctime)s [%(levelname)s] %(name)s [%(correlation_id)s] - %(message)s"
+TEXT_DATE_FORMAT = "%d-%b-%y %H:%M"
+
+# ID of the request being served, added to every log record as `correlation_id`
+correlation_id: contextvars.ContextVar[str | None] = contextvars.ContextVar(
+    "correlation_id", default=None
+)
+
+_configure_lock = threading.RLock()
+_listener: logging.handlers.QueueListener | None = None
+
+
+class CorrelationIdFilter(logging.Filter):
+    def filter(self, record: logging.LogRecord) -> bool:
+        record.correlation_id = correlation_id.get() or "-"
+        return True
+
+
+class JsonFormatter(logging.Formatter):
+    """Formats each record as a single-line JSON object."""
+
+    def format(self, record: logging.LogRecord) -> str:
+        entry = {
+            "timestamp": datetime.fromtimestamp(
+                record.created, timezone.utc
+            ).isoformat(),
+            "level": record.levelname,
+            "logger": record.name,
+            "message": record.getMessage(),
+            "correlation_id": getattr(record, "correlation_id", "-"),
+            "thread": record.threadName,
+        }
+        if record.exc_info and not record.exc_text:
+            record.exc_text = self.formatException(record.exc_info)
+        if record.exc_text:
+            entry["exception"] = record.exc_text
+        return json.dumps(entry, ensure_ascii=False)
+
+
+class _QueueHandler(logging.handlers.QueueHandler):
+    # keeps the exception apart from the message, so that the formatter of the
+    # listener decides how to render it
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        record = logging.makeLogRecord(record.__dict__)
+        record.msg = record.getMessage()
+        record.args = None
+        if record.exc_info:
+            record.exc_text = logging.Formatter().formatException(record.exc_info)
+            record.exc_info = None
+        return record
+
+
+def configure_logging(settings: LoggingSettings | None = None) -> None:
+    """
+    Configures the root logger, replacing its handlers.
+
+    Records are put in a queue by the threads logging them and written by a
+    dedicated listener thread, so logging never blocks on I/O. Each record is
+    enriched with the correlation ID of the request being served.
+
+    Args:
+        settings (LoggingSettings | None): The logging settings, read from the
+            environment if not provided.
+    """
+    global _listener
+    settings = settings if settings is not None else LoggingSettings()
+    with _configure_lock:
+        if _listener is not None:
+            _listener.stop()
+
+        stream_handler = logging.StreamHandler()
+        stream_handler.setFormatter(
+            JsonFormatter()
+            if settings.json_format
+            else logging.Formatter(TEXT_FORMAT, TEXT_DATE_FORMAT)
+        )
+        log_queue: queue.SimpleQueue = queue.SimpleQueue()
+        queue_handler = _QueueHandler(log_queue)
+        queue_handler.addFilter(CorrelationIdFilter())
+
+        root = logging.getLogger()
+        for handler in root.handlers[:]:
+            root.removeHandler(handler)
+            handler.close()
+        root.addHandler(queue_handler)
+        root.setLevel(settings.level.upper())
+
+        _listener = logging.handlers.QueueListener(log_queue, stream_handler)
+        _listener.start()
+
+
+def _stop_logging() -> None:
+    with _configure_lock:
+        if _listener is not None:
+            _listener.stop()
+
+
+atexit.register(_stop_logging)
 
 
 def get_logger(name=""):
-    default_log_args = {
-        "level": logging.INFO,
-        "format": "%(asctime)s [%(levelname)s] %(name)s - %(message)s",
-        "datefmt": "%d-%b-%y %H:%M",
-        "force": True,
-    }
-    logging.basicConfig(**default_log_args)
+    if _listener is None:
+        with _configure_lock:
+            if _listener is None:
+                configure_logging()
     logger = logging.getLogger(name)
     return logger
@@ -0,0 +1,77 @@
+import functools
+import time
+from typing import Any, Awaitable, Callable, TypeVar
+
+from prometheus_client import Counter, Gauge, Histogram
+
+from src.models.service_error import ServiceError
+
+F = TypeVar("F", bound=Callable[..., Awaitable[Any]])
+
+REQUEST_DURATION = Histogram(
+    "http_request_duration_seconds",
+    "Duration of the HTTP requests, by route template",
+    ["method", "route", "status"],
+)
+REQUESTS_IN_FLIGHT = Gauge(
+    "http_requests_in_flight", "HTTP requests being served", ["method"]
+)
+STAGE_DURATION = Histogram(
+    "provisioning_stage_duration_seconds",
+    "Duration of the provisioning stages",
+    ["stage", "outcome"],
+    buckets=(0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0, 60.0),
+)
+SERVICE_ERRORS = Counter(
+    "service_errors_total",
+    "Service errors returned to the clients, by error type",
+    ["error"],
+)
+
+DESCRIPTOR_CACHE_LOOKUPS = Counter(
+    "descriptor_cache_lookups_total",
+    "Lookups of parsed descriptors in the descriptor cache, by result",
+    ["result"],
+)
+DESCRIPTOR_CACHE_EVICTIONS = Counter(
+    "descriptor_cache_evictions_total",
+    "Parsed descriptors evicted from the descriptor cache",
+)
+DESCRIPTOR_CACHE_SIZE = Gauge(
+    "descriptor_cache_size_bytes",
+    "Estimated memory retained by the parsed descriptors in the descriptor cache",
+)
+
+
+def timed_stage(stage: str) -> Callable[[F], F]:
+    """
+    Decorator recording the duration of an async function in the
+    `provisioning_stage_duration_seconds` histogram, labelled with the stage name and
+    whether it succeeded or raised an error.
+
+    Args:
+        stage (str): The name of the stage.
+    """
+
+    def decorator(function: F) -> F:
+        @functools.wraps(function)
+        async def wrapper(*args, **kwargs):
+            start = time.perf_counter()
+            outcome = "error"
+            try:
+                result = await function(*args, **kwargs)
+                outcome = "success"
+                return result
+            finally:
+                STAGE_DURATION.labels(stage=stage, outcome=outcome).observe(
+                    time.perf_counter() - start
+                )
+
+        return wrapper  # type: ignore[return-value]
+
+    return decorator
+
+
+def record_service_error(error: ServiceError) -> None:
+    """Counts a service error returned to a client, by its `ServiceError` subclass."""
+    SERVICE_ERRORS.labels(error=type(error).__name__).inc()
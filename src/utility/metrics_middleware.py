@@ -0,0 +1,46 @@
+import time
+
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from src.utility.metrics import REQUEST_DURATION, REQUESTS_IN_FLIGHT
+
+UNMATCHED_ROUTE = "<unmatched>"
+
+
+class MetricsMiddleware:
+    """Pure ASGI middleware recording the duration and the number of HTTP requests
+    in flight.
+
+    Durations are labelled with the route template, e.g. `/v2/validate/{token}/status`,
+    rather than the path, so that the number of series stays bounded.
+    """
+
+    def __init__(self, app: ASGIApp):
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        method = scope["method"]
+        status_code = 500
+
+        async def send_wrapper(message: Message) -> None:
+            nonlocal status_code
+            if message["type"] == "http.response.start":
+                status_code = message["status"]
+            await send(message)
+
+        start = time.perf_counter()
+        in_flight = REQUESTS_IN_FLIGHT.labels(method=method)
+        in_flight.inc()
+        try:
+            await self.app(scope, receive, send_wrapper)
+        finally:
+            in_flight.dec()
+            # the router stores the matched route in the scope
+            route = getattr(scope.get("route"), "path", None) or UNMATCHED_ROUTE
+            REQUEST_DURATION.labels(
+                method=method, route=route, status=str(status_code)
+            ).observe(time.perf_counter() - start)
@@ -1,10 +1,10 @@
-from typing import Type, TypeVar
+from typing import Any, Type, TypeVar
 
-import yaml
 from pydantic import BaseModel
 
 from src.models.api_models import ValidationError
 from src.utility.logger import get_logger
+from src.utility.yaml_loader import load_yaml
 
 logger = get_logger()
 
@@ -12,7 +12,9 @@ logger = get_logger()
 T = TypeVar("T", bound=BaseModel)
 
 
-def parse_yaml_with_model(yaml_data: dict | str, model: Type[T]) -> T | ValidationError:
+def parse_yaml_with_model(
+    yaml_data: dict | str, model: Type[T], context: dict[str, Any] | None = None
+) -> T | ValidationError:
     """
     Parse YAML data using a Pydantic model.
 
@@ -24,6 +26,7 @@ def parse_yaml_with_model(yaml_data: dict | str, model: Type[T]) -> T | Validati
         yaml_data (dict | str): YAML data to be parsed. This can be either a dictionary
             or a YAML string.
         model (Type[T]): The Pydantic model class to use for parsing.
+        context (dict[str, Any] | None): Optional context passed to the model validators.
 
     Returns:
         T | ValidationError: An instance of the Pydantic model with data from yaml_data,
@@ -57,11 +60,14 @@ def parse_yaml_with_model(yaml_data: dict | str, model: Type[T]) -> T | Validati
     """  # noqa: E501
     try:
         if isinstance(yaml_data, str):
-            yaml_dict = yaml.safe_load(yaml_data)
+            yaml_dict = load_yaml(yaml_data)
         else:
             yaml_dict = yaml_data
 
-        data = model(**yaml_dict)
+        if context is None:
+            data = model(**yaml_dict)
+        else:
+            data = model.model_validate(yaml_dict, context=context)
         return data
     except ValueError as e:
         logger.error(f"Validation error: {e}")
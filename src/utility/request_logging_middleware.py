@@ -0,0 +1,149 @@
+import asyncio
+import random
+from typing import Callable
+
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from src.utility.logger import get_logger
+
+logger = get_logger()
+
+DEFAULT_MAX_BODY_BYTES = 16384
+
+
+class BodyCapture:
+    """Keeps the first `max_bytes` bytes of a body passing through in chunks."""
+
+    def __init__(self, max_bytes: int, enabled: bool = True):
+        self.max_bytes = max_bytes
+        self.enabled = enabled
+        self.total_bytes = 0
+        self._chunks: list[bytes] = []
+        self._captured_bytes = 0
+
+    def add(self, chunk: bytes) -> None:
+        self.total_bytes += len(chunk)
+        if not self.enabled or self._captured_bytes >= self.max_bytes:
+            return
+        chunk = chunk[: self.max_bytes - self._captured_bytes]
+        self._chunks.append(chunk)
+        self._captured_bytes += len(chunk)
+
+    def text(self) -> str:
+        if not self.enabled:
+            return f"<{self.total_bytes} bytes not logged>"
+        text = b"".join(self._chunks).decode("utf-8", errors="replace")
+        truncated = self.total_bytes - self._captured_bytes
+        if truncated > 0:
+            text += f"... [truncated {truncated} bytes]"
+        return text
+
+
+def log_info(req_body: str, res_code: int, res_body: str) -> None:
+    # both records carry the correlation ID of the request
+    logger.info("REQUEST: %s", req_body)
+    logger.info("RESPONSE(%s): %s", res_code, res_body)
+
+
+class RequestLoggingMiddleware:
+    """Pure ASGI middleware logging the body of requests and responses.
+
+    Body chunks are copied as they pass through, so neither the request nor the
+    response is buffered and streaming responses keep streaming. At most
+    `max_body_bytes` bytes of each body are kept, the rest is only counted; bodies
+    whose content type does not start with one of `content_types` are not kept at
+    all. Requests are logged with probability `sample_rate`, or with the rate set
+    for their route (the path template, e.g. `/v2/validate/{token}/status`) in
+    `route_sample_rates`.
+
+    The log records are emitted after the last chunk of the response is sent, so
+    logging never delays the response.
+    """
+
+    def __init__(
+        self,
+        app: ASGIApp,
+        enabled: bool = True,
+        max_body_bytes: int = DEFAULT_MAX_BODY_BYTES,
+        sample_rate: float = 1.0,
+        route_sample_rates: dict[str, float] | None = None,
+        content_types: list[str] | None = None,
+        log: Callable[[str, int, str], None] = log_info,
+    ):
+        self.app = app
+        self.enabled = enabled
+        self.max_body_bytes = max_body_bytes
+        self.sample_rate = sample_rate
+        self.route_sample_rates = route_sample_rates or {}
+        self.content_types = tuple(content_types) if content_types else None
+        self.log = log
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http" or not self.enabled:
+            await self.app(scope, receive, send)
+            return
+
+        request_body = BodyCapture(
+            self.max_body_bytes, self._loggable(scope.get("headers", []))
+        )
+        response_body = BodyCapture(self.max_body_bytes)
+        status_code = 500
+
+        async def receive_wrapper() -> Message:
+            message = await receive()
+            if message["type"] == "http.request":
+                request_body.add(message.get("body", b""))
+            return message
+
+        async def send_wrapper(message: Message) -> None:
+            nonlocal status_code
+            if message["type"] == "http.response.start":
+                status_code = message["status"]
+                response_body.enabled = self._loggable(message.get("headers", []))
+            elif message["type"] == "http.response.body":
+                response_body.add(message.get("body", b""))
+            await send(message)
+            if message["type"] == "http.response.body" and not message.get(
+                "more_body", False
+            ):
+                self._schedule_log(scope, request_body, status_code, response_body)
+
+        await self.app(scope, receive_wrapper, send_wrapper)
+
+    def _loggable(self, headers: list[tuple[bytes, bytes]]) -> bool:
+        if self.content_types is None:
+            return True
+        for name, value in headers:
+            if name.lower() == b"content-type":
+                return value.decode("latin-1").lower().startswith(self.content_types)
+        # requests without a body have no content type
+        return True
+
+    def _sampled(self, scope: Scope) -> bool:
+        # the router stores the matched route in the scope, so the sample rate can
+        # be chosen by path template once the request has been handled
+        route = scope.get("route")
+        path = str(getattr(route, "path", None) or scope.get("path", ""))
+        rate = self.route_sample_rates.get(path, self.sample_rate)
+        return rate >= 1.0 or random.random() < rate
+
+    def _schedule_log(
+        self,
+        scope: Scope,
+        request_body: BodyCapture,
+        status_code: int,
+        response_body: BodyCapture,
+    ) -> None:
+        if not self._sampled(scope):
+            return
+        asyncio.get_running_loop().call_soon(
+            self._log, request_body, status_code, response_body
+        )
+
+    def _log(
+        self, request_body: BodyCapture, status_code: int, response_body: BodyCapture
+    ) -> None:
+        try:
+            self.log(request_body.text(), status_code, response_body.text())
+        except Exception:
+            logger.exception("Unable to log the request")
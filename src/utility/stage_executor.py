@@ -0,0 +1,87 @@
+import asyncio
+from typing import Any, Callable, Coroutine, Iterable
+
+StageResults = dict[str, Any]
+
+
+class Stage:
+    """A named unit of work that runs once all the stages it depends on succeeded.
+
+    Args:
+        name (str): Unique name of the stage, used to reference its result.
+        run (Callable[[StageResults], Coroutine]): Coroutine function that
+            receives the results of the stages it depends on, keyed by stage name.
+        depends_on (Iterable[str]): Names of the stages that must complete first.
+    """
+
+    def __init__(
+        self,
+        name: str,
+        run: Callable[[StageResults], Coroutine[Any, Any, Any]],
+        depends_on: Iterable[str] = (),
+    ):
+        self.name = name
+        self.run = run
+        self.depends_on = tuple(depends_on)
+
+
+async def run_stages(stages: list[Stage]) -> StageResults:
+    """
+    Run a dependency graph of stages, as concurrently as the dependencies allow.
+
+    Each stage is started as soon as all of its dependencies completed, so the total
+    latency is that of the longest dependency chain. As soon as a stage fails no new
+    stage is started, the stages still running are cancelled and the error is raised.
+
+    Args:
+        stages (list[Stage]): The stages to run.
+
+    Returns:
+        StageResults: The result of every stage, keyed by stage name.
+
+    Raises:
+        ValueError: If stage names are duplicated, or dependencies are unknown or cyclic.
+        Exception: The error raised by the first stage that failed.
+    """  # noqa: E501
+    _check_graph(stages)
+    pending = {stage.name: stage for stage in stages}
+    running: dict[asyncio.Task, str] = {}
+    results: StageResults = {}
+    try:
+        while len(pending) > 0 or len(running) > 0:
+            for name, stage in list(pending.items()):
+                if all(dep in results for dep in stage.depends_on):
+                    del pending[name]
+                    dep_results = {dep: results[dep] for dep in stage.depends_on}
+                    running[asyncio.create_task(stage.run(dep_results))] = name
+            done, _ = await asyncio.wait(
+                running.keys(), return_when=asyncio.FIRST_COMPLETED
+            )
+            for task in done:
+                results[running.pop(task)] = task.result()
+        return results
+    finally:
+        for task in running:
+            task.cancel()
+        if len(running) > 0:
+            await asyncio.gather(*running, return_exceptions=True)
+
+
+def _check_graph(stages: list[Stage]) -> None:
+    names = [stage.name for stage in stages]
+    if len(set(names)) != len(names):
+        raise ValueError(f"Duplicated stage names in {names}")
+    for stage in stages:
+        unknown = [dep for dep in stage.depends_on if dep not in names]
+        if len(unknown) > 0:
+            raise ValueError(f"Stage {stage.name} depends on unknown stages {unknown}")
+    resolved: set[str] = set()
+    remaining = list(stages)
+    while len(remaining) > 0:
+        ready = [s for s in remaining if all(d in resolved for d in s.depends_on)]
+        if len(ready) == 0:
+            raise ValueError(
+                f"Cyclic dependencies between stages {[s.name for s in remaining]}"
+            )
+        resolved.update(s.name for s in ready)
+        remaining = [s for s in remaining if s.name not in resolved]
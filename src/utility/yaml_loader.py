@@ -0,0 +1,25 @@
+from typing import Any
+
+import yaml
+
+# The libyaml-backed loader only replaces the scanner and the parser, the
+# constructor is the same `SafeConstructor`, so both loaders build the same objects
+# (timestamps, anchors and merge keys included). libyaml may be missing when PyYAML
+# is built without it, in that case the pure-Python loader is used.
+SafeLoader: type[yaml.SafeLoader] = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+
+
+def load_yaml(data: str | bytes) -> Any:
+    """
+    Parses a YAML document like `yaml.safe_load`, using libyaml when available.
+
+    Args:
+        data (str | bytes): The YAML document.
+
+    Returns:
+        Any: The Python object built from the document.
+
+    Raises:
+        yaml.YAMLError: If the document is not valid YAML.
+    """
+    return yaml.load(data, Loader=SafeLoader)
@@ -0,0 +1,20 @@
+import pytest
+from opentelemetry import trace
+from opentelemetry.sdk.trace import TracerProvider
+from opentelemetry.sdk.trace.export import SimpleSpanProcessor
+from opentelemetry.sdk.trace.export.in_memory_span_exporter import (
+    InMemorySpanExporter,
+)
+
+# the global tracer provider can only be set once per process
+_span_exporter = InMemorySpanExporter()
+_tracer_provider = TracerProvider()
+_tracer_provider.add_span_processor(SimpleSpanProcessor(_span_exporter))
+trace.set_tracer_provider(_tracer_provider)
+
+
+@pytest.fixture
+def span_exporter():
+    _span_exporter.clear()
+    yield _span_exporter
+    _span_exporter.clear()
@@ -1,9 +1,13 @@
+from concurrent.futures import Future
 from unittest import mock
 
 import pytest
 from confluent_kafka import KafkaError, KafkaException
+from confluent_kafka.admin import AclBindingFilter
+from prometheus_client import REGISTRY
 
 from src.models.kafka_models import KafkaPermission
+from src.models.service_error import ServiceTimeoutError
 from src.services.acl_service import AclService, AclServiceError
 from src.services.principal_mapping_service import KafkaPrincipal
 from src.settings.kafka_settings import KafkaSettings
@@ -25,78 +29,271 @@ acls = [
 principals = [KafkaPrincipal("User:my_user")]
 
 
-class FakeFutureResultOk:
-    def result(self):
-        return None
+def FakeFutureResultOk(value=None):
+    future = Future()
+    future.set_result(value)
+    return future
 
 
-class FakeFutureResultError:
-    def __init__(self, error):
-        self.error = error
-
-    def result(self):
-        raise self.error
+def FakeFutureResultError(error):
+    future = Future()
+    future.set_exception(error)
+    return future
 
 
 @mock.patch("src.services.acl_service.AdminClient")
-def test_apply_acls_to_principals_ok(mock_admin_client):
+@pytest.mark.asyncio
+async def test_apply_acls_to_principals_ok(mock_admin_client):
     acl_service = AclService(kafka_settings)
     mock_admin_client.return_value.create_acls.return_value = {"": FakeFutureResultOk()}
 
-    res = acl_service.apply_acls_to_principals(acls, principals)
+    res = await acl_service.apply_acls_to_principals(acls, principals)
 
     assert res is None
 
 
 @mock.patch("src.services.acl_service.AdminClient")
-def test_apply_acls_to_principals_error(mock_admin_client):
+@pytest.mark.asyncio
+async def test_apply_acls_to_principals_error(mock_admin_client):
     acl_service = AclService(kafka_settings)
     mock_admin_client.return_value.create_acls.return_value = {
         "": FakeFutureResultError(ValueError("error"))
     }
 
     with pytest.raises(AclServiceError):
-        acl_service.apply_acls_to_principals(acls, principals)
+        await acl_service.apply_acls_to_principals(acls, principals)
 
 
 @mock.patch("src.services.acl_service.AdminClient")
-def test_apply_acls_to_principals_kafka_error(mock_admin_client):
+@pytest.mark.asyncio
+async def test_apply_acls_to_principals_kafka_error(mock_admin_client):
     acl_service = AclService(kafka_settings)
     mock_admin_client.return_value.create_acls.return_value = {
         "": FakeFutureResultError(KafkaException(KafkaError(-1)))
     }
 
     with pytest.raises(AclServiceError):
-        acl_service.apply_acls_to_principals(acls, principals)
+        await acl_service.apply_acls_to_principals(acls, principals)
 
 
 @mock.patch("src.services.acl_service.AdminClient")
-def test_remove_all_acls_for_topic_ok(mock_admin_client):
+@pytest.mark.asyncio
+async def test_remove_all_acls_for_topic_ok(mock_admin_client):
     acl_service = AclService(kafka_settings)
     mock_admin_client.return_value.delete_acls.return_value = {"": FakeFutureResultOk()}
 
-    res = acl_service.remove_all_acls_for_topic(topic_name)
+    res = await acl_service.remove_all_acls_for_topic(topic_name)
 
     assert res is None
 
 
 @mock.patch("src.services.acl_service.AdminClient")
-def test_remove_all_acls_for_topic_error(mock_admin_client):
+@pytest.mark.asyncio
+async def test_remove_all_acls_for_topic_error(mock_admin_client):
     acl_service = AclService(kafka_settings)
     mock_admin_client.return_value.delete_acls.return_value = {
         "": FakeFutureResultError(ValueError("error"))
     }
 
     with pytest.raises(AclServiceError):
-        acl_service.remove_all_acls_for_topic(topic_name)
+        await acl_service.remove_all_acls_for_topic(topic_name)
 
 
 @mock.patch("src.services.acl_service.AdminClient")
-def test_remove_all_acls_for_topic_kafka_error(mock_admin_client):
+@pytest.mark.asyncio
+async def test_remove_all_acls_for_topic_kafka_error(mock_admin_client):
     acl_service = AclService(kafka_settings)
     mock_admin_client.return_value.delete_acls.return_value = {
         "": FakeFutureResultError(KafkaException(KafkaError(-1)))
     }
 
     with pytest.raises(AclServiceError):
-        acl_service.remove_all_acls_for_topic(topic_name)
+        await acl_service.remove_all_acls_for_topic(topic_name)
+
+
+def test_build_acl_bindings():
+    bindings = AclService.build_acl_bindings(
+        acls, [KafkaPrincipal("User:a"), KafkaPrincipal("User:b")]
+    )
+
+    assert [(b.name, b.principal, b.host) for b in bindings] == [
+        (topic_name, "User:a", "*"),
+        (topic_name, "User:b", "*"),
+    ]
+
+
+def test_build_acl_bindings_invalid_acl():
+    invalid_acls = [acls[0].model_copy(update={"operation": "NOT_AN_OPERATION"})]
+
+    with pytest.raises(AclServiceError):
+        AclService.build_acl_bindings(invalid_acls, principals)
+
+
+@mock.patch("src.services.acl_service.AdminClient")
+@pytest.mark.asyncio
+async def test_sync_acls_for_topic_applies_delta(mock_admin_client):
+    acl_service = AclService(kafka_settings)
+    kept, removed = AclService.build_acl_bindings(
+        acls, [KafkaPrincipal("User:kept"), KafkaPrincipal("User:removed")]
+    )
+    (added,) = AclService.build_acl_bindings(acls, [KafkaPrincipal("User:added")])
+    mock_admin_client.return_value.describe_acls.return_value = FakeFutureResultOk(
+        [kept, removed]
+    )
+    mock_admin_client.return_value.create_acls.return_value = {
+        added: FakeFutureResultOk()
+    }
+    mock_admin_client.return_value.delete_acls.return_value = {"": FakeFutureResultOk()}
+
+    res = await acl_service.sync_acls_for_topic(topic_name, [kept, added, added])
+
+    assert res is None
+    mock_admin_client.return_value.create_acls.assert_called_once()
+    assert mock_admin_client.return_value.create_acls.call_args.args == ([added],)
+    mock_admin_client.return_value.delete_acls.assert_called_once()
+    (filters,) = mock_admin_client.return_value.delete_acls.call_args.args
+    assert len(filters) == 1
+    assert isinstance(filters[0], AclBindingFilter)
+    assert filters[0].principal == "User:removed"
+
+
+@mock.patch("src.services.acl_service.AdminClient")
+@pytest.mark.asyncio
+async def test_sync_acls_for_topic_no_changes(mock_admin_client):
+    acl_service = AclService(kafka_settings)
+    bindings = AclService.build_acl_bindings(acls, principals)
+    mock_admin_client.return_value.describe_acls.return_value = FakeFutureResultOk(
+        bindings
+    )
+
+    labels = {"stage": "sync_acls_for_topic", "outcome": "success"}
+    timed = REGISTRY.get_sample_value("provisioning_stage_duration_seconds_count", labels)
+
+    res = await acl_service.sync_acls_for_topic(topic_name, bindings)
+
+    assert res is None
+    assert not mock_admin_client.return_value.create_acls.called
+    assert not mock_admin_client.return_value.delete_acls.called
+    assert REGISTRY.get_sample_value(
+        "provisioning_stage_duration_seconds_count", labels
+    ) == (timed or 0.0) + 1
+
+
+@mock.patch("src.services.acl_service.AdminClient")
+@pytest.mark.asyncio
+async def test_sync_acls_for_topic_describe_error(mock_admin_client):
+    acl_service = AclService(kafka_settings)
+    mock_admin_client.return_value.describe_acls.return_value = FakeFutureResultError(
+        KafkaException(KafkaError(-1))
+    )
+
+    with pytest.raises(AclServiceError):
+        await acl_service.sync_acls_for_topic(
+            topic_name, AclService.build_acl_bindings(acls, principals)
+        )
+
+    assert not mock_admin_client.return_value.create_acls.called
+    assert not mock_admin_client.return_value.delete_acls.called
+
+
+@mock.patch("src.services.acl_service.AdminClient")
+@pytest.mark.asyncio
+async def test_sync_acls_for_topic_create_error(mock_admin_client):
+    acl_service = AclService(kafka_settings)
+    mock_admin_client.return_value.describe_acls.return_value = FakeFutureResultOk([])
+    mock_admin_client.return_value.create_acls.return_value = {
+        "": FakeFutureResultError(ValueError("error"))
+    }
+
+    with pytest.raises(AclServiceError):
+        await acl_service.sync_acls_for_topic(
+            topic_name, AclService.build_acl_bindings(acls, principals)
+        )
+
+    assert not mock_admin_client.return_value.delete_acls.called
+
+
+@mock.patch("src.services.acl_service.AdminClient")
+@pytest.mark.asyncio
+async def test_apply_acls_to_principals_chunked(mock_admin_client):
+    acl_service = AclService(
+        KafkaSettings(
+            admin_client_config=dict(),
+            schema_registry_client_config=dict(),
+            acl_max_bindings_per_request=2,
+        )
+    )
+    many_principals = [KafkaPrincipal(f"User:user{i}") for i in range(5)]
+    mock_admin_client.return_value.create_acls.side_effect = lambda bindings, **_: {
+        b: FakeFutureResultOk() for b in bindings
+    }
+
+    res = await acl_service.apply_acls_to_principals(acls, many_principals)
+
+    assert res is None
+    assert [
+        len(c.args[0])
+        for c in mock_admin_client.return_value.create_acls.call_args_list
+    ] == [2, 2, 1]
+
+
+@mock.patch("src.services.acl_service.AdminClient")
+@pytest.mark.asyncio
+async def test_apply_acls_to_principals_aggregated_errors(mock_admin_client):
+    acl_service = AclService(kafka_settings)
+    many_principals = [KafkaPrincipal(f"User:user{i}") for i in range(3)]
+    bindings = AclService.build_acl_bindings(acls, many_principals)
+    mock_admin_client.return_value.create_acls.return_value = {
+        bindings[0]: FakeFutureResultError(KafkaException(KafkaError(-1))),
+        bindings[1]: FakeFutureResultOk(),
+        bindings[2]: FakeFutureResultError(ValueError("error")),
+    }
+
+    with pytest.raises(AclServiceError) as e:
+        await acl_service.apply_acls_to_principals(acls, many_principals)
+
+    assert e.value.error_msg.startswith("Failed to create 2 of 3 acls.")
+    assert "User:user0" in e.value.error_msg
+    assert "User:user1" not in e.value.error_msg
+    assert "User:user2" in e.value.error_msg
+
+
+@mock.patch("src.services.acl_service.AdminClient")
+@pytest.mark.asyncio
+async def test_remove_all_acls_for_topic_timeout(mock_admin_client):
+    acl_service = AclService(
+        KafkaSettings(
+            admin_client_config=dict(),
+            schema_registry_client_config=dict(),
+            admin_deadline_s=0.01,
+        )
+    )
+    mock_admin_client.return_value.delete_acls.return_value = {"": Future()}
+
+    with pytest.raises(ServiceTimeoutError) as e:
+        await acl_service.remove_all_acls_for_topic(topic_name)
+
+    assert "remove acls for topic topic_name" in e.value.error_msg
+
+
+@mock.patch("src.services.acl_service.AdminClient")
+@pytest.mark.asyncio
+async def test_apply_acls_to_principals_span(mock_admin_client, span_exporter):
+    acl_service = AclService(kafka_settings)
+    mock_admin_client.return_value.create_acls.return_value = {
+        "a": FakeFutureResultOk(),
+        "b": FakeFutureResultError(ValueError("error")),
+    }
+
+    with pytest.raises(AclServiceError):
+        await acl_service.apply_acls_to_principals(
+            acls, principals + [KafkaPrincipal("User:other_user")]
+        )
+
+    (span,) = span_exporter.get_finished_spans()
+    assert span.name == "kafka.create_acls"
+    assert span.attributes["kafka.acl_bindings"] == 2
+    assert span.attributes["kafka.requests"] == 1
+    assert span.attributes["kafka.acl_failures"] == 1
+    assert not span.status.is_ok
+    assert len([e for e in span.events if e.name == "future.done"]) == 2
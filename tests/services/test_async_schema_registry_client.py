@@ -0,0 +1,146 @@
+import json
+
+import httpx
+import pytest
+from confluent_kafka.schema_registry import SchemaRegistryError
+
+from src.services.async_schema_registry_client import AsyncSchemaRegistryClient
+
+config = {"url": "http://localhost:8081"}
+
+
+def make_client(handler, **kwargs):
+    return AsyncSchemaRegistryClient(
+        config, transport=httpx.MockTransport(handler), **kwargs
+    )
+
+
+@pytest.mark.asyncio
+async def test_register_schema_ok():
+    requests = []
+
+    def handler(request):
+        requests.append(request)
+        return httpx.Response(200, json={"id": 7})
+
+    client = make_client(handler)
+
+    res = await client.register_schema("my topic-value", "JSON", "{}")
+
+    assert res == 7
+    assert requests[0].method == "POST"
+    assert requests[0].url.raw_path == b"/subjects/my%20topic-value/versions"
+    assert json.loads(requests[0].content) == {"schema": "{}", "schemaType": "JSON"}
+
+
+@pytest.mark.asyncio
+async def test_register_schema_avro_omits_schema_type():
+    requests = []
+
+    def handler(request):
+        requests.append(request)
+        return httpx.Response(200, json={"id": 1})
+
+    client = make_client(handler)
+
+    await client.register_schema("subject", "AVRO", '"string"')
+
+    assert json.loads(requests[0].content) == {"schema": '"string"'}
+
+
+@pytest.mark.asyncio
+async def test_register_schema_cached():
+    requests = []
+
+    def handler(request):
+        requests.append(request)
+        return httpx.Response(200, json={"id": len(requests)})
+
+    client = make_client(handler, cache_capacity=1)
+
+    first = await client.register_schema("subject", "JSON", "{}")
+    second = await client.register_schema("subject", "JSON", "{}")
+    await client.register_schema("other", "JSON", "{}")
+    third = await client.register_schema("subject", "JSON", "{}")
+
+    assert first == second == 1
+    assert third == 3
+    assert len(requests) == 3
+
+
+@pytest.mark.asyncio
+async def test_register_schema_error():
+    def handler(request):
+        return httpx.Response(
+            409, json={"error_code": 409, "message": "Incompatible schema"}
+        )
+
+    client = make_client(handler)
+
+    with pytest.raises(SchemaRegistryError) as e:
+        await client.register_schema("subject", "JSON", "{}")
+
+    assert e.value.http_status_code == 409
+    assert e.value.error_code == 409
+    assert e.value.error_message == "Incompatible schema"
+
+
+@pytest.mark.asyncio
+async def test_register_schema_unknown_error():
+    def handler(request):
+        return httpx.Response(502, text="Bad gateway")
+
+    client = make_client(handler)
+
+    with pytest.raises(SchemaRegistryError) as e:
+        await client.register_schema("subject", "JSON", "{}")
+
+    assert e.value.error_code == -1
+
+
+@pytest.mark.asyncio
+async def test_delete_subject_permanent_invalidates_cache():
+    requests = []
+
+    def handler(request):
+        requests.append(request)
+        if request.method == "POST":
+            return httpx.Response(200, json={"id": 1})
+        return httpx.Response(200, json=[1])
+
+    client = make_client(handler)
+    await client.register_schema("subject", "JSON", "{}")
+
+    res = await client.delete_subject("subject", permanent=True)
+    await client.register_schema("subject", "JSON", "{}")
+
+    assert res == [1]
+    assert requests[1].method == "DELETE"
+    assert requests[1].url.params["permanent"] == "true"
+    assert len(requests) == 3
+
+
+def test_basic_auth():
+    client = AsyncSchemaRegistryClient(
+        {**config, "basic.auth.user.info": "user:pass:word"}
+    )
+
+    assert (
+        client._http_client.auth._auth_header
+        == httpx.BasicAuth("user", "pass:word")._auth_header
+    )
+
+
+@pytest.mark.parametrize(
+    "conf",
+    [
+        {},
+        {"url": "http://a:8081,http://b:8081"},
+        {**config, "basic.auth.user.info": "user"},
+        {**config, "ssl.key.location": "key.pem"},
+        {**config, "unknown.property": "value"},
+    ],
+)
+def test_invalid_config(conf):
+    with pytest.raises(ValueError):
+        AsyncSchemaRegistryClient(conf)
@@ -0,0 +1,188 @@
+import time
+from concurrent.futures import ThreadPoolExecutor
+from unittest import mock
+
+import pytest
+from confluent_kafka import KafkaError, KafkaException
+
+from src.services.client_registry import ClientRegistry
+
+config = {"bootstrap.servers": "localhost:9092"}
+
+
+class FakeFutureResultOk:
+    def result(self, timeout=None):
+        return None
+
+
+class FakeFutureResultError:
+    def __init__(self, error):
+        self.error = error
+
+    def result(self, timeout=None):
+        raise self.error
+
+
+@mock.patch("src.services.client_registry.AdminClient")
+def test_get_admin_client_reuses_client(mock_admin_client):
+    client_registry = ClientRegistry()
+
+    first = client_registry.get_admin_client(config)
+    second = client_registry.get_admin_client(dict(config))
+
+    assert first is second
+    assert mock_admin_client.call_count == 1
+
+
+@mock.patch("src.services.client_registry.AdminClient")
+def test_get_admin_client_one_client_per_config(mock_admin_client):
+    mock_admin_client.side_effect = lambda conf: mock.Mock()
+    client_registry = ClientRegistry()
+
+    first = client_registry.get_admin_client(config)
+    second = client_registry.get_admin_client({"bootstrap.servers": "other:9092"})
+
+    assert first is not second
+    assert mock_admin_client.call_count == 2
+
+
+@mock.patch("src.services.client_registry.AdminClient")
+def test_get_admin_client_recreated_after_fatal_error(mock_admin_client):
+    mock_admin_client.side_effect = lambda conf: mock.Mock()
+    client_registry = ClientRegistry()
+    first = client_registry.get_admin_client(config)
+    error_cb = mock_admin_client.call_args.args[0]["error_cb"]
+
+    error_cb(KafkaError(KafkaError._FATAL, fatal=True))
+    second = client_registry.get_admin_client(config)
+
+    assert first is not second
+    assert mock_admin_client.call_count == 2
+
+
+@mock.patch("src.services.client_registry.AdminClient")
+def test_get_admin_client_not_recreated_after_non_fatal_error(mock_admin_client):
+    client_registry = ClientRegistry()
+    client_registry.get_admin_client(config)
+    error_cb = mock_admin_client.call_args.args[0]["error_cb"]
+
+    error_cb(KafkaError(KafkaError._ALL_BROKERS_DOWN))
+    client_registry.get_admin_client(config)
+
+    assert mock_admin_client.call_count == 1
+
+
+@mock.patch("src.services.client_registry.AdminClient")
+def test_get_admin_client_calls_user_error_cb(mock_admin_client):
+    user_error_cb = mock.Mock()
+    client_registry = ClientRegistry()
+    client_registry.get_admin_client({**config, "error_cb": user_error_cb})
+    error_cb = mock_admin_client.call_args.args[0]["error_cb"]
+    err = KafkaError(KafkaError._ALL_BROKERS_DOWN)
+
+    error_cb(err)
+
+    user_error_cb.assert_called_once_with(err)
+
+
+@mock.patch("src.services.client_registry.AdminClient")
+def test_get_admin_client_health_check_ok(mock_admin_client):
+    mock_admin_client.return_value.describe_cluster.return_value = FakeFutureResultOk()
+    client_registry = ClientRegistry(health_check_interval_s=0)
+
+    client_registry.get_admin_client(config)
+    client_registry.get_admin_client(config)
+
+    assert mock_admin_client.call_count == 1
+    assert mock_admin_client.return_value.describe_cluster.called
+
+
+@mock.patch("src.services.client_registry.AdminClient")
+def test_get_admin_client_health_check_failed(mock_admin_client):
+    clients = [mock.Mock(), mock.Mock()]
+    clients[0].describe_cluster.return_value = FakeFutureResultError(
+        KafkaException(KafkaError(KafkaError._TRANSPORT))
+    )
+    mock_admin_client.side_effect = clients
+    client_registry = ClientRegistry(health_check_interval_s=0)
+
+    client = client_registry.get_admin_client(config)
+
+    assert client is clients[1]
+    assert mock_admin_client.call_count == 2
+
+
+class SlowFutureResultError(FakeFutureResultError):
+    def result(self, timeout=None):
+        time.sleep(0.1)
+        raise self.error
+
+
+@mock.patch("src.services.client_registry.AdminClient")
+def test_get_admin_client_health_check_failed_concurrently(mock_admin_client):
+    clients = [mock.Mock(), mock.Mock()]
+    clients[0].describe_cluster.return_value = SlowFutureResultError(
+        KafkaException(KafkaError(KafkaError._TRANSPORT))
+    )
+    mock_admin_client.side_effect = clients
+    client_registry = ClientRegistry(health_check_interval_s=0.05)
+    client_registry.get_admin_client(config)
+    time.sleep(0.1)
+
+    with ThreadPoolExecutor(max_workers=8) as executor:
+        results = list(
+            executor.map(lambda _: client_registry.get_admin_client(config), range(8))
+        )
+
+    assert all(client is clients[1] for client in results)
+    assert clients[0].describe_cluster.call_count == 1
+    assert mock_admin_client.call_count == 2
+
+
+@mock.patch("src.services.client_registry.AdminClient")
+@pytest.mark.asyncio
+async def test_close(mock_admin_client):
+    client_registry = ClientRegistry()
+    client_registry.get_admin_client(config)
+
+    await client_registry.close()
+
+    with pytest.raises(RuntimeError):
+        client_registry.get_admin_client(config)
+
+
+def test_get_schema_registry_client_reuses_client():
+    client_registry = ClientRegistry()
+    sr_config = {"url": "http://localhost:8081"}
+
+    first = client_registry.get_schema_registry_client(sr_config)
+    second = client_registry.get_schema_registry_client(dict(sr_config))
+
+    assert first is second
+
+
+def test_get_schema_registry_client_bounded_pool():
+    client_registry = ClientRegistry()
+
+    client = client_registry.get_schema_registry_client(
+        {"url": "http://localhost:8081"}, pool_maxsize=5, timeout_s=10.0
+    )
+
+    http_client = client._http_client
+    assert http_client.timeout.read == 10.0
+    assert http_client._transport._pool._max_connections == 5
+    assert http_client._transport._pool._max_keepalive_connections == 5
+
+
+@pytest.mark.asyncio
+async def test_close_schema_registry_client():
+    client_registry = ClientRegistry()
+    client = client_registry.get_schema_registry_client(
+        {"url": "http://localhost:8081"}
+    )
+
+    await client_registry.close()
+
+    assert client._http_client.is_closed
+    with pytest.raises(RuntimeError):
+        client_registry.get_schema_registry_client({"url": "http://localhost:8081"})
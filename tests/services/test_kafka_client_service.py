@@ -1,12 +1,15 @@
+from concurrent.futures import Future
 from unittest import mock
 
 import pytest
 from confluent_kafka import KafkaError, KafkaException
 
+from src.models.service_error import ServiceTimeoutError
 from src.services.kafka_client_service import (
     KafkaClientService,
     KafkaClientServiceError,
 )
+from src.services.topic_metadata_cache import TopicMetadataCache
 from src.settings.kafka_settings import KafkaSettings
 
 kafka_settings = KafkaSettings(
@@ -15,37 +18,41 @@ kafka_settings = KafkaSettings(
 topic_name = "topic_name"
 
 
-class FakeTopic:
+class FakeTopicDescription:
     def __init__(self, name, partitions=1):
-        self.topic = name
+        self.name = name
         self.partitions = list(range(1, partitions + 1))
 
 
-class FakeListTopics:
-    def __init__(self, name=None, partitions=1):
-        self.topics = dict() if name is None else {name: FakeTopic(name, partitions)}
+def FakeFutureResultOk(value=None):
+    future = Future()
+    future.set_result(value)
+    return future
 
 
-class FakeFutureResultOk:
-    def result(self):
-        return None
+def FakeFutureResultError(error):
+    future = Future()
+    future.set_exception(error)
+    return future
 
 
-class FakeFutureResultError:
-    def __init__(self, error):
-        self.error = error
-
-    def result(self):
-        raise self.error
+def fake_describe_topics(name, partitions=None):
+    if partitions is None:
+        return {
+            name: FakeFutureResultError(
+                KafkaException(KafkaError(KafkaError.UNKNOWN_TOPIC_OR_PART))
+            )
+        }
+    return {name: FakeFutureResultOk(FakeTopicDescription(name, partitions))}
 
 
 @mock.patch("src.services.kafka_client_service.AdminClient")
-def test_create_or_update_topic_ok(mock_admin_client):
+@pytest.mark.asyncio
+async def test_create_or_update_topic_ok(mock_admin_client):
     kafka_client_service = KafkaClientService(kafka_settings)
-    mock_admin_client.return_value.list_topics.side_effect = [
-        FakeListTopics(),
-        FakeListTopics(name=topic_name),
-    ]
+    mock_admin_client.return_value.describe_topics.return_value = fake_describe_topics(
+        topic_name
+    )
     mock_admin_client.return_value.create_topics.return_value = {
         topic_name: FakeFutureResultOk()
     }
@@ -53,16 +60,19 @@ def test_create_or_update_topic_ok(mock_admin_client):
         topic_name: FakeFutureResultOk()
     }
 
-    res = kafka_client_service.create_or_update_topic(topic_name, 1, 1, dict())
+    res = await kafka_client_service.create_or_update_topic(topic_name, 1, 1, dict())
 
-    assert res is None
+    assert res == []
 
 
 @mock.patch("src.services.kafka_client_service.AdminClient")
-def test_create_or_update_topic_already_exist_increase_partitions(mock_admin_client):
+@pytest.mark.asyncio
+async def test_create_or_update_topic_already_exist_increase_partitions(
+    mock_admin_client,
+):
     kafka_client_service = KafkaClientService(kafka_settings)
-    mock_admin_client.return_value.list_topics.return_value = FakeListTopics(
-        name=topic_name
+    mock_admin_client.return_value.describe_topics.return_value = fake_describe_topics(
+        topic_name, partitions=1
     )
     mock_admin_client.return_value.create_partitions.return_value = {
         topic_name: FakeFutureResultOk()
@@ -71,23 +81,24 @@ def test_create_or_update_topic_already_exist_increase_partitions(mock_admin_cli
         topic_name: FakeFutureResultOk()
     }
 
-    res = kafka_client_service.create_or_update_topic(topic_name, 3, 1, dict())
+    res = await kafka_client_service.create_or_update_topic(topic_name, 3, 1, dict())
 
-    assert res is None
+    assert res == []
     assert not mock_admin_client.return_value.create_topics.called
 
 
 @mock.patch("src.services.kafka_client_service.AdminClient")
-def test_create_or_update_topic_already_exist_decrease_partitions_error(
+@pytest.mark.asyncio
+async def test_create_or_update_topic_already_exist_decrease_partitions_error(
     mock_admin_client,
 ):
     kafka_client_service = KafkaClientService(kafka_settings)
-    mock_admin_client.return_value.list_topics.return_value = FakeListTopics(
-        name=topic_name, partitions=3
+    mock_admin_client.return_value.describe_topics.return_value = fake_describe_topics(
+        topic_name, partitions=3
     )
 
     with pytest.raises(KafkaClientServiceError) as e:
-        kafka_client_service.create_or_update_topic(topic_name, 1, 1, dict())
+        await kafka_client_service.create_or_update_topic(topic_name, 1, 1, dict())
 
     assert (
         e.value.error_msg
@@ -98,79 +109,371 @@ def test_create_or_update_topic_already_exist_decrease_partitions_error(
 
 
 @mock.patch("src.services.kafka_client_service.AdminClient")
-def test_create_or_update_topic_error(mock_admin_client):
+@pytest.mark.asyncio
+async def test_create_or_update_topic_error(mock_admin_client):
     kafka_client_service = KafkaClientService(kafka_settings)
-    mock_admin_client.return_value.list_topics.return_value = FakeListTopics()
+    mock_admin_client.return_value.describe_topics.return_value = fake_describe_topics(
+        topic_name
+    )
     mock_admin_client.return_value.create_topics.return_value = {
         topic_name: FakeFutureResultError(ValueError("error"))
     }
 
     with pytest.raises(KafkaClientServiceError):
-        kafka_client_service.create_or_update_topic(topic_name, 1, 1, dict())
+        await kafka_client_service.create_or_update_topic(topic_name, 1, 1, dict())
 
 
 @mock.patch("src.services.kafka_client_service.AdminClient")
-def test_create_or_update_topic_kafka_error(mock_admin_client):
+@pytest.mark.asyncio
+async def test_create_or_update_topic_kafka_error(mock_admin_client):
     kafka_client_service = KafkaClientService(kafka_settings)
-    mock_admin_client.return_value.list_topics.return_value = FakeListTopics()
+    mock_admin_client.return_value.describe_topics.return_value = fake_describe_topics(
+        topic_name
+    )
     mock_admin_client.return_value.create_topics.return_value = {
         topic_name: FakeFutureResultError(KafkaException(KafkaError(-1)))
     }
 
     with pytest.raises(KafkaClientServiceError):
-        kafka_client_service.create_or_update_topic(topic_name, 1, 1, dict())
+        await kafka_client_service.create_or_update_topic(topic_name, 1, 1, dict())
 
 
 @mock.patch("src.services.kafka_client_service.AdminClient")
-def test_delete_topic_not_existing_ok(mock_admin_client):
+@pytest.mark.asyncio
+async def test_delete_topic_not_existing_ok(mock_admin_client):
     kafka_client_service = KafkaClientService(kafka_settings)
-    mock_admin_client.return_value.list_topics.return_value = FakeListTopics()
+    mock_admin_client.return_value.describe_topics.return_value = fake_describe_topics(
+        topic_name
+    )
 
-    res = kafka_client_service.delete_topic(topic_name)
+    res = await kafka_client_service.delete_topic(topic_name)
 
     assert res is None
     assert not mock_admin_client.return_value.delete_topics.called
 
 
 @mock.patch("src.services.kafka_client_service.AdminClient")
-def test_delete_topic_existing_ok(mock_admin_client):
+@pytest.mark.asyncio
+async def test_delete_topic_existing_ok(mock_admin_client):
     kafka_client_service = KafkaClientService(kafka_settings)
-    mock_admin_client.return_value.list_topics.return_value = FakeListTopics(
-        name=topic_name
+    mock_admin_client.return_value.describe_topics.return_value = fake_describe_topics(
+        topic_name, partitions=1
     )
     mock_admin_client.return_value.delete_topics.return_value = {
         topic_name: FakeFutureResultOk()
     }
 
-    res = kafka_client_service.delete_topic(topic_name)
+    res = await kafka_client_service.delete_topic(topic_name)
 
     assert res is None
     assert mock_admin_client.return_value.delete_topics.called
 
 
 @mock.patch("src.services.kafka_client_service.AdminClient")
-def test_delete_topic_existing_error(mock_admin_client):
+@pytest.mark.asyncio
+async def test_delete_topic_existing_error(mock_admin_client):
     kafka_client_service = KafkaClientService(kafka_settings)
-    mock_admin_client.return_value.list_topics.return_value = FakeListTopics(
-        name=topic_name
+    mock_admin_client.return_value.describe_topics.return_value = fake_describe_topics(
+        topic_name, partitions=1
     )
     mock_admin_client.return_value.delete_topics.return_value = {
         topic_name: FakeFutureResultError(ValueError("error"))
     }
 
     with pytest.raises(KafkaClientServiceError):
-        kafka_client_service.delete_topic(topic_name)
+        await kafka_client_service.delete_topic(topic_name)
 
 
 @mock.patch("src.services.kafka_client_service.AdminClient")
-def test_delete_topic_existing_kafka_error(mock_admin_client):
+@pytest.mark.asyncio
+async def test_delete_topic_existing_kafka_error(mock_admin_client):
     kafka_client_service = KafkaClientService(kafka_settings)
-    mock_admin_client.return_value.list_topics.return_value = FakeListTopics(
-        name=topic_name
+    mock_admin_client.return_value.describe_topics.return_value = fake_describe_topics(
+        topic_name, partitions=1
     )
     mock_admin_client.return_value.delete_topics.return_value = {
         topic_name: FakeFutureResultError(KafkaException(KafkaError(-1)))
     }
 
     with pytest.raises(KafkaClientServiceError):
-        kafka_client_service.delete_topic(topic_name)
+        await kafka_client_service.delete_topic(topic_name)
+
+
+@mock.patch("src.services.kafka_client_service.AdminClient")
+@pytest.mark.asyncio
+async def test_create_or_update_topic_single_metadata_request(mock_admin_client):
+    kafka_client_service = KafkaClientService(kafka_settings)
+    mock_admin_client.return_value.describe_topics.return_value = fake_describe_topics(
+        topic_name
+    )
+    mock_admin_client.return_value.create_topics.return_value = {
+        topic_name: FakeFutureResultOk()
+    }
+    mock_admin_client.return_value.alter_configs.return_value = {
+        topic_name: FakeFutureResultOk()
+    }
+
+    await kafka_client_service.create_or_update_topic(topic_name, 3, 1, dict())
+
+    mock_admin_client.return_value.describe_topics.assert_called_once()
+    assert not mock_admin_client.return_value.create_partitions.called
+    assert not mock_admin_client.return_value.list_topics.called
+
+
+@mock.patch("src.services.kafka_client_service.AdminClient")
+@pytest.mark.asyncio
+async def test_create_or_update_topic_uses_metadata_cache(mock_admin_client):
+    topic_metadata_cache = TopicMetadataCache(ttl_s=60)
+    topic_metadata_cache.set(topic_name, 3)
+    kafka_client_service = KafkaClientService(
+        kafka_settings, topic_metadata_cache=topic_metadata_cache
+    )
+    mock_admin_client.return_value.alter_configs.return_value = {
+        topic_name: FakeFutureResultOk()
+    }
+
+    await kafka_client_service.create_or_update_topic(topic_name, 3, 1, dict())
+
+    assert not mock_admin_client.return_value.describe_topics.called
+    assert not mock_admin_client.return_value.create_topics.called
+    assert not mock_admin_client.return_value.create_partitions.called
+
+
+@mock.patch("src.services.kafka_client_service.AdminClient")
+@pytest.mark.asyncio
+async def test_create_or_update_topic_increase_partitions_invalidates_cache(
+    mock_admin_client,
+):
+    topic_metadata_cache = TopicMetadataCache(ttl_s=60)
+    topic_metadata_cache.set(topic_name, 1)
+    kafka_client_service = KafkaClientService(
+        kafka_settings, topic_metadata_cache=topic_metadata_cache
+    )
+    mock_admin_client.return_value.create_partitions.return_value = {
+        topic_name: FakeFutureResultOk()
+    }
+    mock_admin_client.return_value.alter_configs.return_value = {
+        topic_name: FakeFutureResultOk()
+    }
+
+    await kafka_client_service.create_or_update_topic(topic_name, 3, 1, dict())
+
+    assert mock_admin_client.return_value.create_partitions.called
+    assert topic_metadata_cache.get(topic_name) is None
+
+
+@mock.patch("src.services.kafka_client_service.AdminClient")
+@pytest.mark.asyncio
+async def test_create_or_update_topic_metadata_kafka_error(mock_admin_client):
+    kafka_client_service = KafkaClientService(kafka_settings)
+    mock_admin_client.return_value.describe_topics.return_value = {
+        topic_name: FakeFutureResultError(
+            KafkaException(KafkaError(KafkaError.TOPIC_AUTHORIZATION_FAILED))
+        )
+    }
+
+    with pytest.raises(KafkaClientServiceError):
+        await kafka_client_service.create_or_update_topic(topic_name, 1, 1, dict())
+
+    assert not mock_admin_client.return_value.create_topics.called
+
+
+@mock.patch("src.services.kafka_client_service.AdminClient")
+@pytest.mark.asyncio
+async def test_delete_topic_invalidates_cache(mock_admin_client):
+    topic_metadata_cache = TopicMetadataCache(ttl_s=60)
+    topic_metadata_cache.set(topic_name, 1)
+    kafka_client_service = KafkaClientService(
+        kafka_settings, topic_metadata_cache=topic_metadata_cache
+    )
+    mock_admin_client.return_value.delete_topics.return_value = {
+        topic_name: FakeFutureResultOk()
+    }
+
+    await kafka_client_service.delete_topic(topic_name)
+
+    assert mock_admin_client.return_value.delete_topics.called
+    assert topic_metadata_cache.get(topic_name) is None
+
+
+class FakeConfigEntry:
+    def __init__(self, value):
+        self.value = value
+
+
+@mock.patch("src.services.kafka_client_service.AdminClient")
+@pytest.mark.asyncio
+async def test_create_or_update_topic_new_topic_with_config(mock_admin_client):
+    kafka_client_service = KafkaClientService(kafka_settings)
+    mock_admin_client.return_value.describe_topics.return_value = fake_describe_topics(
+        topic_name
+    )
+    mock_admin_client.return_value.create_topics.return_value = {
+        topic_name: FakeFutureResultOk()
+    }
+
+    res = await kafka_client_service.create_or_update_topic(
+        topic_name, 1, 1, {"retention.ms": 1000, "cleanup.policy": "compact"}
+    )
+
+    assert res == ["cleanup.policy", "retention.ms"]
+    new_topic = mock_admin_client.return_value.create_topics.call_args.args[0][0]
+    assert new_topic.config == {"retention.ms": "1000", "cleanup.policy": "compact"}
+    assert not mock_admin_client.return_value.describe_configs.called
+    assert not mock_admin_client.return_value.incremental_alter_configs.called
+
+
+@mock.patch("src.services.kafka_client_service.AdminClient")
+@pytest.mark.asyncio
+async def test_create_or_update_topic_config_changed(mock_admin_client):
+    kafka_client_service = KafkaClientService(kafka_settings)
+    mock_admin_client.return_value.describe_topics.return_value = fake_describe_topics(
+        topic_name, partitions=1
+    )
+    mock_admin_client.return_value.describe_configs.return_value = {
+        topic_name: FakeFutureResultOk(
+            {
+                "retention.ms": FakeConfigEntry("1000"),
+                "cleanup.policy": FakeConfigEntry("delete"),
+                "unclean.leader.election.enable": FakeConfigEntry("false"),
+            }
+        )
+    }
+    mock_admin_client.return_value.incremental_alter_configs.return_value = {
+        topic_name: FakeFutureResultOk()
+    }
+
+    res = await kafka_client_service.create_or_update_topic(
+        topic_name,
+        1,
+        1,
+        {
+            "retention.ms": 1000,
+            "cleanup.policy": "compact",
+            "unclean.leader.election.enable": False,
+        },
+    )
+
+    assert res == ["cleanup.policy"]
+    resource = mock_admin_client.return_value.incremental_alter_configs.call_args.args[
+        0
+    ][0]
+    assert [(c.name, c.value) for c in resource.incremental_configs] == [
+        ("cleanup.policy", "compact")
+    ]
+    assert not mock_admin_client.return_value.alter_configs.called
+
+
+@mock.patch("src.services.kafka_client_service.AdminClient")
+@pytest.mark.asyncio
+async def test_create_or_update_topic_config_unchanged(mock_admin_client):
+    kafka_client_service = KafkaClientService(kafka_settings)
+    mock_admin_client.return_value.describe_topics.return_value = fake_describe_topics(
+        topic_name, partitions=1
+    )
+    mock_admin_client.return_value.describe_configs.return_value = {
+        topic_name: FakeFutureResultOk({"retention.ms": FakeConfigEntry("1000")})
+    }
+
+    res = await kafka_client_service.create_or_update_topic(
+        topic_name, 1, 1, {"retention.ms": 1000}
+    )
+
+    assert res == []
+    assert not mock_admin_client.return_value.incremental_alter_configs.called
+    assert not mock_admin_client.return_value.alter_configs.called
+
+
+@mock.patch("src.services.kafka_client_service.AdminClient")
+@pytest.mark.asyncio
+async def test_create_or_update_topic_config_error(mock_admin_client):
+    kafka_client_service = KafkaClientService(kafka_settings)
+    mock_admin_client.return_value.describe_topics.return_value = fake_describe_topics(
+        topic_name, partitions=1
+    )
+    mock_admin_client.return_value.describe_configs.return_value = {
+        topic_name: FakeFutureResultOk({"retention.ms": FakeConfigEntry("1000")})
+    }
+    mock_admin_client.return_value.incremental_alter_configs.return_value = {
+        topic_name: FakeFutureResultError(KafkaException(KafkaError(-1)))
+    }
+
+    with pytest.raises(KafkaClientServiceError):
+        await kafka_client_service.create_or_update_topic(
+            topic_name, 1, 1, {"retention.ms": 2000}
+        )
+
+
+@mock.patch("src.services.kafka_client_service.AdminClient")
+@pytest.mark.asyncio
+async def test_create_or_update_topic_timeout(mock_admin_client):
+    kafka_client_service = KafkaClientService(
+        KafkaSettings(
+            admin_client_config=dict(),
+            schema_registry_client_config=dict(),
+            admin_deadline_s=0.01,
+        )
+    )
+    mock_admin_client.return_value.describe_topics.return_value = fake_describe_topics(
+        topic_name
+    )
+    mock_admin_client.return_value.create_topics.return_value = {topic_name: Future()}
+
+    with pytest.raises(ServiceTimeoutError) as e:
+        await kafka_client_service.create_or_update_topic(topic_name, 1, 1, dict())
+
+    assert "create topic topic_name" in e.value.error_msg
+    _, kwargs = mock_admin_client.return_value.create_topics.call_args
+    assert kwargs == {"operation_timeout": 30.0, "request_timeout": 30.0}
+
+
+@mock.patch("src.services.kafka_client_service.AdminClient")
+@pytest.mark.asyncio
+async def test_create_or_update_topic_spans(mock_admin_client, span_exporter):
+    kafka_client_service = KafkaClientService(kafka_settings)
+    mock_admin_client.return_value.describe_topics.return_value = fake_describe_topics(
+        topic_name
+    )
+    mock_admin_client.return_value.create_topics.return_value = {
+        topic_name: FakeFutureResultOk()
+    }
+
+    await kafka_client_service.create_or_update_topic(
+        topic_name, 3, 2, {"cleanup.policy": "compact"}
+    )
+
+    describe_span, create_span = span_exporter.get_finished_spans()
+    assert describe_span.name == "kafka.describe_topics"
+    assert describe_span.attributes["kafka.topic"] == topic_name
+    assert describe_span.attributes["kafka.topic_exists"] is False
+    assert create_span.name == "kafka.create_topics"
+    assert dict(create_span.attributes) == {
+        "kafka.topic": topic_name,
+        "kafka.partitions": 3,
+        "kafka.replication_factor": 2,
+        "kafka.config_keys": 1,
+    }
+    assert [e.attributes["future.key"] for e in create_span.events] == [topic_name]
+
+
+@mock.patch("src.services.kafka_client_service.AdminClient")
+@pytest.mark.asyncio
+async def test_create_partitions_span_error(mock_admin_client, span_exporter):
+    kafka_client_service = KafkaClientService(kafka_settings)
+    mock_admin_client.return_value.describe_topics.return_value = fake_describe_topics(
+        topic_name, partitions=1
+    )
+    mock_admin_client.return_value.create_partitions.return_value = {
+        topic_name: FakeFutureResultError(KafkaException(KafkaError(-1)))
+    }
+
+    with pytest.raises(KafkaClientServiceError):
+        await kafka_client_service.create_or_update_topic(topic_name, 2, 1, dict())
+
+    describe_span, partitions_span = span_exporter.get_finished_spans()
+    assert describe_span.attributes["kafka.current_partitions"] == 1
+    assert partitions_span.name == "kafka.create_partitions"
+    assert partitions_span.attributes["kafka.partitions"] == 2
+    assert partitions_span.attributes["kafka.current_partitions"] == 1
+    assert not partitions_span.status.is_ok
+    assert partitions_span.events[0].attributes["future.outcome"] == "error"
@@ -0,0 +1,152 @@
+import sqlite3
+import time
+
+import pytest
+
+from src.models.api_models import Info, ProvisioningStatus, Status1
+from src.services.in_memory_operation_journal import InMemoryOperationJournal
+from src.services.operation_journal import INTERRUPTED_OPERATION_ERROR
+from src.services.sqlite_operation_journal import SqliteOperationJournal
+
+completed = ProvisioningStatus(
+    status=Status1.COMPLETED,
+    result="",
+    info=Info(
+        publicInfo={"topic_name": {"type": "string", "value": None}},
+        privateInfo=dict(),
+    ),
+)
+
+
+@pytest.fixture(name="make_journal", params=["memory", "sqlite"])
+def make_journal_fixture(request, tmp_path):
+    journals = []
+
+    def make_journal(ttl_s=3600.0):
+        if request.param == "memory":
+            journal = InMemoryOperationJournal(ttl_s)
+        else:
+            journal = SqliteOperationJournal(str(tmp_path / "journal.db"), ttl_s)
+        journals.append(journal)
+        return journal
+
+    yield make_journal
+    for journal in journals:
+        journal.close()
+
+
+def test_start_and_complete(make_journal):
+    journal = make_journal()
+
+    journal.start("token")
+    running = journal.get("token")
+    journal.complete("token", completed)
+
+    assert running == ProvisioningStatus(status=Status1.RUNNING, result="")
+    assert journal.get("token") == completed
+
+
+def test_get_unknown_token(make_journal):
+    journal = make_journal()
+
+    assert journal.get("unknown") is None
+
+
+def test_purge_expired_keeps_running(make_journal):
+    journal = make_journal(ttl_s=0)
+    journal.start("completed")
+    journal.complete("completed", completed)
+    journal.start("running")
+
+    assert journal.get("completed") is None
+    assert journal.purge_expired() == 1
+    assert journal.get("running") == ProvisioningStatus(
+        status=Status1.RUNNING, result=""
+    )
+
+
+def test_sqlite_fails_running_operations_on_restart(tmp_path):
+    path = str(tmp_path / "journal.db")
+    journal = SqliteOperationJournal(path)
+    journal.start("completed")
+    journal.complete("completed", completed)
+    journal.start("running")
+    journal.close()
+
+    journal = SqliteOperationJournal(path)
+
+    assert journal.get("completed") == completed
+    assert journal.get("running") == ProvisioningStatus(
+        status=Status1.FAILED, result=INTERRUPTED_OPERATION_ERROR
+    )
+    journal.close()
+
+
+def test_sqlite_keeps_running_operations_of_live_journals(tmp_path):
+    path = str(tmp_path / "journal.db")
+    first = SqliteOperationJournal(path)
+    first.start("running")
+
+    second = SqliteOperationJournal(path)
+
+    assert second.get("running") == ProvisioningStatus(
+        status=Status1.RUNNING, result=""
+    )
+    second.close()
+    first.close()
+
+
+def test_sqlite_fails_running_operations_of_expired_leases(tmp_path):
+    path = str(tmp_path / "journal.db")
+    first = SqliteOperationJournal(path, lease_s=0.05)
+    first.start("running")
+    first._closed.set()  # stops renewing the lease, as a crashed replica
+    time.sleep(0.1)
+
+    second = SqliteOperationJournal(path, lease_s=0.05)
+
+    assert second.get("running") == ProvisioningStatus(
+        status=Status1.FAILED, result=INTERRUPTED_OPERATION_ERROR
+    )
+    second.close()
+    first.close()
+
+
+def test_sqlite_fails_orphaned_operations_while_polling(tmp_path):
+    path = str(tmp_path / "journal.db")
+    crashed = SqliteOperationJournal(path, lease_s=0.3)
+    crashed.start("running")
+    crashed._closed.set()  # stops renewing the lease, as a crashed replica
+    crashed._lease_thread.join()
+
+    # restarted before the lease of the crashed replica expired
+    journal = SqliteOperationJournal(path, lease_s=0.3)
+    running = journal.get("running")
+    for _ in range(100):
+        status = journal.get("running")
+        if status.status != Status1.RUNNING:
+            break
+        time.sleep(0.01)
+
+    assert running == ProvisioningStatus(status=Status1.RUNNING, result="")
+    assert status == ProvisioningStatus(
+        status=Status1.FAILED, result=INTERRUPTED_OPERATION_ERROR
+    )
+    journal.close()
+    crashed.close()
+
+
+def test_sqlite_wal_mode_and_concurrent_connections(tmp_path):
+    path = str(tmp_path / "journal.db")
+    writer = SqliteOperationJournal(path)
+    reader = sqlite3.connect(path)
+
+    writer.start("token")
+    writer.complete("token", completed)
+
+    assert reader.execute("PRAGMA journal_mode").fetchone() == ("wal",)
+    assert reader.execute("SELECT status FROM operations").fetchall() == [
+        ("COMPLETED",)
+    ]
+    reader.close()
+    writer.close()
@@ -1,11 +1,13 @@
+import asyncio
 from pathlib import Path
-from unittest.mock import Mock
+from unittest.mock import AsyncMock, Mock
 
 import pytest
 import yaml
 
 from src.models.api_models import ProvisioningStatus, Status1, SystemErr
 from src.models.data_product_descriptor import DataProduct
+from src.services.kafka_client_service import KafkaClientServiceError
 from src.services.principal_mapping_service import KafkaPrincipal
 from src.services.provision_service import ProvisionService
 from src.services.schema_registry_service import SchemaRegistryServiceError
@@ -31,7 +33,7 @@ def unpacked_request_fixture(get_descriptor, request):
 
 @pytest.fixture(name="kafka_client_service")
 def kafka_client_service_fixture():
-    return Mock()
+    return AsyncMock()
 
 
 @pytest.fixture(name="principal_mapping_service")
@@ -41,16 +43,17 @@ def principal_mapping_service_fixture():
 
 @pytest.fixture(name="schema_registry_service")
 def schema_registry_service_fixture():
-    return Mock()
+    return AsyncMock()
 
 
 @pytest.fixture(name="acl_service")
 def acl_service_fixture():
-    return Mock()
+    return AsyncMock()
 
 
 @pytest.mark.parametrize("unpacked_request", ["descriptor_valid.yaml"], indirect=True)
-def test_provision_ok(
+@pytest.mark.asyncio
+async def test_provision_ok(
     unpacked_request,
     kafka_client_service,
     principal_mapping_service,
@@ -69,7 +72,7 @@ def test_provision_ok(
         acl_service,
     )
 
-    provisioning_status = provisioner.provision(data_product, op)
+    provisioning_status = await provisioner.provision(data_product, op)
 
     kafka_client_service.create_or_update_topic.assert_called_once()
     principal_mapping_service.map_identity.assert_called_once()
@@ -100,7 +103,8 @@ def test_provision_ok(
 @pytest.mark.parametrize(
     "unpacked_request", ["descriptor_valid_no_schema.yaml"], indirect=True
 )
-def test_provision_no_schema_ok(
+@pytest.mark.asyncio
+async def test_provision_no_schema_ok(
     unpacked_request,
     kafka_client_service,
     principal_mapping_service,
@@ -118,7 +122,7 @@ def test_provision_no_schema_ok(
         acl_service,
     )
 
-    provisioning_status = provisioner.provision(data_product, op)
+    provisioning_status = await provisioner.provision(data_product, op)
 
     kafka_client_service.create_or_update_topic.assert_called_once()
     principal_mapping_service.map_identity.assert_called_once()
@@ -145,8 +149,43 @@ def test_provision_no_schema_ok(
     }
 
 
+@pytest.mark.parametrize(
+    "unpacked_request", ["descriptor_valid_no_schema.yaml"], indirect=True
+)
+@pytest.mark.asyncio
+async def test_provision_changed_config_ok(
+    unpacked_request,
+    kafka_client_service,
+    principal_mapping_service,
+    schema_registry_service,
+    acl_service,
+):
+    data_product, op = unpacked_request
+    kafka_client_service.create_or_update_topic.return_value = [
+        "max.message.bytes",
+        "retention.ms",
+    ]
+    principal_mapping_service.map_identity.return_value = KafkaPrincipal("User:owner")
+    provisioner = ProvisionService(
+        kafka_client_service,
+        principal_mapping_service,
+        schema_registry_service,
+        acl_service,
+    )
+
+    provisioning_status = await provisioner.provision(data_product, op)
+
+    assert isinstance(provisioning_status, ProvisioningStatus)
+    assert provisioning_status.info.publicInfo["changed_config"] == {
+        "type": "string",
+        "label": "Changed configuration",
+        "value": "max.message.bytes, retention.ms",
+    }
+
+
 @pytest.mark.parametrize("unpacked_request", ["descriptor_valid.yaml"], indirect=True)
-def test_provision_service_error(
+@pytest.mark.asyncio
+async def test_provision_service_error(
     unpacked_request,
     kafka_client_service,
     principal_mapping_service,
@@ -167,18 +206,87 @@ def test_provision_service_error(
         acl_service,
     )
 
-    provisioning_status = provisioner.provision(data_product, op)
+    provisioning_status = await provisioner.provision(data_product, op)
 
     kafka_client_service.create_or_update_topic.assert_called_once()
     principal_mapping_service.map_identity.assert_called_once()
-    acl_service.apply_acls_to_principals.assert_called_once()
+    acl_service.apply_acls_to_principals.assert_not_called()
     schema_registry_service.register_schema.assert_called_once()
     assert isinstance(provisioning_status, SystemErr)
     assert provisioning_status.error == "Unauthorized"
 
 
 @pytest.mark.parametrize("unpacked_request", ["descriptor_valid.yaml"], indirect=True)
-def test_unprovision_ok_remove_data(
+@pytest.mark.asyncio
+async def test_provision_registers_schema_concurrently(
+    unpacked_request,
+    kafka_client_service,
+    principal_mapping_service,
+    schema_registry_service,
+    acl_service,
+):
+    data_product, op = unpacked_request
+    schema_registered = asyncio.Event()
+
+    async def create_or_update_topic(*args):
+        await schema_registered.wait()
+        return []
+
+    async def register_schema(*args):
+        schema_registered.set()
+        return 1
+
+    kafka_client_service.create_or_update_topic.side_effect = create_or_update_topic
+    principal_mapping_service.map_identity.return_value = KafkaPrincipal("User:owner")
+    schema_registry_service.register_schema.side_effect = register_schema
+    provisioner = ProvisionService(
+        kafka_client_service,
+        principal_mapping_service,
+        schema_registry_service,
+        acl_service,
+    )
+
+    provisioning_status = await asyncio.wait_for(
+        provisioner.provision(data_product, op), timeout=1
+    )
+
+    acl_service.apply_acls_to_principals.assert_called_once()
+    assert isinstance(provisioning_status, ProvisioningStatus)
+    assert provisioning_status.status == Status1.COMPLETED
+
+
+@pytest.mark.parametrize("unpacked_request", ["descriptor_valid.yaml"], indirect=True)
+@pytest.mark.asyncio
+async def test_provision_topic_error_skips_acls(
+    unpacked_request,
+    kafka_client_service,
+    principal_mapping_service,
+    schema_registry_service,
+    acl_service,
+):
+    data_product, op = unpacked_request
+    kafka_client_service.create_or_update_topic.side_effect = KafkaClientServiceError(
+        "Topic error"
+    )
+    principal_mapping_service.map_identity.return_value = KafkaPrincipal("User:owner")
+    schema_registry_service.register_schema.return_value = 1
+    provisioner = ProvisionService(
+        kafka_client_service,
+        principal_mapping_service,
+        schema_registry_service,
+        acl_service,
+    )
+
+    provisioning_status = await provisioner.provision(data_product, op)
+
+    acl_service.apply_acls_to_principals.assert_not_called()
+    assert isinstance(provisioning_status, SystemErr)
+    assert provisioning_status.error == "Topic error"
+
+
+@pytest.mark.parametrize("unpacked_request", ["descriptor_valid.yaml"], indirect=True)
+@pytest.mark.asyncio
+async def test_unprovision_ok_remove_data(
     unpacked_request,
     kafka_client_service,
     principal_mapping_service,
@@ -196,7 +304,7 @@ def test_unprovision_ok_remove_data(
         acl_service,
     )
 
-    provisioning_status = provisioner.unprovision(data_product, op, True)
+    provisioning_status = await provisioner.unprovision(data_product, op, True)
 
     kafka_client_service.delete_topic.assert_called_once()
     acl_service.remove_all_acls_for_topic.assert_called_once()
@@ -206,7 +314,8 @@ def test_unprovision_ok_remove_data(
 
 
 @pytest.mark.parametrize("unpacked_request", ["descriptor_valid.yaml"], indirect=True)
-def test_unprovision_ok_no_remove_data(
+@pytest.mark.asyncio
+async def test_unprovision_ok_no_remove_data(
     unpacked_request,
     kafka_client_service,
     principal_mapping_service,
@@ -222,7 +331,7 @@ def test_unprovision_ok_no_remove_data(
         acl_service,
     )
 
-    provisioning_status = provisioner.unprovision(data_product, op, False)
+    provisioning_status = await provisioner.unprovision(data_product, op, False)
 
     kafka_client_service.delete_topic.assert_not_called()
     acl_service.remove_all_acls_for_topic.assert_called_once()
@@ -232,7 +341,8 @@ def test_unprovision_ok_no_remove_data(
 
 
 @pytest.mark.parametrize("unpacked_request", ["descriptor_valid.yaml"], indirect=True)
-def test_unprovision_service_error(
+@pytest.mark.asyncio
+async def test_unprovision_service_error(
     unpacked_request,
     kafka_client_service,
     principal_mapping_service,
@@ -252,7 +362,7 @@ def test_unprovision_service_error(
         acl_service,
     )
 
-    provisioning_status = provisioner.unprovision(data_product, op, True)
+    provisioning_status = await provisioner.unprovision(data_product, op, True)
 
     kafka_client_service.delete_topic.assert_called_once()
     acl_service.remove_all_acls_for_topic.assert_called_once()
@@ -0,0 +1,151 @@
+import asyncio
+
+import pytest
+
+from src.models.api_models import (
+    ProvisioningStatus,
+    Status1,
+    SystemErr,
+    ValidationError,
+)
+from src.services.in_memory_operation_journal import InMemoryOperationJournal
+from src.services.provisioning_worker_pool import (
+    ProvisioningWorkerPool,
+    ProvisioningWorkerPoolFullError,
+)
+
+
+def returning(result):
+    async def operation():
+        return result
+
+    return operation
+
+
+async def wait_until_done(worker_pool, token):
+    for _ in range(100):
+        status = await worker_pool.get_status(token)
+        if status.status != Status1.RUNNING:
+            return status
+        await asyncio.sleep(0.01)
+    raise AssertionError(f"Operation {token} did not complete")
+
+
+@pytest.mark.asyncio
+async def test_submit_completed():
+    worker_pool = ProvisioningWorkerPool()
+    result = ProvisioningStatus(status=Status1.COMPLETED, result="ok")
+    release = asyncio.Event()
+
+    async def operation():
+        await release.wait()
+        return result
+
+    token = await worker_pool.submit("component", operation)
+
+    assert (await worker_pool.get_status(token)).status == Status1.RUNNING
+    release.set()
+    assert await wait_until_done(worker_pool, token) == result
+
+
+@pytest.mark.parametrize(
+    "result,expected",
+    [
+        (SystemErr(error="Unauthorized"), "Unauthorized"),
+        (ValidationError(errors=["a", "b"]), "a; b"),
+    ],
+)
+@pytest.mark.asyncio
+async def test_submit_failed(result, expected):
+    worker_pool = ProvisioningWorkerPool()
+
+    token = await worker_pool.submit("component", returning(result))
+
+    status = await wait_until_done(worker_pool, token)
+    assert status == ProvisioningStatus(status=Status1.FAILED, result=expected)
+
+
+@pytest.mark.asyncio
+async def test_submit_unexpected_error():
+    worker_pool = ProvisioningWorkerPool()
+
+    async def operation():
+        raise RuntimeError("Boom")
+
+    token = await worker_pool.submit("component", operation)
+
+    status = await wait_until_done(worker_pool, token)
+    assert status == ProvisioningStatus(status=Status1.FAILED, result="Boom")
+
+
+@pytest.mark.asyncio
+async def test_submit_bounded_workers():
+    worker_pool = ProvisioningWorkerPool(max_workers=2)
+    release = asyncio.Event()
+    running = 0
+    max_running = 0
+
+    async def operation():
+        nonlocal running, max_running
+        running += 1
+        max_running = max(max_running, running)
+        await release.wait()
+        running -= 1
+        return ProvisioningStatus(status=Status1.COMPLETED, result="")
+
+    tokens = [await worker_pool.submit("component", operation) for _ in range(5)]
+    await asyncio.sleep(0.01)
+    release.set()
+
+    for token in tokens:
+        await wait_until_done(worker_pool, token)
+    assert max_running == 2
+
+
+@pytest.mark.asyncio
+async def test_submit_too_many_pending():
+    worker_pool = ProvisioningWorkerPool(max_workers=1, max_pending=1)
+    release = asyncio.Event()
+
+    async def operation():
+        await release.wait()
+        return ProvisioningStatus(status=Status1.COMPLETED, result="")
+
+    await worker_pool.submit("component", operation)
+
+    with pytest.raises(ProvisioningWorkerPoolFullError):
+        await worker_pool.submit("component", operation)
+    await worker_pool.stop()
+
+
+@pytest.mark.asyncio
+async def test_status_expired():
+    worker_pool = ProvisioningWorkerPool(journal=InMemoryOperationJournal(ttl_s=0))
+    result = ProvisioningStatus(status=Status1.COMPLETED, result="")
+
+    token = await worker_pool.submit("component", returning(result))
+    await asyncio.sleep(0.05)
+
+    assert await worker_pool.get_status(token) is None
+
+
+@pytest.mark.asyncio
+async def test_get_status_unknown_token():
+    worker_pool = ProvisioningWorkerPool()
+
+    assert await worker_pool.get_status("unknown") is None
+
+
+@pytest.mark.asyncio
+async def test_stop_fails_running_operations():
+    journal = InMemoryOperationJournal()
+    worker_pool = ProvisioningWorkerPool(journal=journal)
+
+    async def operation():
+        await asyncio.sleep(10)
+
+    token = await worker_pool.submit("component", operation)
+    await asyncio.sleep(0)
+    await worker_pool.stop()
+
+    assert journal.get(token).status == Status1.FAILED
@@ -1,8 +1,10 @@
 from unittest import mock
 
+import httpx
 import pytest
 from confluent_kafka.schema_registry import SchemaRegistryError
 
+from src.models.service_error import ServiceTimeoutError
 from src.services.schema_registry_service import (
     SchemaRegistryService,
     SchemaRegistryServiceError,
@@ -15,92 +17,188 @@ kafka_settings = KafkaSettings(
 subject_name = "subject_name"
 
 
-@mock.patch("src.services.schema_registry_service.SchemaRegistryClient")
-def test_register_schema_ok(mock_schema_registry_client):
+@mock.patch(
+    "src.services.schema_registry_service.AsyncSchemaRegistryClient", autospec=True
+)
+@pytest.mark.asyncio
+async def test_register_schema_ok(mock_schema_registry_client):
     schema_registry_service = SchemaRegistryService(kafka_settings)
     mock_schema_registry_client.return_value.register_schema.return_value = 1
 
-    res = schema_registry_service.register_schema(subject_name, "JSON", "{}")
+    res = await schema_registry_service.register_schema(subject_name, "JSON", "{}")
 
     assert not isinstance(res, SchemaRegistryServiceError)
     assert res == 1
 
 
-@mock.patch("src.services.schema_registry_service.SchemaRegistryClient")
-def test_register_schema_registry_error(mock_schema_registry_client):
+@mock.patch(
+    "src.services.schema_registry_service.AsyncSchemaRegistryClient", autospec=True
+)
+@pytest.mark.asyncio
+async def test_register_schema_registry_error(mock_schema_registry_client):
     schema_registry_service = SchemaRegistryService(kafka_settings)
     mock_schema_registry_client.return_value.register_schema.side_effect = (
         SchemaRegistryError(401, 401, "Unauthorized")
     )
 
     with pytest.raises(SchemaRegistryServiceError):
-        schema_registry_service.register_schema(subject_name, "JSON", "{}")
+        await schema_registry_service.register_schema(subject_name, "JSON", "{}")
 
 
-@mock.patch("src.services.schema_registry_service.SchemaRegistryClient")
-def test_register_schema_error(mock_schema_registry_client):
+@mock.patch(
+    "src.services.schema_registry_service.AsyncSchemaRegistryClient", autospec=True
+)
+@pytest.mark.asyncio
+async def test_register_schema_error(mock_schema_registry_client):
     schema_registry_service = SchemaRegistryService(kafka_settings)
     mock_schema_registry_client.return_value.register_schema.side_effect = ValueError(
         "Error"
     )
 
     with pytest.raises(SchemaRegistryServiceError):
-        schema_registry_service.register_schema(subject_name, "JSON", "{}")
+        await schema_registry_service.register_schema(subject_name, "JSON", "{}")
 
 
-@mock.patch("src.services.schema_registry_service.SchemaRegistryClient")
-def test_delete_subject_ok(mock_schema_registry_client):
+@mock.patch(
+    "src.services.schema_registry_service.AsyncSchemaRegistryClient", autospec=True
+)
+@pytest.mark.asyncio
+async def test_delete_subject_ok(mock_schema_registry_client):
     schema_registry_service = SchemaRegistryService(kafka_settings)
     mock_schema_registry_client.return_value.delete_subject.return_value = [1]
 
-    res = schema_registry_service.delete_subject(subject_name)
+    res = await schema_registry_service.delete_subject(subject_name)
 
     assert not isinstance(res, SchemaRegistryServiceError)
     assert res is None
 
 
-@mock.patch("src.services.schema_registry_service.SchemaRegistryClient")
-def test_delete_subject_registry_error(mock_schema_registry_client):
+@mock.patch(
+    "src.services.schema_registry_service.AsyncSchemaRegistryClient", autospec=True
+)
+@pytest.mark.asyncio
+async def test_delete_subject_registry_error(mock_schema_registry_client):
     schema_registry_service = SchemaRegistryService(kafka_settings)
     mock_schema_registry_client.return_value.delete_subject.side_effect = (
         SchemaRegistryError(401, 401, "Unauthorized")
     )
 
     with pytest.raises(SchemaRegistryServiceError):
-        schema_registry_service.delete_subject(subject_name)
+        await schema_registry_service.delete_subject(subject_name)
 
 
-@mock.patch("src.services.schema_registry_service.SchemaRegistryClient")
-def test_delete_subject_error(mock_schema_registry_client):
+@mock.patch(
+    "src.services.schema_registry_service.AsyncSchemaRegistryClient", autospec=True
+)
+@pytest.mark.asyncio
+async def test_delete_subject_error(mock_schema_registry_client):
     schema_registry_service = SchemaRegistryService(kafka_settings)
     mock_schema_registry_client.return_value.delete_subject.side_effect = ValueError(
         "Error"
     )
 
     with pytest.raises(SchemaRegistryServiceError):
-        schema_registry_service.delete_subject(subject_name)
+        await schema_registry_service.delete_subject(subject_name)
 
 
-@mock.patch("src.services.schema_registry_service.SchemaRegistryClient")
-def test_delete_subject_already_soft_deleted(mock_schema_registry_client):
+@mock.patch(
+    "src.services.schema_registry_service.AsyncSchemaRegistryClient", autospec=True
+)
+@pytest.mark.asyncio
+async def test_delete_subject_already_soft_deleted(mock_schema_registry_client):
     schema_registry_service = SchemaRegistryService(kafka_settings)
     mock_schema_registry_client.return_value.delete_subject.side_effect = [
         SchemaRegistryError(404, 40404, "Soft deleted"),
         [1],
     ]
 
-    res = schema_registry_service.delete_subject(subject_name)
+    res = await schema_registry_service.delete_subject(subject_name)
 
     assert res is None
 
 
-@mock.patch("src.services.schema_registry_service.SchemaRegistryClient")
-def test_delete_subject_already_hard_deleted(mock_schema_registry_client):
+@mock.patch(
+    "src.services.schema_registry_service.AsyncSchemaRegistryClient", autospec=True
+)
+@pytest.mark.asyncio
+async def test_delete_subject_already_hard_deleted(mock_schema_registry_client):
     schema_registry_service = SchemaRegistryService(kafka_settings)
     mock_schema_registry_client.return_value.delete_subject.side_effect = (
         SchemaRegistryError(404, 40401, "Not found")
     )
 
-    res = schema_registry_service.delete_subject(subject_name)
+    res = await schema_registry_service.delete_subject(subject_name)
 
     assert res is None
+
+
+@mock.patch(
+    "src.services.schema_registry_service.AsyncSchemaRegistryClient", autospec=True
+)
+@pytest.mark.asyncio
+async def test_register_schema_timeout(mock_schema_registry_client):
+    schema_registry_service = SchemaRegistryService(kafka_settings)
+    mock_schema_registry_client.return_value.register_schema.side_effect = (
+        httpx.ReadTimeout("read timed out")
+    )
+
+    with pytest.raises(ServiceTimeoutError) as e:
+        await schema_registry_service.register_schema(subject_name, "JSON", "{}")
+
+    assert "register schema for subject subject_name" in e.value.error_msg
+
+
+@mock.patch(
+    "src.services.schema_registry_service.AsyncSchemaRegistryClient", autospec=True
+)
+@pytest.mark.asyncio
+async def test_delete_subject_timeout(mock_schema_registry_client):
+    schema_registry_service = SchemaRegistryService(kafka_settings)
+    mock_schema_registry_client.return_value.delete_subject.side_effect = (
+        httpx.ReadTimeout("read timed out")
+    )
+
+    with pytest.raises(ServiceTimeoutError) as e:
+        await schema_registry_service.delete_subject(subject_name)
+
+    assert "delete subject subject_name" in e.value.error_msg
+
+
+@mock.patch(
+    "src.services.schema_registry_service.AsyncSchemaRegistryClient", autospec=True
+)
+@pytest.mark.asyncio
+async def test_register_schema_span(mock_schema_registry_client, span_exporter):
+    schema_registry_service = SchemaRegistryService(kafka_settings)
+    mock_schema_registry_client.return_value.register_schema.return_value = 7
+
+    await schema_registry_service.register_schema(subject_name, "AVRO", "{}")
+
+    (span,) = span_exporter.get_finished_spans()
+    assert span.name == "schema_registry.register_schema"
+    assert dict(span.attributes) == {
+        "schema_registry.subject": subject_name,
+        "schema_registry.schema_type": "AVRO",
+        "schema_registry.schema_id": 7,
+    }
+
+
+@mock.patch(
+    "src.services.schema_registry_service.AsyncSchemaRegistryClient", autospec=True
+)
+@pytest.mark.asyncio
+async def test_delete_subject_spans(mock_schema_registry_client, span_exporter):
+    schema_registry_service = SchemaRegistryService(kafka_settings)
+    mock_schema_registry_client.return_value.delete_subject.side_effect = [
+        SchemaRegistryError(404, 40404, "Soft deleted"),
+        [1],
+    ]
+
+    await schema_registry_service.delete_subject(subject_name)
+
+    soft_span, hard_span = span_exporter.get_finished_spans()
+    assert soft_span.name == hard_span.name == "schema_registry.delete_subject"
+    assert soft_span.attributes["schema_registry.permanent"] is False
+    assert soft_span.attributes["schema_registry.error_code"] == 40404
+    assert soft_span.status.is_ok
+    assert hard_span.attributes["schema_registry.permanent"] is True
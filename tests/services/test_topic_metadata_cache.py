@@ -0,0 +1,39 @@
+from unittest import mock
+
+from src.services.topic_metadata_cache import TopicMetadataCache
+
+topic_name = "topic_name"
+
+
+def test_get_missing():
+    topic_metadata_cache = TopicMetadataCache()
+
+    assert topic_metadata_cache.get(topic_name) is None
+
+
+def test_set_and_get():
+    topic_metadata_cache = TopicMetadataCache()
+
+    topic_metadata_cache.set(topic_name, 3)
+
+    assert topic_metadata_cache.get(topic_name) == 3
+
+
+@mock.patch("src.services.topic_metadata_cache.time")
+def test_get_expired(mock_time):
+    mock_time.monotonic.return_value = 100.0
+    topic_metadata_cache = TopicMetadataCache(ttl_s=5)
+    topic_metadata_cache.set(topic_name, 3)
+
+    mock_time.monotonic.return_value = 105.0
+
+    assert topic_metadata_cache.get(topic_name) is None
+
+
+def test_invalidate():
+    topic_metadata_cache = TopicMetadataCache()
+    topic_metadata_cache.set(topic_name, 3)
+
+    topic_metadata_cache.invalidate(topic_name)
+
+    assert topic_metadata_cache.get(topic_name) is None
@@ -1,5 +1,5 @@
 from pathlib import Path
-from unittest.mock import Mock, call
+from unittest.mock import AsyncMock, Mock, call
 
 import pytest
 import yaml
@@ -12,7 +12,10 @@ from src.models.api_models import (
 )
 from src.models.data_product_descriptor import DataProduct
 from src.services.acl_service import AclServiceError
-from src.services.principal_mapping_service import KafkaPrincipal
+from src.services.principal_mapping_service import (
+    KafkaPrincipal,
+    PrincipalMappingServiceError,
+)
 from src.services.update_acl_service import UpdateAclService
 from src.utility.parsing_pydantic_models import parse_yaml_with_model
 
@@ -40,38 +43,52 @@ def principal_mapping_service_fixture():
 
 @pytest.fixture(name="acl_service")
 def acl_service_fixture():
-    return Mock()
+    return AsyncMock()
 
 
 @pytest.mark.parametrize("unpacked_request", ["descriptor_valid.yaml"], indirect=True)
-def test_update_acl_ok(
+@pytest.mark.asyncio
+async def test_update_acl_ok(
     unpacked_request,
     principal_mapping_service,
     acl_service,
 ):
     data_product, component_id = unpacked_request
-    principal_mapping_service.map_identity.return_value = KafkaPrincipal("User:user")
+    principal_mapping_service.map_identity.side_effect = [
+        KafkaPrincipal("User:owner"),
+        KafkaPrincipal("User:user"),
+    ]
     witboost_identities = ["user:user"]
-    acl_service.apply_acls_to_principals.return_value = None
-    acl_service.remove_all_acls_for_topic.return_value = None
+    acl_service.sync_acls_for_topic.return_value = None
     update_acl_service = UpdateAclService(principal_mapping_service, acl_service)
     map_identity_calls = [call("user:name.surname_agilelab.it"), call("user:user")]
 
-    provisioning_status = update_acl_service.update_acls(
+    provisioning_status = await update_acl_service.update_acls(
         data_product, component_id, witboost_identities
     )
 
-    acl_service.remove_all_acls_for_topic.assert_called_once()
     principal_mapping_service.map_identity.assert_has_calls(
         map_identity_calls, any_order=True
     )
-    assert acl_service.apply_acls_to_principals.call_count == 2
+    acl_service.remove_all_acls_for_topic.assert_not_called()
+    acl_service.apply_acls_to_principals.assert_not_called()
+    acl_service.sync_acls_for_topic.assert_called_once()
+    topic_name, bindings = acl_service.sync_acls_for_topic.call_args.args
+    assert topic_name == "healthcare_vaccinations_0_kafka-output-port_development"
+    assert {(b.principal, b.restype.name, b.operation.name) for b in bindings} == {
+        ("User:owner", "TOPIC", "READ"),
+        ("User:owner", "TOPIC", "WRITE"),
+        ("User:owner", "GROUP", "READ"),
+        ("User:user", "TOPIC", "READ"),
+        ("User:user", "GROUP", "READ"),
+    }
     assert isinstance(provisioning_status, ProvisioningStatus)
     assert provisioning_status.status == Status1.COMPLETED
 
 
 @pytest.mark.parametrize("unpacked_request", ["descriptor_valid.yaml"], indirect=True)
-def test_update_acl_service_error(
+@pytest.mark.asyncio
+async def test_update_acl_service_error(
     unpacked_request,
     principal_mapping_service,
     acl_service,
@@ -79,31 +96,51 @@ def test_update_acl_service_error(
     data_product, component_id = unpacked_request
     principal_mapping_service.map_identity.return_value = KafkaPrincipal("User:user")
     witboost_identities = ["user:user"]
-    acl_service.apply_acls_to_principals.side_effect = [
-        None,
-        AclServiceError("Unauthorized"),
-    ]
-    acl_service.remove_all_acls_for_topic.return_value = None
+    acl_service.sync_acls_for_topic.side_effect = AclServiceError("Unauthorized")
     update_acl_service = UpdateAclService(principal_mapping_service, acl_service)
     map_identity_calls = [call("user:name.surname_agilelab.it"), call("user:user")]
 
-    provisioning_status = update_acl_service.update_acls(
+    provisioning_status = await update_acl_service.update_acls(
         data_product, component_id, witboost_identities
     )
 
-    acl_service.remove_all_acls_for_topic.assert_called_once()
     principal_mapping_service.map_identity.assert_has_calls(
         map_identity_calls, any_order=True
     )
-    assert acl_service.apply_acls_to_principals.call_count == 2
+    acl_service.sync_acls_for_topic.assert_called_once()
     assert isinstance(provisioning_status, SystemErr)
     assert provisioning_status.error == "Unauthorized"
 
 
+@pytest.mark.parametrize("unpacked_request", ["descriptor_valid.yaml"], indirect=True)
+@pytest.mark.asyncio
+async def test_update_acl_mapping_error(
+    unpacked_request,
+    principal_mapping_service,
+    acl_service,
+):
+    data_product, component_id = unpacked_request
+    principal_mapping_service.map_identity.side_effect = [
+        KafkaPrincipal("User:owner"),
+        PrincipalMappingServiceError("Groups are not supported"),
+    ]
+    witboost_identities = ["group:group"]
+    update_acl_service = UpdateAclService(principal_mapping_service, acl_service)
+
+    provisioning_status = await update_acl_service.update_acls(
+        data_product, component_id, witboost_identities
+    )
+
+    acl_service.sync_acls_for_topic.assert_not_called()
+    assert isinstance(provisioning_status, SystemErr)
+    assert provisioning_status.error == "Groups are not supported"
+
+
 @pytest.mark.parametrize(
     "unpacked_request", ["descriptor_not_valid.yaml"], indirect=True
 )
-def test_update_acl_validation_error(
+@pytest.mark.asyncio
+async def test_update_acl_validation_error(
     unpacked_request,
     principal_mapping_service,
     acl_service,
@@ -112,12 +149,11 @@ def test_update_acl_validation_error(
     witboost_identities = ["user:user"]
     update_acl_service = UpdateAclService(principal_mapping_service, acl_service)
 
-    provisioning_status = update_acl_service.update_acls(
+    provisioning_status = await update_acl_service.update_acls(
         data_product, component_id, witboost_identities
     )
 
-    acl_service.remove_all_acls_for_topic.assert_not_called()
     principal_mapping_service.map_identity.assert_not_called()
-    acl_service.apply_acls_to_principals.assert_not_called()
+    acl_service.sync_acls_for_topic.assert_not_called()
     assert isinstance(provisioning_status, ValidationError)
     assert len(provisioning_status.errors) == 5
@@ -1,8 +1,14 @@
 from pathlib import Path
+from unittest import mock
 
-from src.models.api_models import ValidationError
+from src.dependencies import get_descriptor_cache, parse_component_descriptor
+from src.models.api_models import ValidationError, ValidationResult
 from src.models.data_product_descriptor import DataProduct
-from src.services.validation_service import validate_kafka_output_port
+from src.services.validation_service import (
+    parse_and_validate_kafka_output_port,
+    validate_descriptor,
+    validate_kafka_output_port,
+)
 from src.utility.parsing_pydantic_models import parse_yaml_with_model
 
 
@@ -65,3 +71,62 @@ def test_validate_kafka_output_port_missing():
         f"Component with ID {component_id} not found in descriptor"
         == actual_res.errors[0]
     )
+
+
+def test_validate_descriptor_valid():
+    descriptor_str = Path("tests/descriptors/descriptor_valid.yaml").read_text()
+
+    actual_res = validate_descriptor(descriptor_str)
+
+    assert actual_res == ValidationResult(valid=True)
+
+
+def test_validate_descriptor_not_valid():
+    descriptor_str = Path("tests/descriptors/descriptor_not_valid.yaml").read_text()
+
+    actual_res = validate_descriptor(descriptor_str)
+
+    assert actual_res.valid is False
+    assert len(actual_res.error.errors) > 0
+
+
+def test_validate_descriptor_other_component_not_valid():
+    descriptor_str = Path(
+        "tests/descriptors/descriptor_valid_other_component_not_valid.yaml"
+    ).read_text()
+
+    assert validate_descriptor(descriptor_str) == ValidationResult(valid=True)
+
+    result = validate_descriptor(descriptor_str, strict=True)
+
+    assert not result.valid
+    assert "Failed to validate the components of" in result.error.errors[0]
+
+
+def test_parse_and_validate_kafka_output_port_cached():
+    get_descriptor_cache.cache_clear()
+    descriptor_str = Path("tests/descriptors/descriptor_valid.yaml").read_text()
+
+    with mock.patch(
+        "src.services.validation_service.parse_component_descriptor",
+        wraps=parse_component_descriptor,
+    ) as mock_parse:
+        first = parse_and_validate_kafka_output_port(descriptor_str)
+        second = parse_and_validate_kafka_output_port(descriptor_str)
+
+    assert mock_parse.call_count == 1
+    assert first[0] is second[0]
+    assert first[1] is second[1]
+    assert get_descriptor_cache().stats().hits == 1
+
+
+def test_parse_and_validate_kafka_output_port_errors_not_cached():
+    get_descriptor_cache.cache_clear()
+    descriptor_str = Path("tests/descriptors/descriptor_not_valid.yaml").read_text()
+
+    first = parse_and_validate_kafka_output_port(descriptor_str)
+    second = parse_and_validate_kafka_output_port(descriptor_str)
+
+    assert isinstance(first, ValidationError)
+    assert isinstance(second, ValidationError)
+    assert get_descriptor_cache().stats().entries == 0
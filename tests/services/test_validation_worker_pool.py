@@ -0,0 +1,155 @@
+import threading
+
+import pytest
+
+from src.models.api_models import (
+    Status,
+    ValidationError,
+    ValidationResult,
+    ValidationStatus,
+)
+from src.services.validation_worker_pool import (
+    ValidationWorkerPool,
+    ValidationWorkerPoolFullError,
+)
+
+
+def wait_until_done(validation_worker_pool, token):
+    for _ in range(100):
+        status = validation_worker_pool.get_status(token)
+        if status.status != Status.RUNNING:
+            return status
+        threading.Event().wait(0.01)
+    raise AssertionError(f"Validation {token} did not complete")
+
+
+def test_submit_completed():
+    validation_worker_pool = ValidationWorkerPool(
+        lambda descriptor: ValidationResult(valid=True)
+    )
+
+    token = validation_worker_pool.submit("descriptor")
+
+    assert wait_until_done(validation_worker_pool, token) == ValidationStatus(
+        status=Status.COMPLETED, result=ValidationResult(valid=True)
+    )
+    validation_worker_pool.shutdown()
+
+
+def test_submit_reuses_result_of_same_descriptor():
+    calls = []
+
+    def validate(descriptor):
+        calls.append(descriptor)
+        return ValidationResult(valid=True)
+
+    validation_worker_pool = ValidationWorkerPool(validate)
+
+    first = validation_worker_pool.submit("descriptor")
+    wait_until_done(validation_worker_pool, first)
+    second = validation_worker_pool.submit("descriptor")
+    other = validation_worker_pool.submit("other descriptor")
+    wait_until_done(validation_worker_pool, other)
+
+    assert first == second
+    assert first != other
+    assert calls == ["descriptor", "other descriptor"]
+    validation_worker_pool.shutdown()
+
+
+def test_submit_running_validation_reused():
+    release = threading.Event()
+    calls = []
+
+    def validate(descriptor):
+        calls.append(descriptor)
+        release.wait(1)
+        return ValidationResult(valid=True)
+
+    validation_worker_pool = ValidationWorkerPool(validate)
+
+    first = validation_worker_pool.submit("descriptor")
+    second = validation_worker_pool.submit("descriptor")
+    running = validation_worker_pool.get_status(first)
+    release.set()
+
+    assert first == second
+    assert running == ValidationStatus(status=Status.RUNNING)
+    wait_until_done(validation_worker_pool, first)
+    assert calls == ["descriptor"]
+    validation_worker_pool.shutdown()
+
+
+def test_submit_failed_validation_retried():
+    calls = []
+
+    def validate(descriptor):
+        calls.append(descriptor)
+        if len(calls) == 1:
+            raise RuntimeError("Boom")
+        return ValidationResult(valid=True)
+
+    validation_worker_pool = ValidationWorkerPool(validate)
+
+    token = validation_worker_pool.submit("descriptor")
+    failed = wait_until_done(validation_worker_pool, token)
+    validation_worker_pool.submit("descriptor")
+    completed = wait_until_done(validation_worker_pool, token)
+
+    assert failed == ValidationStatus(
+        status=Status.FAILED,
+        result=ValidationResult(
+            valid=False,
+            error=ValidationError(
+                errors=["Unable to validate the descriptor.", "Boom"]
+            ),
+        ),
+    )
+    assert completed.status == Status.COMPLETED
+    validation_worker_pool.shutdown()
+
+
+def test_submit_too_many_pending():
+    release = threading.Event()
+
+    def validate(descriptor):
+        release.wait(1)
+        return ValidationResult(valid=True)
+
+    validation_worker_pool = ValidationWorkerPool(validate, max_pending=1)
+
+    first = validation_worker_pool.submit("first")
+    reused = validation_worker_pool.submit("first")
+    with pytest.raises(ValidationWorkerPoolFullError):
+        validation_worker_pool.submit("second")
+    release.set()
+    wait_until_done(validation_worker_pool, first)
+    second = validation_worker_pool.submit("second")
+
+    assert reused == first
+    assert wait_until_done(validation_worker_pool, second).status == Status.COMPLETED
+    validation_worker_pool.shutdown()
+
+
+def test_results_evicted():
+    validation_worker_pool = ValidationWorkerPool(
+        lambda descriptor: ValidationResult(valid=True), max_results=1
+    )
+
+    first = validation_worker_pool.submit("first")
+    wait_until_done(validation_worker_pool, first)
+    second = validation_worker_pool.submit("second")
+    wait_until_done(validation_worker_pool, second)
+
+    assert validation_worker_pool.get_status(first) is None
+    assert validation_worker_pool.get_status(second) is not None
+    validation_worker_pool.shutdown()
+
+
+def test_get_status_unknown_token():
+    validation_worker_pool = ValidationWorkerPool(
+        lambda descriptor: ValidationResult(valid=True)
+    )
+
+    assert validation_worker_pool.get_status("unknown") is None
+    validation_worker_pool.shutdown()
@@ -6,7 +6,11 @@ from pydantic import BaseModel
 from starlette.responses import Response
 from starlette.testclient import TestClient
 
-from src.check_return_type import check_response
+from src.check_return_type import (
+    check_response,
+    checked_endpoint,
+    get_route_response_index,
+)
 from src.models.api_models import SystemErr, ValidationError
 
 app2 = FastAPI()
@@ -44,6 +48,21 @@ def fun1(request: RequestModel) -> Response:
         return check_response(out_response=resp2, application=app2)
 
 
+def respond(out_response):
+    # frame inspection would look for a route named "respond"
+    return check_response(out_response=out_response, application=app2)
+
+
+@app2.get(
+    "/v1/checked/{val}",
+    response_model=None,
+    responses={"200": {"model": int}, "202": {"model": str}},
+)
+@checked_endpoint
+async def checked(val: int) -> Response:
+    return respond(val if val == 1 else "ris=202")
+
+
 client = TestClient(app2)
 
 
@@ -84,6 +103,15 @@ class testApp(unittest.TestCase):
         self.assertEqual(response.status_code, 422)
         self.assertIn("detail", response.json())
 
+    def test_checked_endpoint(self):
+        response = client.get("/v1/checked/1")
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.text, "1")
+
+        response = client.get("/v1/checked/2")
+        self.assertEqual(response.status_code, 202)
+        self.assertEqual(response.text, "ris=202")
+
 
 class TestCheckResponses(unittest.TestCase):
     def test_check_responses_valid_response(self):
@@ -113,3 +141,33 @@ class TestCheckResponses(unittest.TestCase):
         )
         self.assertEqual(response.status_code, 500)
         self.assertIn("error", json.loads(response.body))
+
+    def test_check_responses_route_path(self):
+        response = check_response(
+            application=app2, out_response="ris=202", route_path="/v1/test"
+        )
+        self.assertEqual(response.status_code, 202)
+        self.assertEqual(response.body, b"ris=202")
+
+        response = check_response(
+            application=app2, out_response="ris=202", route_path="/v1/missing"
+        )
+        self.assertEqual(response.status_code, 500)
+
+    def test_route_response_index_rebuilt_with_new_routes(self):
+        app3 = FastAPI()
+
+        @app3.get("/first", responses={"200": {"model": int}})
+        def first():
+            pass
+
+        index = get_route_response_index(app3)
+        self.assertEqual({"first": {int: 200}}, index.by_name)
+        self.assertIs(index, get_route_response_index(app3))
+
+        @app3.get("/second", responses={"201": {"model": str}})
+        def second():
+            pass
+
+        index = get_route_response_index(app3)
+        self.assertEqual({"/first": {int: 200}, "/second": {str: 201}}, index.by_path)
@@ -0,0 +1,45 @@
+import httpx
+import pytest
+from fastapi import FastAPI
+
+from src.utility.correlation_id_middleware import CorrelationIdMiddleware
+from src.utility.logger import correlation_id
+
+api = FastAPI()
+
+
+@api.get("/id")
+async def get_id():
+    return {"id": correlation_id.get()}
+
+
+async def call(headers=None):
+    transport = httpx.ASGITransport(app=CorrelationIdMiddleware(api))
+    async with httpx.AsyncClient(transport=transport, base_url="http://test") as c:
+        return await c.get("/id", headers=headers)
+
+
+@pytest.mark.asyncio
+async def test_generates_correlation_id():
+    response = await call()
+
+    request_id = response.json()["id"]
+    assert len(request_id) == 32
+    assert response.headers["x-correlation-id"] == request_id
+    assert correlation_id.get() is None
+
+
+@pytest.mark.asyncio
+async def test_propagates_correlation_id():
+    response = await call({"X-Correlation-ID": "request-1"})
+
+    assert response.json() == {"id": "request-1"}
+    assert response.headers["x-correlation-id"] == "request-1"
+
+
+@pytest.mark.asyncio
+async def test_replaces_invalid_correlation_id():
+    response = await call({"X-Correlation-ID": "not valid" * 20})
+
+    assert len(response.json()["id"]) == 32
+    assert response.headers["x-correlation-id"] == response.json()["id"]
@@ -7,6 +7,8 @@ import yaml
 
 from src.models.api_models import ValidationError
 from src.models.data_product_descriptor import (
+    LAZY_COMPONENTS,
+    Component,
     ComponentKind,
     ConnectionTypeWorkload,
     DataContract,
@@ -145,6 +147,25 @@ class TestDataProductDescriptor(unittest.TestCase):
         self.assertEqual(1, len(observability_apis))
         self.assertIsInstance(observability_apis[0], Observability)
 
+    def test_get_components_by_kind_plain_string(self):
+        output_ports = self.sample_data_product.get_components_by_kind("outputport")
+
+        self.assertEqual(["op1", "op2"], [op.id for op in output_ports])
+        self.assertEqual([], self.sample_data_product.get_components_by_kind("other"))
+
+    def test_component_indexes_follow_components_changes(self):
+        workload = self.sample_data_product.get_component_by_id("wl1")
+
+        self.sample_data_product.components = [workload]
+        self.assertIsNone(self.sample_data_product.get_component_by_id("op1"))
+        self.assertEqual([], self.sample_data_product.get_output_ports())
+
+        self.sample_data_product.components.append(
+            self.sample_data_product.components[0].model_copy(update={"id": "wl2"})
+        )
+        self.assertEqual(2, len(self.sample_data_product.get_workloads()))
+        self.assertIsNotNone(self.sample_data_product.get_component_by_id("wl2"))
+
     def test_get_component_by_id_existing(self):
         component_id = "op1"
         component = self.sample_data_product.get_component_by_id(component_id)
@@ -354,6 +375,33 @@ class TestDataProductDescriptor(unittest.TestCase):
         with pytest.raises(ValueError):
             OpenMetadataColumn.check_dataType("invalid_type", invalid_column_data)
 
+    def test_open_metadata_column_invalid_dataType(self):
+        with pytest.raises(
+            pydantic_core.ValidationError,
+            match='Column "column1" specifies dataType of "invalid_type"',
+        ):
+            OpenMetadataColumn(name="column1", dataType="invalid_type")
+
+        column = OpenMetadataColumn(name="column1", dataType="VarChar")
+        self.assertEqual("VarChar", column.dataType)
+
+    def test_data_contract_reports_all_invalid_columns(self):
+        columns = [
+            {"name": "column1", "dataType": "string"},
+            {"name": "column2", "dataType": "invalid_type"},
+            {"name": "column3", "dataType": "int"},
+            {"name": "column4", "dataType": "another_type"},
+        ]
+
+        with pytest.raises(pydantic_core.ValidationError) as exc_info:
+            DataContract(schema=columns)
+
+        self.assertIn(
+            "2 columns specify a dataType that is not a valid OpenMetadata data type: "
+            '"column2" ("invalid_type"), "column4" ("another_type")',
+            str(exc_info.value),
+        )
+
     def test_workload_correct_readsFrom(self):
         input_data = """
           id: "123"
@@ -495,3 +543,82 @@ class TestDataProductDescriptor(unittest.TestCase):
             data_product.get_typed_component_by_id(
                 invalid_component_to_provision, OutputPort
             )
+
+    def test_lazy_components_validated_on_access(self):
+        descriptor_str = Path(
+            "tests/descriptors/descriptor_valid_other_component_not_valid.yaml"
+        ).read_text()
+        request = yaml.safe_load(descriptor_str)
+        data_product = parse_yaml_with_model(
+            request.get("dataProduct"), DataProduct, context={LAZY_COMPONENTS: True}
+        )
+
+        assert isinstance(data_product, DataProduct)
+        assert all(type(c) is Component for c in data_product.components)
+        component = data_product.get_component_by_id(
+            request.get("componentIdToProvision")
+        )
+        assert isinstance(component, OutputPort)
+        assert data_product.components[0] is component
+        assert data_product.get_output_ports() == [component]
+        with pytest.raises(pydantic_core.ValidationError, match="Workload"):
+            data_product.get_component_by_id(
+                "urn:dmb:cmp:healthcare:vaccinations:0:ingestion-workload"
+            )
+        with pytest.raises(pydantic_core.ValidationError, match="Workload"):
+            data_product.validate_components()
+
+    def test_lazy_components_eager_by_default(self):
+        descriptor_str = Path(
+            "tests/descriptors/descriptor_valid_other_component_not_valid.yaml"
+        ).read_text()
+        request = yaml.safe_load(descriptor_str)
+
+        result = parse_yaml_with_model(request.get("dataProduct"), DataProduct)
+
+        assert isinstance(result, ValidationError)
+
+    def test_lazy_components_checks_structure(self):
+        descriptor_str = Path("tests/descriptors/descriptor_valid.yaml").read_text()
+        request = yaml.safe_load(descriptor_str)
+        data_product = request.get("dataProduct")
+        data_product["components"].append({"kind": "unknown", "id": "id"})
+        data_product["components"].append({"kind": "workload", "id": "id"})
+
+        result = parse_yaml_with_model(
+            data_product, DataProduct, context={LAZY_COMPONENTS: True}
+        )
+
+        assert isinstance(result, ValidationError)
+        assert "Unknown component kind: unknown" in result.errors[0]
+        assert "description" in result.errors[0]
+
+    def test_get_typed_component_memoized(self):
+        descriptor_str = Path("tests/descriptors/descriptor_valid.yaml").read_text()
+        request = yaml.safe_load(descriptor_str)
+        data_product = parse_yaml_with_model(
+            request.get("dataProduct"), DataProduct, context={LAZY_COMPONENTS: True}
+        )
+        component_id = request.get("componentIdToProvision")
+
+        first = data_product.get_typed_component_by_id(component_id, OutputPort)
+        second = data_product.get_typed_component_by_id(component_id, OutputPort)
+
+        assert isinstance(first, OutputPort)
+        assert first is second
+        # validated straight from the raw component, without a generic pass
+        assert type(data_product.components[0]) is Component
+        assert first.model_dump(by_alias=True) == (
+            data_product.get_component_by_id(component_id).model_dump(by_alias=True)
+        )
+        assert data_product.get_typed_component_by_id("missing", OutputPort) is None
+
+    def test_get_typed_component_created_in_code(self):
+        component = self.sample_data_product.components[0]
+
+        typed = self.sample_data_product.get_typed_component_by_id(
+            component.id, type(component)
+        )
+
+        assert typed == component
+        assert typed is not component
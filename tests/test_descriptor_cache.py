@@ -0,0 +1,93 @@
+import sys
+from unittest.mock import Mock
+
+from prometheus_client import REGISTRY
+
+from src.utility.descriptor_cache import DescriptorCache
+
+
+def sample(name, labels=None):
+    return REGISTRY.get_sample_value(name, labels or {}) or 0.0
+
+
+def test_get_missing():
+    descriptor_cache = DescriptorCache()
+
+    assert descriptor_cache.get("descriptor") is None
+    assert descriptor_cache.stats().misses == 1
+
+
+def test_put_and_get():
+    descriptor_cache = DescriptorCache()
+    data_product = Mock()
+
+    entry = descriptor_cache.put("descriptor", data_product, "component")
+    cached = descriptor_cache.get("descriptor")
+
+    assert cached.data_product is data_product
+    assert cached.component_id == "component"
+    assert cached is entry
+    stats = descriptor_cache.stats()
+    assert stats.hits == 1
+    assert stats.misses == 0
+    assert stats.entries == 1
+
+
+def test_memory_based_eviction():
+    descriptor_cache = DescriptorCache(max_bytes=350, retained_size_factor=1)
+
+    descriptor_cache.put("a" * 100, Mock(), "a")
+    descriptor_cache.put("b" * 100, Mock(), "b")
+    descriptor_cache.get("a" * 100)
+    descriptor_cache.put("c" * 100, Mock(), "c")
+
+    assert descriptor_cache.get("a" * 100) is not None
+    assert descriptor_cache.get("b" * 100) is None
+    assert descriptor_cache.get("c" * 100) is not None
+    stats = descriptor_cache.stats()
+    assert stats.evictions == 1
+    assert stats.entries == 2
+    assert stats.size_bytes <= 350
+
+
+def test_descriptor_larger_than_cache_not_cached():
+    descriptor_cache = DescriptorCache(max_bytes=10)
+
+    descriptor_cache.put("a" * 100, Mock(), "a")
+
+    assert descriptor_cache.get("a" * 100) is None
+    assert descriptor_cache.stats().size_bytes == 0
+
+
+def test_put_same_descriptor_replaces_entry():
+    descriptor_cache = DescriptorCache()
+
+    descriptor_cache.put("descriptor", Mock(), "first")
+    descriptor_cache.put("descriptor", Mock(), "second")
+
+    assert descriptor_cache.get("descriptor").component_id == "second"
+    assert descriptor_cache.stats().entries == 1
+
+
+def test_size_estimates_retained_memory():
+    descriptor_cache = DescriptorCache(retained_size_factor=7)
+
+    descriptor_cache.put("a" * 100, Mock(), "a")
+
+    assert descriptor_cache.stats().size_bytes == sys.getsizeof("a" * 100) * 7
+
+
+def test_metrics():
+    descriptor_cache = DescriptorCache(max_bytes=200, retained_size_factor=1)
+    hits = sample("descriptor_cache_lookups_total", {"result": "hit"})
+    misses = sample("descriptor_cache_lookups_total", {"result": "miss"})
+    evictions = sample("descriptor_cache_evictions_total")
+
+    descriptor_cache.get("a" * 100)
+    descriptor_cache.put("a" * 100, Mock(), "a")
+    descriptor_cache.get("a" * 100)
+    descriptor_cache.put("b" * 100, Mock(), "b")
+
+    assert sample("descriptor_cache_lookups_total", {"result": "hit"}) == hits + 1
+    assert sample("descriptor_cache_lookups_total", {"result": "miss"}) == misses + 1
+    assert sample("descriptor_cache_evictions_total") == evictions + 1
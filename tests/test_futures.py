@@ -0,0 +1,85 @@
+import gc
+from concurrent.futures import Future
+
+import pytest
+from opentelemetry import trace
+
+from src.models.service_error import ServiceTimeoutError
+from src.utility.futures import wait_for_futures
+
+
+def done_future(value=None):
+    future = Future()
+    future.set_result(value)
+    return future
+
+
+@pytest.mark.asyncio
+async def test_wait_for_futures_all_done():
+    fs = {"a": done_future(1), "b": done_future(2)}
+
+    await wait_for_futures(fs, 0.1, "do something")
+
+    assert all(f.done() for f in fs.values())
+
+
+@pytest.mark.asyncio
+async def test_wait_for_futures_empty():
+    await wait_for_futures({}, 0.1, "do nothing")
+
+
+@pytest.mark.asyncio
+async def test_wait_for_futures_timeout():
+    pending = Future()
+    fs = {"a": done_future(), "b": pending}
+
+    with pytest.raises(ServiceTimeoutError) as e:
+        await wait_for_futures(fs, 0.01, "create topic my_topic")
+
+    assert e.value.error_msg == (
+        "Timed out after 0.01 seconds waiting to create topic my_topic. "
+        "1 of 2 operations did not complete."
+    )
+    assert pending.cancelled()
+
+
+@pytest.mark.asyncio
+async def test_wait_for_futures_adds_an_event_per_future(span_exporter):
+    tracer = trace.get_tracer(__name__)
+    fs = {"a": done_future(1), "b": Future()}
+    fs["b"].set_exception(ValueError("error"))
+
+    with tracer.start_as_current_span("operation"):
+        await wait_for_futures(fs, 0.1, "do something")
+
+    (span,) = span_exporter.get_finished_spans()
+    events = {e.attributes["future.key"]: e for e in span.events}
+    assert events["a"].name == "future.done"
+    assert events["a"].attributes["future.outcome"] == "success"
+    assert events["b"].attributes["future.outcome"] == "error"
+
+
+@pytest.mark.asyncio
+async def test_wait_for_futures_timeout_event(span_exporter):
+    tracer = trace.get_tracer(__name__)
+    fs = {"a": done_future(), "b": Future()}
+
+    with pytest.raises(ServiceTimeoutError):
+        with tracer.start_as_current_span("operation"):
+            await wait_for_futures(fs, 0.01, "create topic my_topic")
+
+    (span,) = span_exporter.get_finished_spans()
+    timeout_event = next(e for e in span.events if e.name == "future.timeout")
+    assert timeout_event.attributes["future.pending"] == 1
+    assert timeout_event.attributes["future.total"] == 2
+
+
+@pytest.mark.asyncio
+async def test_wait_for_futures_failure_not_logged_as_unhandled(caplog):
+    failed = Future()
+    failed.set_exception(ValueError("error"))
+
+    await wait_for_futures({"a": failed}, 0.1, "do something")
+    gc.collect()
+
+    assert "exception was never retrieved" not in caplog.text
@@ -0,0 +1,76 @@
+import datetime
+import json
+import uuid
+from decimal import Decimal
+
+import pytest
+from fastapi.encoders import jsonable_encoder
+
+from src.models.api_models import (
+    Info,
+    ProvisioningStatus,
+    Status1,
+    SystemErr,
+    ValidationError,
+    ValidationResult,
+)
+from src.models.data_product_descriptor import DataContract
+from src.utility.json_serialization import JsonBackend, serializer
+
+MODELS = [
+    SystemErr(error="Unauthorized"),
+    ValidationResult(valid=True),
+    ValidationResult(
+        valid=False, error=ValidationError(errors=[f"error {i}" for i in range(300)])
+    ),
+    ValidationError(errors=["caffè", 'quote " and \\ backslash', "☃ \n\t"]),
+    ProvisioningStatus(
+        status=Status1.COMPLETED,
+        result="",
+        info=Info(
+            publicInfo={
+                "topic": {"type": "string", "label": "Topic", "value": "t" * 1000},
+                "when": datetime.datetime(2024, 5, 7, 10, 15, tzinfo=datetime.UTC),
+                "date": datetime.date(2024, 5, 7),
+                "amount": Decimal("1.10"),
+                "id": uuid.UUID(int=1),
+                "numbers": [1, 2.5, -3e-10, None, True],
+                "tags": {"a"},
+            },
+            privateInfo={},
+        ),
+    ),
+    DataContract(schema=[{"name": "column", "dataType": "string"}]),
+]
+
+
+@pytest.mark.parametrize("model", MODELS)
+def test_json_backend_byte_identical(model):
+    expected = json.dumps(jsonable_encoder(model)).encode("utf-8")
+
+    assert serializer(JsonBackend.JSON)(model) == expected
+
+
+def test_json_backend_list_byte_identical():
+    models = [SystemErr(error="a"), SystemErr(error="è")]
+    expected = json.dumps([item.model_dump() for item in models]).encode("utf-8")
+
+    assert serializer(JsonBackend.JSON)(models) == expected
+
+
+@pytest.mark.parametrize("backend", [JsonBackend.PYDANTIC, JsonBackend.ORJSON])
+@pytest.mark.parametrize("model", MODELS)
+def test_compact_backends_same_document(backend, model):
+    expected = json.loads(serializer(JsonBackend.JSON)(model))
+
+    assert json.loads(serializer(backend)(model)) == expected
+
+
+@pytest.mark.parametrize("backend", [JsonBackend.PYDANTIC, JsonBackend.ORJSON])
+def test_compact_backends_list_same_document(backend):
+    models = [SystemErr(error="a"), SystemErr(error="è")]
+
+    assert json.loads(serializer(backend)(models)) == [
+        {"error": "a"},
+        {"error": "è"},
+    ]
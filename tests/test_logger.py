@@ -0,0 +1,66 @@
+import json
+import logging
+
+from src.settings.logging_settings import LoggingSettings
+from src.utility.logger import (
+    CorrelationIdFilter,
+    JsonFormatter,
+    configure_logging,
+    correlation_id,
+    get_logger,
+)
+
+
+def make_record(msg="message %s", args=("arg",), exc_info=None):
+    return logging.LogRecord("test", logging.INFO, __file__, 1, msg, args, exc_info)
+
+
+def test_correlation_id_filter():
+    record = make_record()
+    token = correlation_id.set("request-1")
+    try:
+        CorrelationIdFilter().filter(record)
+    finally:
+        correlation_id.reset(token)
+
+    assert record.correlation_id == "request-1"
+
+    CorrelationIdFilter().filter(record)
+    assert record.correlation_id == "-"
+
+
+def test_json_formatter():
+    try:
+        raise ValueError("boom")
+    except ValueError as e:
+        record = make_record(exc_info=(type(e), e, e.__traceback__))
+    record.correlation_id = "request-1"
+
+    entry = json.loads(JsonFormatter().format(record))
+
+    assert entry["message"] == "message arg"
+    assert entry["level"] == "INFO"
+    assert entry["logger"] == "test"
+    assert entry["correlation_id"] == "request-1"
+    assert "ValueError: boom" in entry["exception"]
+
+
+def test_configure_logging_once(capfd):
+    get_logger()
+    handlers = list(logging.getLogger().handlers)
+
+    get_logger("another")
+
+    assert logging.getLogger().handlers == handlers
+
+    configure_logging(LoggingSettings(json_format=True))
+    token = correlation_id.set("request-1")
+    try:
+        get_logger("test").warning("hello %s", "world")
+    finally:
+        correlation_id.reset(token)
+    configure_logging(LoggingSettings())
+
+    entry = json.loads(capfd.readouterr().err.strip().splitlines()[-1])
+    assert entry["message"] == "hello world"
+    assert entry["correlation_id"] == "request-1"
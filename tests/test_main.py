@@ -1,10 +1,16 @@
 from pathlib import Path
-from unittest.mock import Mock
+from unittest import mock
+from unittest.mock import AsyncMock
 
+import pytest
 from fastapi.encoders import jsonable_encoder
 from starlette.testclient import TestClient
 
-from src.dependencies import get_provision_service, get_update_acl_service
+from src.dependencies import (
+    get_provision_service,
+    get_update_acl_service,
+    get_validation_settings,
+)
 from src.main import app
 from src.models.api_models import (
     DescriptorKind,
@@ -14,7 +20,10 @@ from src.models.api_models import (
     Status1,
     SystemErr,
     UpdateAclRequest,
+    ValidationRequest,
 )
+from src.services.client_registry import ClientRegistry
+from src.settings.validation_settings import ValidationSettings
 
 client = TestClient(app)
 
@@ -25,7 +34,7 @@ def test_provisioning_invalid_descriptor():
     )
 
     def mock_provision_service():
-        m = Mock()
+        m = AsyncMock()
         return m
 
     app.dependency_overrides[get_provision_service] = mock_provision_service
@@ -44,7 +53,7 @@ def test_provisioning_ok():
     )
 
     def mock_provision_service():
-        m = Mock()
+        m = AsyncMock()
         m.provision.return_value = ProvisioningStatus(
             status=Status1.COMPLETED, result=""
         )
@@ -67,7 +76,7 @@ def test_provisioning_ko():
     error_msg = "unexpected error"
 
     def mock_provision_service():
-        m = Mock()
+        m = AsyncMock()
         m.provision.return_value = SystemErr(error=error_msg)
         return m
 
@@ -86,7 +95,7 @@ def test_unprovisioning_invalid_descriptor():
     )
 
     def mock_provision_service():
-        m = Mock()
+        m = AsyncMock()
         return m
 
     app.dependency_overrides[get_provision_service] = mock_provision_service
@@ -106,7 +115,7 @@ def test_unprovisioning_ok():
     )
 
     def mock_provision_service():
-        m = Mock()
+        m = AsyncMock()
         m.unprovision.return_value = ProvisioningStatus(
             status=Status1.COMPLETED, result=""
         )
@@ -129,7 +138,7 @@ def test_unprovisioning_ko():
     error_msg = "unexpected error"
 
     def mock_provision_service():
-        m = Mock()
+        m = AsyncMock()
         m.unprovision.return_value = SystemErr(error=error_msg)
         return m
 
@@ -166,6 +175,31 @@ def test_validate_valid_descriptor():
     assert {"error": None, "valid": True} == resp.json()
 
 
+def test_validate_strict():
+    descriptor_str = Path(
+        "tests/descriptors/descriptor_valid_other_component_not_valid.yaml"
+    ).read_text()
+
+    validate_request = ProvisioningRequest(
+        descriptorKind=DescriptorKind.COMPONENT_DESCRIPTOR, descriptor=descriptor_str
+    )
+
+    resp = client.post("/v1/validate", json=dict(validate_request))
+
+    assert resp.status_code == 200
+    assert {"error": None, "valid": True} == resp.json()
+
+    app.dependency_overrides[get_validation_settings] = lambda: ValidationSettings(
+        strict=True
+    )
+
+    resp = client.post("/v1/validate", json=dict(validate_request))
+
+    app.dependency_overrides = {}
+    assert resp.status_code == 200
+    assert resp.json().get("valid") is False
+
+
 def test_updateacl_invalid_descriptor():
     updateacl_request = UpdateAclRequest(
         provisionInfo=ProvisionInfo(request="descriptor", result=""),
@@ -173,7 +207,7 @@ def test_updateacl_invalid_descriptor():
     )
 
     def mock_update_acl_service_service():
-        m = Mock()
+        m = AsyncMock()
         return m
 
     app.dependency_overrides[get_update_acl_service] = mock_update_acl_service_service
@@ -192,7 +226,7 @@ def test_updateacl_ok():
     )
 
     def mock_update_acl_service_service():
-        m = Mock()
+        m = AsyncMock()
         m.update_acls.return_value = ProvisioningStatus(
             status=Status1.COMPLETED, result=""
         )
@@ -216,7 +250,7 @@ def test_updateacl_ko():
     error_msg = "unexpected error"
 
     def mock_update_acl_service_service():
-        m = Mock()
+        m = AsyncMock()
         m.update_acls.return_value = SystemErr(error=error_msg)
         return m
 
@@ -227,3 +261,151 @@ def test_updateacl_ko():
     app.dependency_overrides = {}
     assert resp.status_code == 500
     assert resp.json() == {"error": error_msg}
+
+
+def test_lifespan_manages_client_registry():
+    with TestClient(app):
+        client_registry = app.state.client_registry
+        assert isinstance(client_registry, ClientRegistry)
+
+    with pytest.raises(RuntimeError):
+        client_registry.get_admin_client(dict())
+
+
+def test_provisioning_async(monkeypatch):
+    monkeypatch.setenv("ASYNC_PROVISIONING_ENABLED", "true")
+    descriptor_str = Path("tests/descriptors/descriptor_valid.yaml").read_text()
+    provisioning_request = ProvisioningRequest(
+        descriptorKind=DescriptorKind.COMPONENT_DESCRIPTOR, descriptor=descriptor_str
+    )
+
+    def mock_provision_service():
+        m = AsyncMock()
+        m.provision.return_value = ProvisioningStatus(
+            status=Status1.COMPLETED, result="done"
+        )
+        return m
+
+    app.dependency_overrides[get_provision_service] = mock_provision_service
+
+    with TestClient(app) as async_client:
+        resp = async_client.post(
+            "/v1/provision", json=jsonable_encoder(provisioning_request)
+        )
+        token = resp.text
+        status_resp = async_client.get(f"/v1/provision/{token}/status")
+
+    app.dependency_overrides = {}
+    assert resp.status_code == 202
+    assert status_resp.status_code == 200
+    assert status_resp.json()["status"] in ("RUNNING", "COMPLETED")
+
+
+def test_provisioning_async_failed(monkeypatch):
+    monkeypatch.setenv("ASYNC_PROVISIONING_ENABLED", "true")
+    descriptor_str = Path("tests/descriptors/descriptor_valid.yaml").read_text()
+    provisioning_request = ProvisioningRequest(
+        descriptorKind=DescriptorKind.COMPONENT_DESCRIPTOR, descriptor=descriptor_str
+    )
+
+    def mock_provision_service():
+        m = AsyncMock()
+        m.provision.return_value = SystemErr(error="Topic error")
+        return m
+
+    app.dependency_overrides[get_provision_service] = mock_provision_service
+
+    with TestClient(app) as async_client:
+        token = async_client.post(
+            "/v1/provision", json=jsonable_encoder(provisioning_request)
+        ).text
+        status = async_client.get(f"/v1/provision/{token}/status").json()
+        while status["status"] == "RUNNING":
+            status = async_client.get(f"/v1/provision/{token}/status").json()
+
+    app.dependency_overrides = {}
+    assert status == {"status": "FAILED", "result": "Topic error", "info": None}
+
+
+def test_get_status_unknown_token(monkeypatch):
+    monkeypatch.setenv("ASYNC_PROVISIONING_ENABLED", "true")
+
+    with TestClient(app) as async_client:
+        resp = async_client.get("/v1/provision/unknown/status")
+
+    assert resp.status_code == 400
+    assert resp.json() == {"errors": ["Unknown provisioning token unknown"]}
+
+
+def test_get_status_async_provisioning_disabled(monkeypatch):
+    monkeypatch.delenv("ASYNC_PROVISIONING_ENABLED", raising=False)
+
+    with TestClient(app) as sync_client:
+        resp = sync_client.get("/v1/provision/token/status")
+
+    assert resp.status_code == 500
+    assert resp.json() == {"error": "Asynchronous provisioning is not enabled"}
+
+
+def test_async_validate_valid_descriptor():
+    descriptor_str = Path("tests/descriptors/descriptor_valid.yaml").read_text()
+    validation_request = ValidationRequest(descriptor=descriptor_str)
+
+    with TestClient(app) as validation_client:
+        resp = validation_client.post(
+            "/v2/validate", json=jsonable_encoder(validation_request)
+        )
+        token = resp.text
+        status = validation_client.get(f"/v2/validate/{token}/status").json()
+        while status["status"] == "RUNNING":
+            status = validation_client.get(f"/v2/validate/{token}/status").json()
+
+    assert resp.status_code == 202
+    assert status == {"status": "COMPLETED", "result": {"valid": True, "error": None}}
+
+
+def test_async_validate_invalid_descriptor():
+    descriptor_str = Path("tests/descriptors/descriptor_not_valid.yaml").read_text()
+    validation_request = ValidationRequest(descriptor=descriptor_str)
+
+    with TestClient(app) as validation_client:
+        token = validation_client.post(
+            "/v2/validate", json=jsonable_encoder(validation_request)
+        ).text
+        status = validation_client.get(f"/v2/validate/{token}/status").json()
+        while status["status"] == "RUNNING":
+            status = validation_client.get(f"/v2/validate/{token}/status").json()
+
+    assert status["status"] == "COMPLETED"
+    assert status["result"]["valid"] is False
+
+
+def test_get_validation_status_unknown_token():
+    with TestClient(app) as validation_client:
+        resp = validation_client.get("/v2/validate/unknown/status")
+
+    assert resp.status_code == 400
+    assert resp.json() == {"errors": ["Unknown validation token unknown"]}
+
+
+def test_metrics():
+    client.get("/v1/validate")
+
+    resp = client.get("/metrics")
+
+    assert resp.status_code == 200
+    assert resp.headers["content-type"].startswith("text/plain")
+    assert 'http_request_duration_seconds_count{method="GET",route="/v1/validate"' in (
+        resp.text
+    )
+    assert "http_requests_in_flight" in resp.text
+
+
+def test_metrics_body_not_logged():
+    with mock.patch("src.utility.request_logging_middleware.logger") as logger:
+        client.get("/metrics")
+        client.get("/v1/validate")
+
+    logged = [call.args[1] for call in logger.info.call_args_list]
+    assert not any("http_requests_in_flight" in str(body) for body in logged)
+    assert len(logged) == 2
@@ -0,0 +1,75 @@
+import httpx
+import pytest
+from fastapi import FastAPI
+from prometheus_client import REGISTRY
+
+from src.models.service_error import ServiceError, ServiceTimeoutError
+from src.utility.metrics import record_service_error, timed_stage
+from src.utility.metrics_middleware import UNMATCHED_ROUTE, MetricsMiddleware
+
+
+def sample(name, labels):
+    return REGISTRY.get_sample_value(name, labels) or 0.0
+
+
+@pytest.mark.asyncio
+async def test_timed_stage():
+    @timed_stage("test_stage")
+    async def stage(fail):
+        if fail:
+            raise ServiceError("boom")
+        return "done"
+
+    success = {"stage": "test_stage", "outcome": "success"}
+    error = {"stage": "test_stage", "outcome": "error"}
+    successes = sample("provisioning_stage_duration_seconds_count", success)
+    errors = sample("provisioning_stage_duration_seconds_count", error)
+
+    assert await stage(False) == "done"
+    with pytest.raises(ServiceError):
+        await stage(True)
+
+    assert sample("provisioning_stage_duration_seconds_count", success) == (
+        successes + 1
+    )
+    assert sample("provisioning_stage_duration_seconds_count", error) == errors + 1
+
+
+def test_record_service_error():
+    before = sample("service_errors_total", {"error": "ServiceTimeoutError"})
+
+    record_service_error(ServiceTimeoutError("timeout"))
+
+    assert sample("service_errors_total", {"error": "ServiceTimeoutError"}) == (
+        before + 1
+    )
+
+
+api = FastAPI()
+
+
+@api.get("/items/{item_id}")
+async def get_item(item_id: str):
+    labels = {"method": "GET"}
+    return {"in_flight": sample("http_requests_in_flight", labels)}
+
+
+@pytest.mark.asyncio
+async def test_metrics_middleware():
+    route = {"method": "GET", "route": "/items/{item_id}", "status": "200"}
+    unmatched = {"method": "GET", "route": UNMATCHED_ROUTE, "status": "404"}
+    requests = sample("http_request_duration_seconds_count", route)
+    unmatched_requests = sample("http_request_duration_seconds_count", unmatched)
+    in_flight = sample("http_requests_in_flight", {"method": "GET"})
+
+    transport = httpx.ASGITransport(app=MetricsMiddleware(api))
+    async with httpx.AsyncClient(transport=transport, base_url="http://test") as c:
+        response = await c.get("/items/1")
+        await c.get("/missing")
+
+    assert response.json() == {"in_flight": in_flight + 1}
+    assert sample("http_requests_in_flight", {"method": "GET"}) == in_flight
+    assert sample("http_request_duration_seconds_count", route) == requests + 1
+    assert sample("http_request_duration_seconds_count", unmatched) == (
+        unmatched_requests + 1
+    )
@@ -0,0 +1,102 @@
+import asyncio
+
+import httpx
+import pytest
+from fastapi import FastAPI, Request
+from fastapi.responses import PlainTextResponse, StreamingResponse
+
+from src.utility.request_logging_middleware import RequestLoggingMiddleware
+
+api = FastAPI()
+
+
+@api.post("/echo")
+async def echo(request: Request):
+    return PlainTextResponse(await request.body())
+
+
+@api.get("/items/{item_id}")
+async def get_item(item_id: str):
+    return {"id": item_id}
+
+
+@api.get("/stream")
+async def stream():
+    async def chunks():
+        for i in range(3):
+            yield f"chunk{i};"
+
+    return StreamingResponse(chunks(), media_type="text/plain")
+
+
+@api.get("/binary")
+async def binary():
+    return PlainTextResponse(b"\x00" * 10, media_type="application/octet-stream")
+
+
+async def call(method, path, logs, content=None, **kwargs):
+    app = RequestLoggingMiddleware(api, log=lambda *args: logs.append(args), **kwargs)
+    transport = httpx.ASGITransport(app=app)
+    async with httpx.AsyncClient(transport=transport, base_url="http://test") as c:
+        response = await c.request(method, path, content=content)
+    await asyncio.sleep(0)
+    return response
+
+
+@pytest.mark.asyncio
+async def test_logs_request_and_response():
+    logs: list = []
+
+    response = await call("POST", "/echo", logs, content=b"hello")
+
+    assert response.text == "hello"
+    assert logs == [("hello", 200, "hello")]
+
+
+@pytest.mark.asyncio
+async def test_truncates_bodies():
+    logs: list = []
+
+    response = await call("POST", "/echo", logs, content=b"a" * 10, max_body_bytes=4)
+
+    assert response.text == "a" * 10
+    assert logs == [("aaaa... [truncated 6 bytes]", 200, "aaaa... [truncated 6 bytes]")]
+
+
+@pytest.mark.asyncio
+async def test_streaming_response():
+    logs: list = []
+
+    response = await call("GET", "/stream", logs, max_body_bytes=10)
+
+    assert response.text == "chunk0;chunk1;chunk2;"
+    assert logs == [("", 200, "chunk0;chu... [truncated 11 bytes]")]
+
+
+@pytest.mark.asyncio
+async def test_filters_content_types():
+    logs: list = []
+
+    await call("GET", "/binary", logs, content_types=["application/json", "text/"])
+
+    assert logs == [("", 200, "<10 bytes not logged>")]
+
+
+@pytest.mark.asyncio
+async def test_route_sample_rates():
+    logs: list = []
+
+    await call("GET", "/items/1", logs, route_sample_rates={"/items/{item_id}": 0})
+    await call("POST", "/echo", logs, route_sample_rates={"/items/{item_id}": 0})
+
+    assert logs == [("", 200, "")]
+
+
+@pytest.mark.asyncio
+async def test_disabled():
+    logs: list = []
+
+    response = await call("POST", "/echo", logs, content=b"hello", enabled=False)
+
+    assert response.text == "hello"
+    assert logs == []
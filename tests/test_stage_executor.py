@@ -0,0 +1,109 @@
+import asyncio
+
+import pytest
+
+from src.models.service_error import ServiceError
+from src.utility.stage_executor import Stage, run_stages
+
+
+def returning(value, calls=None):
+    async def run(results):
+        if calls is not None:
+            calls.append(dict(results))
+        return value
+
+    return run
+
+
+@pytest.mark.asyncio
+async def test_run_stages_passes_dependency_results():
+    calls = []
+    stages = [
+        Stage("a", returning(1)),
+        Stage("b", returning(2)),
+        Stage("c", returning(3, calls), depends_on=["a", "b"]),
+    ]
+
+    results = await run_stages(stages)
+
+    assert results == {"a": 1, "b": 2, "c": 3}
+    assert calls == [{"a": 1, "b": 2}]
+
+
+@pytest.mark.asyncio
+async def test_run_stages_runs_independent_stages_concurrently():
+    event = asyncio.Event()
+
+    async def wait_for_event(_):
+        await event.wait()
+
+    async def set_event(_):
+        event.set()
+
+    stages = [Stage("wait", wait_for_event), Stage("set", set_event)]
+
+    await asyncio.wait_for(run_stages(stages), timeout=1)
+
+
+@pytest.mark.asyncio
+async def test_run_stages_waits_for_dependencies():
+    order = []
+
+    async def slow(_):
+        await asyncio.sleep(0.01)
+        order.append("slow")
+
+    async def dependent(_):
+        order.append("dependent")
+
+    stages = [Stage("dependent", dependent, depends_on=["slow"]), Stage("slow", slow)]
+
+    await run_stages(stages)
+
+    assert order == ["slow", "dependent"]
+
+
+@pytest.mark.asyncio
+async def test_run_stages_error_cancels_running_and_skips_dependents():
+    cancelled = asyncio.Event()
+    calls = []
+
+    async def fail(_):
+        raise ServiceError("failed")
+
+    async def never_ending(_):
+        try:
+            await asyncio.sleep(10)
+        except asyncio.CancelledError:
+            cancelled.set()
+            raise
+
+    stages = [
+        Stage("fail", fail),
+        Stage("never_ending", never_ending),
+        Stage("dependent", returning(None, calls), depends_on=["fail"]),
+    ]
+
+    with pytest.raises(ServiceError) as e:
+        await run_stages(stages)
+
+    assert e.value.error_msg == "failed"
+    assert cancelled.is_set()
+    assert calls == []
+
+
+@pytest.mark.parametrize(
+    "stages",
+    [
+        [Stage("a", returning(1)), Stage("a", returning(2))],
+        [Stage("a", returning(1), depends_on=["missing"])],
+        [
+            Stage("a", returning(1), depends_on=["b"]),
+            Stage("b", returning(2), depends_on=["a"]),
+        ],
+    ],
+)
+@pytest.mark.asyncio
+async def test_run_stages_invalid_graph(stages):
+    with pytest.raises(ValueError):
+        await run_stages(stages)
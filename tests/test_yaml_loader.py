@@ -0,0 +1,63 @@
+import importlib
+from pathlib import Path
+
+import pytest
+import yaml
+
+from src.utility import yaml_loader
+from src.utility.yaml_loader import load_yaml
+
+EDGE_CASES = """
+timestamp: 2024-05-07T10:15:30.5+02:00
+date: 2024-05-07
+naive_timestamp: 2024-05-07 10:15:30
+base: &base
+  name: base
+  tags: [a, b]
+derived:
+  <<: *base
+  name: derived
+alias: *base
+octal: 0o17
+sexagesimal: 1:30
+boolean: yes
+null_value: ~
+binary: !!binary aGVsbG8=
+unicode: "caff\\u00e8"
+multiline: |
+  first line
+  second line
+"""
+
+
+@pytest.mark.parametrize(
+    "document",
+    [EDGE_CASES]
+    + [path.read_text() for path in sorted(Path("tests/descriptors").glob("*.yaml"))],
+)
+def test_load_yaml_parity(document):
+    assert load_yaml(document) == yaml.load(document, Loader=yaml.SafeLoader)
+
+
+def test_load_yaml_anchors_shared():
+    loaded = load_yaml(EDGE_CASES)
+
+    assert loaded["alias"] is loaded["base"]
+    assert loaded["derived"] == {"name": "derived", "tags": ["a", "b"]}
+
+
+def test_load_yaml_rejects_unsafe_tags():
+    with pytest.raises(yaml.YAMLError):
+        load_yaml("!!python/object/apply:os.system ['true']")
+
+
+def test_load_yaml_without_libyaml(monkeypatch):
+    monkeypatch.delattr(yaml, "CSafeLoader", raising=False)
+    try:
+        reloaded = importlib.reload(yaml_loader)
+
+        assert reloaded.SafeLoader is yaml.SafeLoader
+        assert reloaded.load_yaml(EDGE_CASES) == yaml.safe_load(EDGE_CASES)
+    finally:
+        monkeypatch.undo()
+        importlib.reload(yaml_loader)